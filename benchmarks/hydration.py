@@ -0,0 +1,88 @@
+"""
+Compare `RediSearchResult.to_queryset()` (SQL `CASE` ordering)
+with `RediSearchResult.hydrate()` (`in_bulk()` and ordering in Python).
+
+Usage (from the repository root):
+
+    python -m benchmarks.hydration
+"""
+import random
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django.contrib.contenttypes", "redis_search_django", "tests"],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    REDIS_SEARCH_AUTO_INDEX=False,
+    DEBUG=True,
+)
+django.setup()
+
+from django.db import connection, reset_queries  # noqa: E402
+
+from redis_search_django.query import RediSearchResult  # noqa: E402
+from tests.models import Category  # noqa: E402
+
+HIT_COUNTS = [10, 100, 500, 1000]
+REPEAT = 20
+
+
+def measure(fetch: Callable[[], List[Any]]) -> Dict[str, float]:
+    """Returns the average time and SQL size of the fetch function"""
+    reset_queries()
+    fetch()
+    queries = [query["sql"] for query in connection.queries]
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fetch()
+    elapsed = (time.perf_counter() - start) / REPEAT
+
+    with connection.cursor() as cursor:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            for sql in queries:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        planning = (time.perf_counter() - start) / REPEAT
+
+    return {
+        "sql_size": sum(len(sql) for sql in queries),
+        "planning_ms": planning * 1000,
+        "total_ms": elapsed * 1000,
+    }
+
+
+def main() -> None:
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Category)
+
+    Category.objects.bulk_create(
+        [Category(name=f"Category {i}") for i in range(max(HIT_COUNTS))]
+    )
+    all_pks = list(Category.objects.values_list("pk", flat=True))
+
+    print(f"{'hits':>6} {'mode':>12} {'sql size':>10} {'plan ms':>9} {'total ms':>9}")
+
+    for hit_count in HIT_COUNTS:
+        pks = random.sample(all_pks, hit_count)
+        result = RediSearchResult(
+            [SimpleNamespace(pk=str(pk)) for pk in pks], hit_count, Category
+        )
+
+        for mode, fetch in [
+            ("to_queryset", lambda result=result: list(result.to_queryset())),
+            ("hydrate", lambda result=result: list(result.hydrate())),
+        ]:
+            stats = measure(fetch)
+            print(
+                f"{hit_count:>6} {mode:>12} {stats['sql_size']:>10} "
+                f"{stats['planning_ms']:>9.3f} {stats['total_ms']:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare parsing all hits of a `FT.SEARCH` reply (previous behaviour)
+with `RediSearchResult` parsing hits on first access, when only the
+first rows of the results are rendered.
+
+Redis is not required, the connection of the document is mocked.
+
+Usage (from the repository root):
+
+    python -m benchmarks.lazy_results
+"""
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django.contrib.contenttypes", "redis_search_django", "tests"],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    REDIS_SEARCH_AUTO_INDEX=False,
+)
+django.setup()
+
+from redis_search_django.documents import JsonDocument  # noqa: E402
+from redis_search_django.query import RediSearchResult  # noqa: E402
+from tests.models import Product  # noqa: E402
+
+HIT_COUNTS = [10, 100, 1000, 5000]
+RENDERED = 10
+REPEAT = 20
+
+
+class ProductDocument(JsonDocument):
+    class Django:
+        model = Product
+        fields = ["name", "description", "price", "created_at"]
+
+
+def get_raw_result(hit_count: int) -> List[Any]:
+    raw_result: List[Any] = [hit_count]
+
+    for pk in range(hit_count):
+        document = {
+            "pk": str(pk),
+            "name": f"Product {pk}",
+            "description": "Some description " * 10,
+            "price": pk * 1.5,
+            "created_at": "2022-01-01T00:00:00",
+        }
+        raw_result += [f"product:{pk}", ["$", json.dumps(document)]]
+
+    return raw_result
+
+
+def measure(render: Callable[[], Any]) -> Dict[str, float]:
+    """Returns the average time and the peak memory of the render function"""
+    tracemalloc.start()
+    render()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        render()
+    elapsed = (time.perf_counter() - start) / REPEAT
+
+    return {"total_ms": elapsed * 1000, "peak_kb": peak / 1024}
+
+
+def main() -> None:
+    with mock.patch.object(ProductDocument, "db"):
+        query = ProductDocument.find()
+
+        def eager(raw_result: List[Any]) -> List[Any]:
+            result = RediSearchResult(query.from_redis(raw_result), raw_result[0], None)
+            return list(result[:RENDERED])
+
+        def lazy(raw_result: List[Any]) -> List[Any]:
+            result = RediSearchResult([], raw_result[0], None)
+            result.add_raw(raw_result, query.parse_hit)
+            return list(result[:RENDERED])
+
+        print(f"{'hits':>6} {'mode':>6} {'total ms':>9} {'peak KB':>9}")
+
+        for hit_count in HIT_COUNTS:
+            raw_result = get_raw_result(hit_count)
+
+            for mode, render in [("eager", eager), ("lazy", lazy)]:
+                stats = measure(lambda r=render, raw=raw_result: r(raw))
+                print(
+                    f"{hit_count:>6} {mode:>6} "
+                    f"{stats['total_ms']:>9.3f} {stats['peak_kb']:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
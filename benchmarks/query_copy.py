@@ -0,0 +1,82 @@
+"""
+Compare `RediSearchQuery.copy()` (shallow clone) with re-creating
+the query from `RediSearchQuery.dict()` (previous implementation).
+
+Redis is not required, the connection of the document is mocked.
+
+Usage (from the repository root):
+
+    python -m benchmarks.query_copy
+"""
+import time
+from typing import Any, Callable
+from unittest import mock
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django.contrib.contenttypes", "redis_search_django", "tests"],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    REDIS_SEARCH_AUTO_INDEX=False,
+)
+django.setup()
+
+from redis_search_django.documents import JsonDocument  # noqa: E402
+from redis_search_django.query import RediSearchQuery  # noqa: E402
+from tests.models import Product  # noqa: E402
+
+REPEAT = 10000
+
+
+class ProductDocument(JsonDocument):
+    class Django:
+        model = Product
+        fields = ["name", "description", "price", "created_at"]
+
+
+def measure(copy: Callable[[], Any]) -> float:
+    """Returns the average time of the copy function in microseconds"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        copy()
+    return (time.perf_counter() - start) / REPEAT * 1_000_000
+
+
+def reinit_copy(query: RediSearchQuery, **kwargs: Any) -> RediSearchQuery:
+    """Previous implementation of `copy()`"""
+    new_query = query.__class__(**{**query.dict(), **kwargs})
+    # Resolve the query and pagination, as `execute()` does
+    new_query.get_search_args()
+    return new_query
+
+
+def shallow_copy(query: RediSearchQuery, **kwargs: Any) -> RediSearchQuery:
+    new_query = query.copy(**kwargs)
+    new_query.get_search_args()
+    return new_query
+
+
+def main() -> None:
+    with mock.patch.object(ProductDocument, "db"):
+        query = ProductDocument.find(
+            (ProductDocument.price >= 10)
+            & (ProductDocument.price < 100)
+            & (ProductDocument.name % "shoes")
+        ).sort_by("-price")
+        query.get_search_args()
+
+        print(f"{'case':>12} {'reinit us':>10} {'copy us':>10}")
+
+        for case, kwargs in [
+            ("page", {"offset": 100, "limit": 10}),
+            ("all", {"page_size": 1000, "limit": 1000}),
+            ("sort_by", {"sort_fields": ["price"]}),
+        ]:
+            reinit = measure(lambda kwargs=kwargs: reinit_copy(query, **kwargs))
+            shallow = measure(lambda kwargs=kwargs: shallow_copy(query, **kwargs))
+            print(f"{case:>12} {reinit:>10.2f} {shallow:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare building dictionaries from documents (`document.dict()`)
+with `RediSearchQuery.values()`, which decodes the reply directly.
+
+Redis is not required, the connection of the document is mocked.
+
+Usage (from the repository root):
+
+    python -m benchmarks.values
+"""
+import json
+import time
+from typing import Any, Callable, List
+from unittest import mock
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django.contrib.contenttypes", "redis_search_django", "tests"],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    REDIS_SEARCH_AUTO_INDEX=False,
+)
+django.setup()
+
+from redis_search_django.documents import JsonDocument  # noqa: E402
+from tests.models import Product  # noqa: E402
+
+HIT_COUNTS = [100, 1000, 5000]
+REPEAT = 10
+
+
+class ProductDocument(JsonDocument):
+    class Django:
+        model = Product
+        fields = ["name", "description", "price", "created_at"]
+
+
+def get_raw_result(hit_count: int) -> List[Any]:
+    raw_result: List[Any] = [hit_count]
+
+    for pk in range(hit_count):
+        document = {
+            "pk": str(pk),
+            "name": f"Product {pk}",
+            "description": "Some description " * 10,
+            "price": pk * 1.5,
+            "created_at": "2022-01-01T00:00:00",
+        }
+        raw_result += [f"product:{pk}", ["$", json.dumps(document)]]
+
+    return raw_result
+
+
+def measure(fetch: Callable[[], List[Any]]) -> float:
+    """Returns the average time of the fetch function in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fetch()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main() -> None:
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = ProductDocument.find()
+        values_query = query.values()
+
+        def documents() -> List[Any]:
+            return [document.dict() for document in query.copy().execute(False)]
+
+        def values() -> List[Any]:
+            return list(values_query.copy().execute(False))
+
+        print(f"{'hits':>6} {'documents ms':>13} {'values ms':>10} {'speedup':>8}")
+
+        for hit_count in HIT_COUNTS:
+            db().execute_command.return_value = get_raw_result(hit_count)
+            documents_ms = measure(documents)
+            values_ms = measure(values)
+            print(
+                f"{hit_count:>6} {documents_ms:>13.2f} {values_ms:>10.2f} "
+                f"{documents_ms / values_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
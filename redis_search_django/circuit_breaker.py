@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Set, Type
+
+from django.db import models
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when an index operation is skipped by an open circuit breaker"""
+
+
+class CircuitBreaker:
+    """
+    Fail-open circuit breaker for synchronous index operations.
+
+    The circuit opens after `failure_threshold` consecutive failed or slow calls.
+    While the circuit is open, index operations are skipped and primary keys
+    of the affected model instances are recorded to be reconciled later.
+    After `reset_timeout` seconds a trial call is allowed (half open),
+    if it succeeds the circuit is closed again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        slow_call_threshold: float = 1.0,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.dirty: Dict[Type[models.Model], Set[Any]] = defaultdict(set)
+
+        # Counters exposed as metrics
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.skipped_calls = 0
+        self.times_opened = 0
+
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Returns True if an index operation can be run"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                self.state = self.HALF_OPEN
+
+            # Only allow a single trial call while the circuit is half open
+            if self.state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+
+            self.skipped_calls += 1
+            return False
+
+    def record_success(self, duration: float) -> bool:
+        """
+        Record a finished call, slow calls are recorded as failures.
+
+        Returns True if the call closed the circuit.
+        """
+        if duration >= self.slow_call_threshold:
+            with self._lock:
+                self.slow_calls += 1
+            self.record_failure()
+            return False
+
+        with self._lock:
+            self.calls += 1
+            self.consecutive_failures = 0
+            self._trial_in_progress = False
+
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                return True
+            return False
+
+    def record_failure(self) -> None:
+        """Record a failed call and open the circuit if required"""
+        with self._lock:
+            self.calls += 1
+            self.failures += 1
+            self.consecutive_failures += 1
+            self._trial_in_progress = False
+
+            if (
+                self.state == self.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Record a call that neither succeeded nor failed (e.g: a validation error)"""
+        with self._lock:
+            self._trial_in_progress = False
+
+    def mark_dirty(self, model: Type[models.Model], pks: Iterable[Any]) -> None:
+        """Record primary keys of model instances that need to be indexed"""
+        with self._lock:
+            self.dirty[model].update(pks)
+
+    def pop_dirty(self) -> Dict[Type[models.Model], Set[Any]]:
+        """Get and reset the recorded primary keys"""
+        with self._lock:
+            dirty, self.dirty = self.dirty, defaultdict(set)
+        return dirty
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current state and counters of the circuit breaker"""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "calls": self.calls,
+                "failures": self.failures,
+                "slow_calls": self.slow_calls,
+                "skipped_calls": self.skipped_calls,
+                "times_opened": self.times_opened,
+                "dirty": sum(len(pks) for pks in self.dirty.values()),
+            }
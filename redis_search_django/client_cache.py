@@ -0,0 +1,253 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Set, Union
+
+from django.conf import settings
+from redis import Redis, RedisError
+
+logger = logging.getLogger(__name__)
+
+# Channel of the invalidation messages of RESP2 connections
+INVALIDATION_CHANNEL = "__redis__:invalidate"
+
+
+def get_tracking_args(client_id: int, prefixes: Set[str]) -> List[Any]:
+    """Returns the `CLIENT TRACKING` command arguments of the prefixes"""
+    args: List[Any] = ["CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST"]
+
+    for prefix in sorted(prefixes):
+        args += ["PREFIX", prefix]
+
+    return args
+
+
+class ClientSideCache:
+    """
+    Bounded in-process LRU cache of documents using
+    Redis server-assisted client side caching.
+
+    A dedicated connection enables `CLIENT TRACKING` in broadcasting mode
+    for the key prefixes of the cached documents (redirected to itself)
+    and subscribes to the invalidation messages, cached documents are
+    removed as soon as their keys are changed on the server.
+    If the connection is lost or reconnects, the whole cache is flushed
+    (and tracking is enabled again on reconnection).
+    """
+
+    def __init__(self, max_size: int = 10000, sleep_time: float = 1.0) -> None:
+        self.max_size = max_size
+        self.sleep_time = sleep_time
+
+        # Counters exposed as metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.flushes = 0
+
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        # Keys that are being fetched, an invalidation received
+        # during the fetch prevents storing the (stale) reply.
+        self._pending: Dict[str, object] = {}
+        self._prefixes: Set[str] = set()
+        self._thread: Any = None
+        self._lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def is_connected(self) -> bool:
+        """Returns True if invalidation messages are being received"""
+        return self._thread is not None
+
+    def get(
+        self, db: "Redis[Any]", prefix: str, key: str, fetch: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached reply of the key or fetches it using `fetch()`.
+
+        `prefix` is the key prefix tracked for invalidation, the cache
+        is bypassed if tracking can not be enabled.
+        """
+        if not self.track(db, prefix):
+            return fetch()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            self.misses += 1
+            token = object()
+            self._pending[key] = token
+
+        try:
+            value = fetch()
+        except BaseException:
+            with self._lock:
+                if self._pending.get(key) is token:
+                    del self._pending[key]
+            raise
+
+        with self._lock:
+            if self._pending.get(key) is token:
+                del self._pending[key]
+                self._entries[key] = value
+
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def track(self, db: "Redis[Any]", prefix: str) -> bool:
+        """
+        Makes sure keys of the prefix are tracked.
+
+        Tracking is restarted to add a new prefix (and the cache is flushed).
+        Returns False if tracking could not be enabled.
+        """
+        if self.is_connected and prefix in self._prefixes:
+            return True
+
+        with self._connect_lock:
+            if self.is_connected and prefix in self._prefixes:
+                return True
+
+            self.disconnect()
+
+            try:
+                self.connect(db, self._prefixes | {prefix})
+            except RedisError:
+                logger.exception("Failed to enable client side caching")
+                return False
+
+        return True
+
+    def connect(self, db: "Redis[Any]", prefixes: Set[str]) -> None:
+        """Enables tracking of the prefixes and listens to invalidation messages"""
+        pubsub = db.pubsub()
+
+        try:
+            pubsub.execute_command("CLIENT", "ID")
+            client_id = pubsub.parse_response()
+
+            # RESP2 connections receive the invalidation messages
+            # on the channel, so the connection redirects to itself.
+            pubsub.execute_command(*get_tracking_args(client_id, prefixes))
+            pubsub.parse_response()
+
+            # Tracking is disabled when the connection reconnects,
+            # it is enabled again before the channel is re-subscribed.
+            connection = pubsub.connection
+            connection.clear_connect_callbacks()
+            connection.register_connect_callback(self.handle_connect)
+            connection.register_connect_callback(pubsub.on_connect)
+
+            pubsub.subscribe(**{INVALIDATION_CHANNEL: self.handle_message})
+        except BaseException:
+            pubsub.close()
+            raise
+
+        self.flush()
+        self._prefixes = set(prefixes)
+        self._thread = pubsub.run_in_thread(
+            sleep_time=self.sleep_time,
+            daemon=True,
+            exception_handler=self.handle_error,
+        )
+
+    def handle_connect(self, connection: Any) -> None:
+        """
+        Enables tracking again when the invalidation connection reconnects.
+
+        Invalidation messages may have been missed while disconnected,
+        so the cache is flushed.
+        """
+        connection.send_command("CLIENT", "ID")
+        client_id = connection.read_response()
+        connection.send_command(*get_tracking_args(client_id, self._prefixes))
+        connection.read_response()
+        self.flush()
+
+    def disconnect(self) -> None:
+        """Stops listening to invalidation messages and flushes the cache"""
+        thread, self._thread = self._thread, None
+
+        if thread is not None:
+            thread.stop()
+
+        self.flush()
+
+    def handle_message(self, message: Dict[str, Any]) -> None:
+        """Removes the invalidated keys (or all keys) from the cache"""
+        keys: Union[List[Any], None] = message["data"]
+
+        if keys is None:
+            self.flush()
+            return
+
+        with self._lock:
+            for key in keys:
+                if isinstance(key, bytes):
+                    key = key.decode("utf-8")
+
+                self._pending.pop(key, None)
+
+                if key in self._entries:
+                    del self._entries[key]
+                    self.invalidations += 1
+
+    def handle_error(self, error: BaseException, pubsub: Any, thread: Any) -> None:
+        """Stops caching when the invalidation connection fails"""
+        logger.warning("Client side caching connection failed: %s", error)
+        thread.stop()
+
+        if self._thread is thread:
+            self._thread = None
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Removes all cached replies"""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+            self.flushes += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current size and counters of the cache"""
+        with self._lock:
+            return {
+                "connected": self.is_connected,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "flushes": self.flushes,
+            }
+
+
+_client_side_cache: Union[ClientSideCache, None] = None
+_client_side_cache_lock = threading.Lock()
+
+
+def get_client_side_cache() -> Union[ClientSideCache, None]:
+    """Client side cache configured by `REDIS_SEARCH_CLIENT_SIDE_CACHE` setting."""
+    global _client_side_cache
+
+    config = getattr(settings, "REDIS_SEARCH_CLIENT_SIDE_CACHE", None)
+
+    if not config:
+        return None
+
+    if _client_side_cache is None:
+        with _client_side_cache_lock:
+            if _client_side_cache is None:
+                _client_side_cache = ClientSideCache(
+                    **(config if isinstance(config, dict) else {})
+                )
+    return _client_side_cache
@@ -0,0 +1,255 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, NamedTuple, Tuple, Union
+
+from django.conf import settings
+from pydantic.fields import ModelField
+from redis_om.model.model import (
+    SINGLE_VALUE_TAG_FIELD_SEPARATOR,
+    Expression,
+    ExpressionOrNegated,
+    FindQuery,
+    NegatedExpression,
+    Operators,
+    RediSearchFieldTypes,
+)
+
+# Templates of the numeric operators, `{0}` is the field name
+# and `{1}` is the parameter name.
+NUMERIC_TEMPLATES = {
+    Operators.EQ: "@{0}:[{1} {1}]",
+    Operators.NE: "-(@{0}:[{1} {1}])",
+    Operators.GT: "@{0}:[({1} +inf]",
+    Operators.LT: "@{0}:[-inf ({1}]",
+    Operators.GE: "@{0}:[{1} +inf]",
+    Operators.LE: "@{0}:[-inf {1}]",
+}
+
+# Templates of the tag operators, `{0}` is the field name
+# and `{1}` is the parameter name (or parameter names separated by `|`).
+TAG_TEMPLATES = {
+    Operators.EQ: "@{0}:{{{1}}}",
+    Operators.NE: "-(@{0}:{{{1}}})",
+    Operators.IN: "(@{0}:{{{1}}})",
+    Operators.NOT_IN: "-(@{0}:{{{1}}})",
+}
+
+
+class CompiledQuery(NamedTuple):
+    """RediSearch query template and the values of its parameters"""
+
+    query: str
+    params: Dict[str, str]
+
+
+class QueryTemplateCache:
+    """Thread safe LRU cache of query templates by expression structure"""
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self.maxsize = maxsize
+        self._templates: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, signature: Hashable) -> Union[str, None]:
+        """Returns the cached template of the expression structure"""
+        with self._lock:
+            template = self._templates.get(signature)
+
+            if template is not None:
+                self._templates.move_to_end(signature)
+
+            return template
+
+    def set(self, signature: Hashable, template: str) -> None:
+        """Caches the template of the expression structure"""
+        with self._lock:
+            self._templates[signature] = template
+            self._templates.move_to_end(signature)
+
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached templates"""
+        with self._lock:
+            self._templates.clear()
+
+
+query_template_cache = QueryTemplateCache()
+
+
+def use_query_params() -> bool:
+    """Returns True if query values should be bound using `PARAMS`"""
+    return getattr(settings, "REDIS_SEARCH_QUERY_PARAMS", False)
+
+
+def compile_query(expression: ExpressionOrNegated) -> CompiledQuery:
+    """
+    Compiles an expression to a RediSearch query template and its parameters.
+
+    Numeric and tag values are bound as `PARAMS` (requires `DIALECT 2`),
+    full text search values are kept inline. Templates are cached by
+    the structure of the expression, so expressions that only differ
+    by their values are only resolved once.
+    """
+    values: List[str] = []
+    signature = get_signature(expression, values)
+    template = query_template_cache.get(signature)
+
+    if template is None:
+        template = resolve_template(expression, iter(range(len(values))))
+        query_template_cache.set(signature, template)
+
+    return CompiledQuery(
+        query=template,
+        params={f"p{index}": value for index, value in enumerate(values)},
+    )
+
+
+def get_params_args(params: Dict[str, str], dialect: bool = True) -> List[Any]:
+    """Returns the `PARAMS` (and `DIALECT`) command arguments"""
+    if not params:
+        return []
+
+    args: List[Any] = ["PARAMS", len(params) * 2]
+
+    for name, value in params.items():
+        args += [name, value]
+
+    if dialect:
+        args += ["DIALECT", 2]
+
+    return args
+
+
+def get_bound_values(
+    expression: Expression,
+) -> Union[Tuple[RediSearchFieldTypes, List[str]], None]:
+    """
+    Returns the field type and the values of the expression that
+    can be bound as parameters, or `None` if it needs to be resolved inline.
+    """
+    left, op, right = expression.left, expression.op, expression.right
+
+    if not isinstance(left, ModelField) or isinstance(
+        right, (Expression, NegatedExpression, ModelField)
+    ):
+        return None
+
+    field_info = left.field_info
+
+    # Let redis-om raise the error for fields that are not indexed
+    if not field_info or not getattr(field_info, "index", None):
+        return None
+
+    field_type = FindQuery.resolve_field_type(left, op)
+
+    if field_type is RediSearchFieldTypes.NUMERIC and op in NUMERIC_TEMPLATES:
+        if isinstance(right, (list, tuple, set)):
+            return None
+        return field_type, [str(int(right) if isinstance(right, bool) else right)]
+
+    if field_type is RediSearchFieldTypes.TAG and op in TAG_TEMPLATES:
+        values = [right] if op in (Operators.EQ, Operators.NE) else right
+        separator = getattr(field_info, "separator", SINGLE_VALUE_TAG_FIELD_SEPARATOR)
+
+        if (
+            isinstance(values, (list, tuple))
+            and values
+            and all(isinstance(value, str) and value for value in values)
+            # redis-om splits tag values that contain the separator
+            and not (op is Operators.EQ and separator in right)
+        ):
+            return field_type, list(values)
+
+    return None
+
+
+def get_field_name(expression: Expression) -> str:
+    """Returns the indexed field name of the expression"""
+    if expression.parents:
+        prefix = "_".join([parent[0] for parent in expression.parents])
+        return f"{prefix}_{expression.left.name}"
+    return expression.left.name
+
+
+def is_combination(expression: Expression) -> bool:
+    """Returns True if the expression combines two expressions"""
+    return (
+        expression.op in (Operators.AND, Operators.OR)
+        and isinstance(expression.left, (Expression, NegatedExpression))
+        and isinstance(expression.right, (Expression, NegatedExpression))
+    )
+
+
+def get_signature(expression: ExpressionOrNegated, values: List[str]) -> Hashable:
+    """
+    Returns the structure of the expression and
+    adds the values that can be bound as parameters to `values`.
+    """
+    negated = isinstance(expression, NegatedExpression)
+    inner = expression.expression if negated else expression
+    bound_values = get_bound_values(inner)
+
+    if bound_values is not None:
+        field_type, leaf_values = bound_values
+        values += leaf_values
+        return (
+            negated,
+            get_field_name(inner),
+            inner.op,
+            field_type,
+            len(leaf_values),
+        )
+
+    if is_combination(inner):
+        return (
+            negated,
+            inner.op,
+            get_signature(inner.left, values),
+            get_signature(inner.right, values),
+        )
+
+    # The resolved query is used as the signature of inline expressions
+    return FindQuery.resolve_redisearch_query(expression)
+
+
+def resolve_template(expression: ExpressionOrNegated, counter: Iterator[int]) -> str:
+    """
+    Resolves the query template of the expression.
+
+    This follows `FindQuery.resolve_redisearch_query()`
+    but uses parameter names instead of the bound values.
+    """
+    negated = isinstance(expression, NegatedExpression)
+    inner = expression.expression if negated else expression
+    bound_values = get_bound_values(inner)
+
+    if bound_values is not None:
+        field_type, leaf_values = bound_values
+        names = [f"$p{next(counter)}" for _ in leaf_values]
+        templates = (
+            NUMERIC_TEMPLATES
+            if field_type is RediSearchFieldTypes.NUMERIC
+            else TAG_TEMPLATES
+        )
+        result = templates[inner.op].format(get_field_name(inner), " | ".join(names))
+    elif is_combination(inner):
+        result = f"({resolve_template(inner.left, counter)})"
+        result += " " if inner.op is Operators.AND else "| "
+
+        right = inner.right
+
+        if isinstance(right, NegatedExpression):
+            # The inner expression is negated with "-" (same as redis-om)
+            result += "-"
+            right = right.expression
+
+        result += f"({resolve_template(right, counter)})"
+    else:
+        return FindQuery.resolve_redisearch_query(expression)
+
+    return f"-({result})" if negated else result
@@ -0,0 +1,45 @@
+import asyncio
+import os
+import weakref
+from typing import Any
+
+from django.conf import settings
+from redis import asyncio as aioredis
+
+# Async Redis clients by event loop, as the connections
+# of a connection pool can not be shared between event loops.
+_async_connections: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_redis_url() -> str:
+    """Returns the Redis URL used by the async Redis client"""
+    return (
+        getattr(settings, "REDIS_SEARCH_ASYNC_REDIS_URL", None)
+        or os.environ.get("REDIS_OM_URL")
+        or "redis://localhost:6379"
+    )
+
+
+def get_async_redis_connection() -> "aioredis.Redis[str]":
+    """
+    Returns the async Redis client of the running event loop.
+
+    The client has its own connection pool, separate from
+    the connection used by the synchronous API.
+    """
+    loop = asyncio.get_running_loop()
+    connection = _async_connections.get(loop)
+
+    if connection is None:
+        connection = aioredis.Redis.from_url(
+            get_async_redis_url(),
+            decode_responses=True,
+            max_connections=getattr(
+                settings, "REDIS_SEARCH_ASYNC_MAX_CONNECTIONS", None
+            ),
+        )
+        _async_connections[loop] = connection
+
+    return connection
@@ -0,0 +1,236 @@
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple, Type, Union
+
+import redis
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from redis_om import get_redis_connection
+
+from .registry import document_registry
+
+logger = logging.getLogger(__name__)
+
+
+class DeadLetterQueue:
+    """
+    Queue of failed index operations stored in Redis.
+
+    Entries are retried with exponential backoff, entries that fail
+    more than `REDIS_SEARCH_DEAD_LETTER_MAX_RETRIES` times are moved
+    to the dead letters and can be replayed later.
+    """
+
+    def __init__(
+        self, key_prefix: str = "redis_search:dead_letter", max_backoff: int = 3600
+    ) -> None:
+        # Sorted Set of entries scored by their next retry timestamp
+        self.retry_key = f"{key_prefix}:retry"
+        # Sorted Set of entries that exceeded the max retries
+        self.dead_key = f"{key_prefix}:dead"
+        # Hash of entry details
+        self.entries_key = f"{key_prefix}:entries"
+        self.max_backoff = max_backoff
+        self._db: Union["redis.Redis[str]", None] = None
+
+    @property
+    def max_retries(self) -> int:
+        """Number of retries before an entry is moved to the dead letters"""
+        return getattr(settings, "REDIS_SEARCH_DEAD_LETTER_MAX_RETRIES", 5)
+
+    @property
+    def backoff(self) -> float:
+        """Seconds to wait before the first retry"""
+        return getattr(settings, "REDIS_SEARCH_DEAD_LETTER_BACKOFF", 10)
+
+    def db(self) -> "redis.Redis[str]":
+        """Get Redis connection"""
+        if self._db is None:
+            self._db = get_redis_connection()
+        return self._db
+
+    def get_backoff(self, attempts: int) -> float:
+        """Seconds to wait before the next retry"""
+        return min(self.backoff * 2**attempts, self.max_backoff)
+
+    def push(
+        self, model: Type[models.Model], pks: Iterable[Any], error: Exception
+    ) -> bool:
+        """
+        Add failed model instance primary keys to the queue.
+
+        Returns False if the entries could not be added.
+        """
+        now = time.time()
+        entries = [
+            {
+                "model": model._meta.label,
+                "pk": str(pk),
+                "error": format_error(error),
+                "attempts": 0,
+                "failed_at": now,
+            }
+            for pk in pks
+        ]
+
+        if not entries:
+            return True
+
+        try:
+            self._save(entries, self.retry_key, now + self.get_backoff(0))
+        except redis.RedisError:
+            # Indexing failures must not break the request,
+            # so the entries are only logged if Redis is not available.
+            logger.exception("Failed to add entries to the dead letter queue")
+            return False
+
+        return True
+
+    def retry(self, batch_size: int = 100) -> Tuple[int, int]:
+        """
+        Retry the entries that are due.
+
+        Returns the number of succeeded and failed entries.
+        """
+        db = self.db()
+        now = time.time()
+        members = db.zrangebyscore(self.retry_key, "-inf", now, start=0, num=batch_size)
+
+        if not members:
+            return 0, 0
+
+        grouped_entries: Dict[Type[models.Model], List[Dict[str, Any]]]
+        grouped_entries = defaultdict(list)
+        succeeded, failed = [], []
+
+        for member, entry in zip(members, self._load(members)):
+            if entry is None:
+                succeeded.append(member)
+                continue
+
+            try:
+                django_model = apps.get_model(entry["model"])
+            except LookupError:
+                # The model does not exist anymore, drop the entry
+                succeeded.append(member)
+                continue
+
+            grouped_entries[django_model].append(entry)
+
+        for django_model, entries in grouped_entries.items():
+            try:
+                document_registry.index_dirty(
+                    {django_model: {entry["pk"] for entry in entries}}
+                )
+                succeeded.extend(entries_to_members(entries))
+            except Exception:
+                # Retry the entries one by one to find the failing ones
+                for entry in entries:
+                    try:
+                        document_registry.index_dirty({django_model: {entry["pk"]}})
+                        succeeded.extend(entries_to_members([entry]))
+                    except Exception as error:
+                        failed.append(entry)
+                        entry["error"] = format_error(error)
+
+        self._remove(succeeded)
+        self._fail(failed)
+
+        return len(succeeded), len(failed)
+
+    def replay(self) -> int:
+        """Move all dead letters to the retry queue, returns the number of entries"""
+        members = self.db().zrange(self.dead_key, 0, -1)
+        entries = [entry for entry in self._load(members) if entry is not None]
+
+        for entry in entries:
+            entry["attempts"] = 0
+
+        pipeline = self.db().pipeline()
+
+        if members:
+            pipeline.zrem(self.dead_key, *members)
+
+        self._save(entries, self.retry_key, time.time(), pipeline=pipeline)
+        pipeline.execute()
+
+        return len(entries)
+
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        """Get all entries that exceeded the max retries"""
+        members = self.db().zrange(self.dead_key, 0, -1)
+        return [entry for entry in self._load(members) if entry is not None]
+
+    def _load(self, members: List[str]) -> List[Union[Dict[str, Any], None]]:
+        """Load entry details of the members"""
+        if not members:
+            return []
+        return [
+            json.loads(value) if value else None
+            for value in self.db().hmget(self.entries_key, members)
+        ]
+
+    def _save(
+        self,
+        entries: List[Dict[str, Any]],
+        key: str,
+        score: float,
+        pipeline: Union["redis.client.Pipeline[str]", None] = None,
+    ) -> None:
+        """Save entry details and add the entries to a queue"""
+        db = pipeline if pipeline is not None else self.db().pipeline()
+
+        for member, entry in zip(entries_to_members(entries), entries):
+            db.hset(self.entries_key, member, json.dumps(entry))
+            db.zadd(key, {member: score})
+
+        if pipeline is None:
+            db.execute()
+
+    def _remove(self, members: List[str]) -> None:
+        """Remove entries from the queue"""
+        if not members:
+            return
+
+        pipeline = self.db().pipeline()
+        pipeline.zrem(self.retry_key, *members)
+        pipeline.hdel(self.entries_key, *members)
+        pipeline.execute()
+
+    def _fail(self, entries: List[Dict[str, Any]]) -> None:
+        """Reschedule failed entries or move them to the dead letters"""
+        now = time.time()
+        pipeline = self.db().pipeline()
+
+        for entry in entries:
+            entry["attempts"] += 1
+            entry["failed_at"] = now
+
+            if entry["attempts"] >= self.max_retries:
+                pipeline.zrem(self.retry_key, *entries_to_members([entry]))
+                self._save([entry], self.dead_key, now, pipeline=pipeline)
+            else:
+                self._save(
+                    [entry],
+                    self.retry_key,
+                    now + self.get_backoff(entry["attempts"]),
+                    pipeline=pipeline,
+                )
+
+        pipeline.execute()
+
+
+def entries_to_members(entries: Iterable[Dict[str, Any]]) -> List[str]:
+    """Get the queue members of the entries"""
+    return [f"{entry['model']}:{entry['pk']}" for entry in entries]
+
+
+def format_error(error: Exception) -> str:
+    """Format an error to be stored with an entry"""
+    return f"{error.__class__.__name__}: {error}"
+
+
+dead_letter_queue: DeadLetterQueue = DeadLetterQueue()
@@ -1,12 +1,15 @@
+import json
 import operator
 from abc import ABC
 from dataclasses import dataclass
 from functools import reduce
-from typing import Any, Dict, List, Type, Union
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Type, Union
 
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db import models
 from pydantic.fields import ModelField
+from redis import asyncio as aioredis
 from redis.commands.search.aggregation import AggregateRequest
 from redis_om import Field, HashModel, JsonModel
 from redis_om.model.model import (
@@ -16,9 +19,27 @@ from redis_om.model.model import (
     RedisModel,
 )
 
+from .client_cache import get_client_side_cache
+from .compiler import compile_query, get_params_args, use_query_params
 from .config import model_field_class_config
+from .connection import get_async_redis_connection
 from .query import RediSearchQuery
 from .registry import document_registry
+from .result_cache import aget_cached_reply, get_cached_reply
+
+
+class ParametrizedAggregateRequest(AggregateRequest):
+    """Aggregation request with the values of the query parameters"""
+
+    def __init__(
+        self, query: str = "*", params: Union[Dict[str, str], None] = None
+    ) -> None:
+        super().__init__(query)
+        self.params = params or {}
+
+        # Query parameters require dialect 2
+        if self.params:
+            self.dialect(2)  # type: ignore[attr-defined]
 
 
 @dataclass
@@ -68,33 +89,127 @@ class Document(RedisModel, ABC):
             expressions=expressions, django_model=cls._django.model, model=cls, **kwargs
         )
 
+    @classmethod
+    def get(cls, pk: Any) -> RedisModel:
+        """
+        Get a document by its primary key.
+
+        If `REDIS_SEARCH_CLIENT_SIDE_CACHE` is enabled, documents are served
+        from the client side cache until their keys are changed on the server.
+        """
+        client_side_cache = get_client_side_cache()
+
+        if client_side_cache is None:
+            return super().get(pk)
+
+        key = cls.make_primary_key(pk)
+        data = client_side_cache.get(
+            cls.db(),
+            cls.make_primary_key(""),
+            key,
+            lambda: cls.fetch_document_data(key),
+        )
+
+        if not data:
+            raise NotFoundError
+        return cls.parse_obj(data)
+
+    @classmethod
+    def fetch_document_data(cls, key: str) -> Any:
+        """Fetch the stored data of a document key"""
+        if issubclass(cls, JsonModel):
+            return cls.db().json().get(key)
+        return cls.db().hgetall(key)
+
     @classmethod
     def build_aggregate_request(
         cls, *expressions: Union[Any, Expression]
     ) -> AggregateRequest:
         """Build an aggregation request using the given expressions"""
-        search_query_expression = (
-            cls._query_class.resolve_redisearch_query(
-                reduce(operator.and_, expressions)
-            )
-            if expressions
-            else "*"
+        if not expressions:
+            return ParametrizedAggregateRequest("*")
+
+        expression = reduce(operator.and_, expressions)
+
+        if use_query_params():
+            return ParametrizedAggregateRequest(*compile_query(expression))
+
+        return ParametrizedAggregateRequest(
+            cls._query_class.resolve_redisearch_query(expression)
         )
-        return AggregateRequest(search_query_expression)
 
     @classmethod
     def aggregate(cls, aggregate_request: AggregateRequest) -> List[Dict[str, Any]]:
-        """Aggregate data and return a list of dictionaries containing the results"""
-        results = cls.db().ft(cls._meta.index_name).aggregate(aggregate_request)
+        """
+        Aggregate data and return a list of dictionaries containing the results
+
+        If the result cache is enabled, results are served from the cache
+        until a document of the index is written.
+        """
+        query_params = getattr(aggregate_request, "params", None) or None
+
+        def fetch() -> List[Dict[str, Any]]:
+            results = (
+                cls.db()
+                .ft(cls._meta.index_name)
+                .aggregate(aggregate_request, query_params=query_params)
+            )
+            return aggregate_rows_to_dicts(results.rows)
+
+        command = cls.get_aggregate_command(aggregate_request)
+
+        if command is None:
+            return fetch()
+
+        return get_cached_reply(cls._meta.index_name, command, fetch)
+
+    @classmethod
+    async def aaggregate(
+        cls, aggregate_request: AggregateRequest
+    ) -> List[Dict[str, Any]]:
+        """Asynchronous version of `aggregate()`"""
+        query_params = getattr(aggregate_request, "params", None) or None
+
+        async def fetch() -> List[Dict[str, Any]]:
+            results = (
+                await cls.adb()  # type: ignore[misc]
+                .ft(cls._meta.index_name)
+                .aggregate(aggregate_request, query_params=query_params)
+            )
+            return aggregate_rows_to_dicts(results.rows)
+
+        command = cls.get_aggregate_command(aggregate_request)
+
+        if command is None:
+            return await fetch()
+
+        return await aget_cached_reply(cls._meta.index_name, command, fetch)
+
+    @classmethod
+    def get_aggregate_command(
+        cls, aggregate_request: AggregateRequest
+    ) -> Union[List[Any], None]:
+        """
+        Returns the command arguments of the aggregate request used as result
+        cache key, or `None` for cursor requests which can not be cached.
+        """
+        if getattr(aggregate_request, "_cursor", None):
+            return None
 
         return [
-            {
-                decode_string(result[i]): decode_string(result[i + 1])
-                for i in range(0, len(result), 2)
-            }
-            for result in results.rows
+            "ft.aggregate",
+            cls._meta.index_name,
+            *aggregate_request.build_args(),
+            *get_params_args(
+                getattr(aggregate_request, "params", None) or {}, dialect=False
+            ),
         ]
 
+    @classmethod
+    def adb(cls) -> "aioredis.Redis[str]":
+        """Returns the async Redis client of the running event loop"""
+        return get_async_redis_connection()
+
     @classmethod
     def data_from_model_instance(
         cls, instance: models.Model, exclude_obj: Union[models.Model, None] = None
@@ -224,6 +339,94 @@ class Document(RedisModel, ABC):
                 exclude = None
             cls.from_model_instance(attribute, exclude_obj=exclude, save=True)
 
+    @classmethod
+    def get_related_pks(cls, instance: models.Model) -> List[Any]:
+        """Get primary keys of model instances related to a Django Model instance"""
+        related_model_config = cls._django.related_models.get(instance.__class__)
+
+        # If the related model is not configured, return
+        if not related_model_config:
+            return []
+
+        attribute = getattr(instance, related_model_config["related_name"], None)
+
+        # If the related name attribute is not found, return
+        if not attribute:
+            return []
+
+        if related_model_config["many"]:
+            return list(attribute.values_list("pk", flat=True))
+        return [attribute.pk]
+
+    @classmethod
+    def update_related_field(
+        cls, instances: Iterable[models.Model], field_name: str
+    ) -> None:
+        """
+        Update only the embedded list of a many-to-many relation
+        on the documents of the Django Model instances.
+
+        Documents are fully updated if the field is not an embedded list
+        or if fields are computed by `prepare_{field_name}` methods,
+        as their values may depend on the relation.
+        """
+        field = cls.__fields__.get(field_name)
+        instances = list(instances)
+
+        if not instances or (not field and not cls.has_prepared_fields()):
+            return
+
+        # Only embedded documents of Json Documents can be updated in place
+        if (
+            not field
+            or not issubclass(cls, JsonModel)
+            or not issubclass(field.type_, EmbeddedJsonDocument)
+            or cls.has_prepared_fields()
+        ):
+            for instance in instances:
+                cls.update_from_model_instance(instance, create=True)
+            return
+
+        pipeline = cls.db().pipeline(transaction=False)
+
+        for instance in instances:
+            value = [
+                json.loads(field.type_.from_model_instance(obj, save=False).json())
+                for obj in getattr(instance, field_name).all()
+            ]
+            pipeline.json().set(
+                cls.make_primary_key(instance.pk), f"$.{field_name}", value
+            )
+
+        responses = pipeline.execute(raise_on_error=False)
+
+        for instance, response in zip(instances, responses):
+            # Only existing documents can be updated in place,
+            # create the Document if not found.
+            if isinstance(response, Exception):
+                cls.from_model_instance(instance, save=True)
+
+    @classmethod
+    def has_prepared_fields(cls) -> bool:
+        """Check if any field value is computed by a `prepare_{field_name}` method"""
+        return any(
+            hasattr(cls, f"prepare_{field_name}") for field_name in cls.__fields__
+        )
+
+    @classmethod
+    def has_embedded_field(cls, model: Type[models.Model], field_name: str) -> bool:
+        """Check if the document embeds a `model` document that has `field_name`"""
+        for field in cls.__fields__.values():
+            field_type = field.type_
+
+            if (
+                issubclass(field_type, EmbeddedJsonDocument)
+                and field_type._django.model == model
+                and field_name in field_type.__fields__
+            ):
+                return True
+        return False
+
     @classmethod
     def index_queryset(
         cls,
@@ -240,6 +443,39 @@ class Document(RedisModel, ABC):
 
         cls.add(obj_list)
 
+    @classmethod
+    def index_pks(cls, pks: Iterable[Any], chunk_size: int = 2000) -> None:
+        """
+        Index the instances of the given primary keys in chunks.
+
+        Documents of the primary keys that are not in `get_queryset()`
+        (e.g: deleted instances) are removed from the index.
+        """
+        pks = iter(pks)
+
+        while True:
+            chunk = list(islice(pks, chunk_size))
+
+            if not chunk:
+                break
+
+            obj_list = [
+                cls.from_model_instance(instance, save=False)
+                for instance in cls.get_queryset().filter(pk__in=chunk)
+            ]
+            indexed_pks = {obj.pk for obj in obj_list}
+            removed_keys = [
+                cls.make_primary_key(pk) for pk in chunk if str(pk) not in indexed_pks
+            ]
+
+            pipeline = cls.db().pipeline(transaction=False)
+            cls.add(obj_list, pipeline=pipeline)
+
+            if removed_keys:
+                pipeline.delete(*removed_keys)
+
+            pipeline.execute()
+
     @classmethod
     def index_all(cls) -> None:
         """Index all instances of the model"""
@@ -306,12 +542,77 @@ class Document(RedisModel, ABC):
         cls.__fields__.update(fields)
         cls.__annotations__.update(type_annotations)
 
+    def to_model_instance(self) -> models.Model:
+        """
+        Build an unsaved Django Model instance from the document data
+        without querying the database.
+
+        Embedded documents are converted to related model instances,
+        lists of embedded documents are set as prefetched related objects.
+        """
+        model = self._django.model
+        instance = model(pk=model._meta.pk.to_python(self.pk))
+
+        for field_name in self.__fields__:
+            # Skip the primary key and the fields missing from partial documents
+            if field_name == "pk" or field_name not in self.__fields_set__:
+                continue
+
+            try:
+                model_field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+
+            value = getattr(self, field_name)
+
+            if not model_field.is_relation:
+                setattr(instance, model_field.attname, model_field.to_python(value))
+            elif isinstance(value, list):
+                set_prefetched_objects(
+                    instance, field_name, [obj.to_model_instance() for obj in value]
+                )
+            elif value is not None:
+                setattr(instance, field_name, value.to_model_instance())
+
+        return instance
+
     @property
     def id(self) -> Union[int, str]:
         """Alias for the primary key of the document"""
         return self.pk
 
 
+def set_prefetched_objects(
+    instance: models.Model, field_name: str, objects: List[models.Model]
+) -> None:
+    """Set the related objects of a many-to-many or reverse relation as prefetched"""
+    manager = getattr(instance, field_name)
+    cache_name = (
+        getattr(manager, "prefetch_cache_name", None)
+        or manager.field.remote_field.get_cache_name()
+    )
+
+    queryset = manager.get_queryset()
+    queryset._result_cache = objects
+    queryset._prefetch_done = True
+
+    if not hasattr(instance, "_prefetched_objects_cache"):
+        instance._prefetched_objects_cache = {}
+
+    instance._prefetched_objects_cache[cache_name] = queryset
+
+
+def aggregate_rows_to_dicts(rows: List[List[Any]]) -> List[Dict[str, Any]]:
+    """Convert the rows of an aggregation result to dictionaries"""
+    return [
+        {
+            decode_string(row[i]): decode_string(row[i + 1])
+            for i in range(0, len(row), 2)
+        }
+        for row in rows
+    ]
+
+
 def decode_string(value: Union[str, bytes]) -> str:
     """Decode a string from bytes to str"""
 
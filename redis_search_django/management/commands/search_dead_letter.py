@@ -0,0 +1,83 @@
+import argparse
+import time
+from typing import Any
+
+from django.core.management import BaseCommand
+
+from redis_search_django.dead_letter import dead_letter_queue
+
+
+class Command(BaseCommand):
+    help = "Retry failed index operations from the dead letter queue"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            dest="batch_size",
+            help="Number of entries to retry at once.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep retrying the entries until the process is stopped.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when no entries are due (used with --loop).",
+        )
+        parser.add_argument(
+            "--replay",
+            action="store_true",
+            help="Move entries that exceeded the max retries back to the queue.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            dest="list_dead_letters",
+            help="List entries that exceeded the max retries.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        loop = options["loop"]
+        interval = options["interval"]
+
+        if options["list_dead_letters"]:
+            for entry in dead_letter_queue.dead_letters():
+                self.stdout.write(
+                    f"{entry['model']} {entry['pk']} "
+                    f"(attempts: {entry['attempts']}): {entry['error']}"
+                )
+            return
+
+        if options["replay"]:
+            replayed = dead_letter_queue.replay()
+            self.stdout.write(
+                self.style.SUCCESS(f"Successfully replayed {replayed} dead letters")
+            )
+
+        total_succeeded = total_failed = 0
+
+        while True:
+            succeeded, failed = dead_letter_queue.retry(batch_size=batch_size)
+            total_succeeded += succeeded
+            total_failed += failed
+
+            if succeeded or failed:
+                continue
+
+            if not loop:
+                break
+
+            time.sleep(interval)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully indexed {total_succeeded} entries, "
+                f"{total_failed} entries failed"
+            )
+        )
@@ -1,21 +1,31 @@
-from typing import Any, Iterable, List, Type, Union
+from typing import Any, Dict, Iterable, List, Tuple, Type, Union
 
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpRequest
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.http import Http404, HttpRequest
 from django.template.response import TemplateResponse
 from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
 from django.views.generic.list import (
     MultipleObjectMixin,
     MultipleObjectTemplateResponseMixin,
 )
+from redis.commands.search import reducers
+from redis.commands.search.aggregation import AggregateRequest, Desc
 
-from .documents import Document
-from .paginator import RediSearchPaginator
+from .compiler import get_params_args
+from .documents import Document, aggregate_rows_to_dicts
+from .paginator import AsyncRediSearchPaginator, RediSearchPaginator
+from .query import RediSearchQuery
+from .result_cache import aget_cached_replies, get_cached_replies
 
 
 class RediSearchMixin:
     paginator_class = RediSearchPaginator
     document_class: Type[Document]
+    # Fields to count the search results by (e.g: `["category_name", "tags_name"]`)
+    facet_fields: List[str] = []
+    facet_results: Union[Dict[str, List[Dict[str, Any]]], None] = None
 
     @cached_property
     def search_query_expression(self) -> Any:
@@ -26,7 +36,119 @@ class RediSearchMixin:
         return None
 
     def facets(self) -> Any:
-        return None
+        if not self.facet_fields:
+            return None
+
+        if self.facet_results is None:
+            self.fetch_facets()
+
+        return self.facet_results
+
+    def get_facet_request(self, field_name: str) -> AggregateRequest:
+        """Build the aggregation request that counts the results by the field"""
+        if self.search_query_expression:
+            request = self.document_class.build_aggregate_request(
+                self.search_query_expression
+            )
+        else:
+            request = self.document_class.build_aggregate_request()
+
+        return request.group_by(
+            [f"@{field_name}"], reducers.count().alias("count")
+        ).sort_by(Desc("@count"))
+
+    def get_pipeline_commands(
+        self, search_query: Union[RediSearchQuery, None] = None
+    ) -> List[List[Any]]:
+        """Returns the search command (if any) and the facet commands"""
+        commands = [search_query.get_search_args()] if search_query else []
+
+        for field_name in self.facet_fields:
+            request = self.get_facet_request(field_name)
+            commands.append(
+                [
+                    "ft.aggregate",
+                    self.document_class._meta.index_name,
+                    *request.build_args(),
+                    # The dialect is already added by the request
+                    *get_params_args(getattr(request, "params", {}), dialect=False),
+                ]
+            )
+
+        return commands
+
+    def decode_pipeline_replies(
+        self, commands: List[List[Any]], replies: List[Any]
+    ) -> List[Any]:
+        """
+        Decodes the facet replies to lists of dictionaries.
+
+        Decoded replies are cached under the same keys as `Document.aggregate()`,
+        the search reply is kept raw like in `RediSearchQuery.execute()`.
+        """
+        return [
+            aggregate_rows_to_dicts(reply[1:]) if args[0] == "ft.aggregate" else reply
+            for args, reply in zip(commands, replies)
+        ]
+
+    def load_pipeline_results(
+        self,
+        commands: List[List[Any]],
+        results: List[Any],
+        search_query: Union[RediSearchQuery, None] = None,
+    ) -> None:
+        """Loads the search result into the query and the decoded facet results"""
+        if search_query:
+            search_query.add_prefetched_result(commands[0], results[0])
+            results = results[1:]
+
+        self.facet_results = dict(zip(self.facet_fields, results))
+
+    def fetch_facets(self, search_query: Union[RediSearchQuery, None] = None) -> None:
+        """
+        Fetches the facets and the search results (if a query is given)
+        using a single pipeline.
+
+        If the result cache is enabled, only the replies
+        that are not cached are fetched.
+        """
+        commands = self.get_pipeline_commands(search_query)
+
+        def fetch(missing: List[List[Any]]) -> List[Any]:
+            pipeline = self.document_class.db().pipeline(transaction=False)
+
+            for args in missing:
+                pipeline.execute_command(*args)
+
+            return self.decode_pipeline_replies(missing, pipeline.execute())
+
+        self.load_pipeline_results(
+            commands,
+            get_cached_replies(self.document_class._meta.index_name, commands, fetch),
+            search_query,
+        )
+
+    async def afetch_facets(
+        self, search_query: Union[RediSearchQuery, None] = None
+    ) -> None:
+        """Asynchronous version of `fetch_facets()`"""
+        commands = self.get_pipeline_commands(search_query)
+
+        async def fetch(missing: List[List[Any]]) -> List[Any]:
+            pipeline = self.document_class.adb().pipeline(transaction=False)
+
+            for args in missing:
+                pipeline.execute_command(*args)
+
+            return self.decode_pipeline_replies(missing, await pipeline.execute())
+
+        self.load_pipeline_results(
+            commands,
+            await aget_cached_replies(
+                self.document_class._meta.index_name, commands, fetch
+            ),
+            search_query,
+        )
 
     def search(self) -> Document:
         if not hasattr(self, "document_class") or not self.document_class:
@@ -89,5 +211,131 @@ class RediSearchListViewMixin(
 ):
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> TemplateResponse:
         self.object_list = self.search()
+
+        if self.facet_fields:
+            # Fetch the search results and the facets in a single round trip
+            self.fetch_facets(self.get_prefetch_query(self.object_list))
+
         context = self.get_context_data(facets=self.facets())
         return self.render_to_response(context)
+
+    def get_prefetch_query(
+        self, search_query: RediSearchQuery
+    ) -> Union[RediSearchQuery, None]:
+        """
+        Paginates the search query the same way as the paginator
+        so that its results can be fetched with the facets.
+        """
+        page_size = self.get_paginate_by(search_query)
+
+        if not page_size:
+            return search_query
+
+        page = self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg)
+
+        try:
+            page_number = int(page or 1)
+        except ValueError:
+            # The page number is resolved by the paginator (e.g: "last")
+            return None
+
+        if page_number < 1:
+            return None
+
+        search_query.paginate(offset=(page_number - 1) * page_size, limit=page_size)
+        return search_query
+
+
+class AsyncRediSearchListViewMixin(RediSearchListViewMixin):
+    """
+    Asynchronous version of `RediSearchListViewMixin`.
+
+    Search queries are executed using the async Redis client,
+    requires Django 4.1+ for asynchronous class-based views.
+    """
+
+    paginator_class = AsyncRediSearchPaginator
+
+    async def afacets(self) -> Any:
+        if not self.facet_fields:
+            return None
+
+        if self.facet_results is None:
+            await self.afetch_facets()
+
+        return self.facet_results
+
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> TemplateResponse:
+        self.object_list = self.search()
+
+        if self.facet_fields:
+            # Fetch the search results and the facets in a single round trip
+            await self.afetch_facets(self.get_prefetch_query(self.object_list))
+
+        context = await self.aget_context_data(facets=await self.afacets())
+        return self.render_to_response(context)
+
+    async def apaginate_queryset(
+        self, queryset: RediSearchQuery, page_size: int
+    ) -> Tuple[Paginator, Page, Any, bool]:
+        """Asynchronous version of `paginate_queryset()`"""
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        page_kwarg = self.page_kwarg
+        page = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg) or 1
+        try:
+            page_number = int(page)
+        except ValueError:
+            if page == "last":
+                page_number = await paginator.anum_pages()
+            else:
+                raise Http404(
+                    _("Page is not “last”, nor can it be converted to an int.")
+                )
+        try:
+            page = await paginator.apage(page_number)
+            return (paginator, page, page.object_list, page.has_other_pages())
+        except InvalidPage as e:
+            raise Http404(
+                _("Invalid page (%(page_number)s): %(message)s")
+                % {"page_number": page_number, "message": str(e)}
+            )
+
+    async def aget_context_data(
+        self, *, object_list: Any = None, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Asynchronous version of `get_context_data()`"""
+        queryset = object_list if object_list is not None else self.object_list
+        page_size = self.get_paginate_by(queryset)
+        context_object_name = self.get_context_object_name(queryset)
+        if page_size:
+            paginator, page, queryset, is_paginated = await self.apaginate_queryset(
+                queryset, page_size
+            )
+            context = {
+                "paginator": paginator,
+                "page_obj": page,
+                "is_paginated": is_paginated,
+                "object_list": queryset,
+            }
+        else:
+            # Execute the query so that it is not executed
+            # synchronously while rendering the template.
+            queryset = await queryset.aexecute()
+            context = {
+                "paginator": None,
+                "page_obj": None,
+                "is_paginated": False,
+                "object_list": queryset,
+            }
+        if context_object_name is not None:
+            context[context_object_name] = queryset
+        context.update(kwargs)
+        # Skip `MultipleObjectMixin.get_context_data()` as it paginates synchronously
+        return super(MultipleObjectMixin, self).get_context_data(**context)
@@ -0,0 +1,238 @@
+import heapq
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Tuple,
+    Type,
+    Union,
+)
+
+from redis_om import RedisModel
+
+from .query import RawHit, RediSearchQuery, to_string
+
+if TYPE_CHECKING:
+    from .documents import Document
+
+
+class MultiSearchHit:
+    """Search hit of a document class, the document is parsed on first access"""
+
+    __slots__ = ("document_class", "score", "sort_key", "_raw_hit")
+
+    def __init__(
+        self,
+        document_class: Type["Document"],
+        raw_hit: RawHit,
+        score: Union[float, None] = None,
+        sort_key: Any = None,
+    ) -> None:
+        self.document_class = document_class
+        self.score = score
+        self.sort_key = sort_key
+        self._raw_hit: Any = raw_hit
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.document_class.__name__} {self.key}>"
+
+    @property
+    def key(self) -> str:
+        """Redis key of the document"""
+        if isinstance(self._raw_hit, RawHit):
+            return to_string(self._raw_hit.key)
+        return self._raw_hit.key()
+
+    @property
+    def document(self) -> RedisModel:
+        """The document (or `values()` result) of the hit"""
+        if isinstance(self._raw_hit, RawHit):
+            self._raw_hit = self._raw_hit.parse()
+        return self._raw_hit
+
+
+class MultiSearchResult:
+    """Merged search results of several document classes"""
+
+    def __init__(
+        self, hits: List[MultiSearchHit], hit_counts: Dict[Type["Document"], int]
+    ) -> None:
+        self.hits = hits
+        self.hit_counts = hit_counts
+        self.hit_count = sum(hit_counts.values())
+
+    def __repr__(self) -> str:
+        return "<{} {} of {}>".format(
+            self.__class__.__name__, len(self), self.hit_count
+        )
+
+    def __iter__(self) -> Generator[MultiSearchHit, None, None]:
+        yield from self.hits
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.hits[index]
+
+    def __bool__(self) -> bool:
+        return bool(self.hits)
+
+    def count(self) -> int:
+        """Returns the total number of hits of all document classes"""
+        return self.hit_count
+
+    def exists(self) -> bool:
+        """Returns True if there are results"""
+        return bool(self.hits)
+
+    def documents(self, document_class: Type["Document"]) -> List[RedisModel]:
+        """Returns the documents of a document class in the merged order"""
+        return [
+            hit.document for hit in self.hits if hit.document_class is document_class
+        ]
+
+
+class MultiSearch:
+    """
+    Search several document classes in a single round trip.
+
+    One `FT.SEARCH` per index is sent in a pipeline and the hits are merged
+    by score (`WITHSCORES`) or by a sort field (`WITHSORTKEYS`) with a k-way merge.
+    The sort field (e.g: `"-created_at"`) must be sortable in all indices.
+
+    The `paginate()`, `execute()` and `count()` methods are compatible with
+    `RediSearchPaginator`, so the merged results can be paginated.
+    """
+
+    def __init__(
+        self,
+        *queries: RediSearchQuery,
+        sort_field: Union[str, None] = None,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> None:
+        if not queries:
+            raise ValueError("At least one query is required")
+
+        self.sort_field = sort_field
+        self.queries = [
+            query.sort_by(sort_field) if sort_field else query.copy(sort_fields=[])
+            for query in queries
+        ]
+        self.offset = offset
+        self.limit = limit
+        # Total number of hits of the last `execute()`
+        self._hit_count: Union[int, None] = None
+
+    def paginate(self, offset: int = 0, limit: int = 10) -> None:
+        """Paginates the merged results."""
+        self.offset = offset
+        self.limit = limit
+
+    def get_search_args(self, query: RediSearchQuery) -> List[Any]:
+        """
+        Returns the `FT.SEARCH` arguments of a query.
+
+        Each index returns its first `offset + limit` hits,
+        as any of them can be part of the merged page.
+        """
+        args = query.get_search_args(offset=0, limit=self.offset + self.limit)
+        flag = "WITHSORTKEYS" if self.sort_field else "WITHSCORES"
+        return [*args[:3], flag, *args[3:]]
+
+    def fetch_raw(self, commands: List[List[Any]]) -> List[Any]:
+        """Sends the commands of all indices in a single pipeline"""
+        pipeline = self.queries[0].model.db().pipeline(transaction=False)
+
+        for args in commands:
+            pipeline.execute_command(*args)
+
+        return pipeline.execute()
+
+    def execute(self, exhaust_results: bool = False) -> MultiSearchResult:
+        """
+        Executes the queries and returns the merged page of results.
+
+        `exhaust_results` is accepted for compatibility with
+        `RediSearchQuery.execute()`, only the current page is fetched.
+        """
+        raw_results = self.fetch_raw(
+            [self.get_search_args(query) for query in self.queries]
+        )
+        hit_counts: Dict[Type["Document"], int] = {}
+        streams = []
+
+        for query, raw_result in zip(self.queries, raw_results):
+            hit_counts[query.model] = hit_counts.get(query.model, 0) + raw_result[0]
+            streams.append(self.iter_hits(query, raw_result))
+
+        descending = self.sort_field is None or self.sort_field.startswith("-")
+        merged = heapq.merge(*streams, key=lambda item: item[0], reverse=descending)
+        hits = [hit for _, hit in islice(merged, self.offset, self.offset + self.limit)]
+        result = MultiSearchResult(hits, hit_counts)
+        self._hit_count = result.hit_count
+        return result
+
+    def iter_hits(
+        self, query: RediSearchQuery, raw_result: List[Any]
+    ) -> Iterable[Tuple[Any, MultiSearchHit]]:
+        """Yields the merge keys and the hits of a `FT.SEARCH` reply"""
+        descending = self.sort_field is None or self.sort_field.startswith("-")
+
+        for i in range(1, len(raw_result) - 2, 3):
+            key, value, fields = raw_result[i : i + 3]  # noqa: E203
+
+            if fields is None:
+                continue
+
+            raw_hit = RawHit(key, fields, query.parse_hit)
+
+            if self.sort_field is None:
+                score = float(value)
+                yield score, MultiSearchHit(query.model, raw_hit, score=score)
+                continue
+
+            sort_key = parse_sort_key(value)
+            # Missing values are merged last
+            merge_key = (
+                (sort_key is not None, sort_key)
+                if descending
+                else (sort_key is None, sort_key)
+            )
+            yield merge_key, MultiSearchHit(query.model, raw_hit, sort_key=sort_key)
+
+    def count(self) -> int:
+        """
+        Returns the total number of hits of all document classes.
+
+        Uses the hit counts of the last `execute()` if the queries
+        have been executed, otherwise only the hit counts are fetched.
+        """
+        if self._hit_count is not None:
+            return self._hit_count
+
+        raw_results = self.fetch_raw(
+            [query.get_hit_count_args(0) for query in self.queries]
+        )
+        return sum(raw_result[0] for raw_result in raw_results)
+
+
+def parse_sort_key(value: Any) -> Union[float, str, None]:
+    """
+    Parses a `WITHSORTKEYS` value, numbers are prefixed
+    with `#` and strings with `$` (`None` if the value is missing).
+    """
+    value = to_string(value)
+
+    if not value or value == "none":
+        return None
+
+    if value.startswith("#"):
+        return float(value[1:])
+
+    return value[1:] if value.startswith("$") else value
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class OutboxConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "redis_search_django.outbox"
+    label = "redis_search_django_outbox"
+    verbose_name = "Redis Search Outbox"
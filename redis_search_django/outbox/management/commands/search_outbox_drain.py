@@ -0,0 +1,60 @@
+import argparse
+import time
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from redis_search_django.outbox.models import IndexOutbox
+
+
+class Command(BaseCommand):
+    help = "Index Documents of the model instances stored in the outbox"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of outbox entries to index at once.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep draining the outbox until the process is stopped.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the outbox is empty (used with --loop).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias of the outbox table to drain.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        loop = options["loop"]
+        interval = options["interval"]
+        manager = IndexOutbox.objects.db_manager(options["database"])
+        total = 0
+
+        while True:
+            drained = manager.drain(batch_size=batch_size)
+            total += drained
+
+            if drained:
+                continue
+
+            if not loop:
+                break
+
+            time.sleep(interval)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully indexed {total} outbox entries")
+        )
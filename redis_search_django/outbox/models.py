@@ -0,0 +1,75 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Set, Type, Union
+
+from django.apps import apps
+from django.db import models, transaction
+
+from redis_search_django.registry import document_registry
+
+
+class IndexOutboxManager(models.Manager):
+    def add(
+        self,
+        model: Type[models.Model],
+        pks: Iterable[Any],
+        using: Union[str, None] = None,
+    ) -> None:
+        """
+        Add model instance primary keys that need to be indexed.
+
+        `using` is the database alias the model instances were written to,
+        so the entries are written in the same transaction.
+        """
+        manager = self.db_manager(using) if using else self
+        manager.bulk_create(
+            [self.model(model=model._meta.label, object_pk=str(pk)) for pk in pks]
+        )
+
+    def drain(self, batch_size: int = 1000) -> int:
+        """
+        Index a batch of entries and delete them from the outbox.
+
+        Entries locked by other workers are skipped,
+        so multiple workers can drain the outbox in parallel.
+        Returns the number of drained entries.
+        """
+        with transaction.atomic(using=self.db):
+            entries = list(
+                self.select_for_update(skip_locked=True).order_by("pk")[:batch_size]
+            )
+
+            if not entries:
+                return 0
+
+            # Deduplicate entries of the same model instance
+            dirty: Dict[Type[models.Model], Set[str]] = defaultdict(set)
+
+            for entry in entries:
+                try:
+                    django_model = apps.get_model(entry.model)
+                except LookupError:
+                    # The model does not exist anymore, drop the entry
+                    continue
+                dirty[django_model].add(entry.object_pk)
+
+            document_registry.index_dirty(dirty, chunk_size=batch_size)
+            self.filter(pk__in=[entry.pk for entry in entries]).delete()
+
+        return len(entries)
+
+
+class IndexOutbox(models.Model):
+    """Model instances that need to be indexed by `search_outbox_drain` command."""
+
+    model = models.CharField(max_length=255)
+    object_pk = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = IndexOutboxManager()
+
+    class Meta:
+        verbose_name = "index outbox entry"
+        verbose_name_plural = "index outbox entries"
+
+    def __str__(self) -> str:
+        return f"{self.model}: {self.object_pk}"
@@ -1,6 +1,25 @@
-from typing import Union
+import base64
+import hashlib
+import json
+from decimal import Decimal
+from typing import Any, List, Sequence, Tuple, Union
 
-from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page,
+    PageNotAnInteger,
+    Paginator,
+)
+from django.utils.functional import cached_property
+from redis_om import RedisModel
+from redis_om.model.model import FindQuery, Operators, RediSearchFieldTypes
+
+from .query import RediSearchQuery, RediSearchResult
+from .result_cache import get_generation, get_result_cache
 
 
 class RediSearchPaginator(Paginator):
@@ -32,3 +51,357 @@ class RediSearchPaginator(Paginator):
                 raise EmptyPage("That page contains no results")
 
         return page
+
+
+class AsyncRediSearchPaginator(RediSearchPaginator):
+    """Paginator that Allows Asynchronous Pagination of a Redis Search Query"""
+
+    async def acount(self) -> int:
+        """Asynchronous version of `count`"""
+        if "count" not in self.__dict__:
+            # Store the value of the `count` cached property
+            self.__dict__["count"] = await self.object_list.acount()
+        return self.count
+
+    async def anum_pages(self) -> int:
+        """Asynchronous version of `num_pages`"""
+        await self.acount()
+        return self.num_pages
+
+    async def apage(self, number: Union[int, str]) -> Page:
+        """Asynchronous version of `page()`"""
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # Set limit and offset for the redis search query
+        self.object_list.paginate(offset=bottom, limit=self.per_page)
+        # Executes the redis search query which returns RediSearchResult object
+        result = await self.object_list.aexecute(exhaust_results=False)
+        # The hit count of the result is used as count to avoid another query
+        self.__dict__.setdefault("count", result.count())
+
+        page = Page(result, number, self)
+
+        if number > self.num_pages:
+            if number == 1 and self.allow_empty_first_page:
+                pass
+            else:
+                raise EmptyPage("That page contains no results")
+
+        return page
+
+
+class CachedRediSearchPaginator(RediSearchPaginator):
+    """
+    Paginator that caches the hit count and prefetches the next page.
+
+    The next page is fetched in the same pipeline as the requested page
+    and is served from the cache, so sequential browsing only sends
+    a request to Redis for every other page. The hit count and the pages
+    are cached per query and session (`session_key`) for a short time.
+    If the result cache is enabled, they are also invalidated
+    when the generation of the index changes.
+    """
+
+    def __init__(
+        self,
+        object_list: RediSearchQuery,
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+        session_key: Union[str, None] = None,
+    ) -> None:
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.session_key = session_key or ""
+
+    @cached_property
+    def cache(self) -> BaseCache:
+        return caches[getattr(settings, "REDIS_SEARCH_PAGINATOR_CACHE", "default")]
+
+    @cached_property
+    def cache_timeout(self) -> int:
+        return getattr(settings, "REDIS_SEARCH_PAGINATOR_CACHE_TIMEOUT", 30)
+
+    @cached_property
+    def prefetch_max_size(self) -> int:
+        return getattr(settings, "REDIS_SEARCH_PAGINATOR_PREFETCH_MAX_SIZE", 100)
+
+    @cached_property
+    def generation(self) -> int:
+        """Returns the generation of the index (`0` if the result cache is disabled)"""
+        result_cache = get_result_cache()
+
+        if result_cache is None:
+            return 0
+        return get_generation(result_cache, self.object_list.model.Meta.index_name)
+
+    def get_cache_key(self, args: List[Any]) -> str:
+        """Returns the cache key of the reply of the command arguments"""
+        digest = hashlib.md5(json.dumps(args, default=str).encode("utf-8")).hexdigest()
+        index_name = self.object_list.model.Meta.index_name
+        return (
+            f"redis_search:paginator:{index_name}:{self.generation}:"
+            f"{self.session_key}:{digest}"
+        )
+
+    def get_count_key(self) -> str:
+        """Returns the cache key of the hit count of the query"""
+        return self.get_cache_key(self.object_list.get_hit_count_args(0))
+
+    @cached_property
+    def count(self) -> int:
+        """Returns the cached hit count of the query (or fetches it)"""
+        count = self.cache.get(self.get_count_key())
+
+        if count is None:
+            count = self.object_list.count()
+            self.cache.set(self.get_count_key(), count, timeout=self.cache_timeout)
+
+        return count
+
+    def should_prefetch(self, number: int) -> bool:
+        """Returns True if the page after the page number should be prefetched"""
+        if self.per_page > self.prefetch_max_size:
+            return False
+
+        if "count" in self.__dict__:
+            count = self.count
+        else:
+            count = self.cache.get(self.get_count_key())
+
+        return count is None or number * self.per_page < count
+
+    def prefetch(self, number: int) -> None:
+        """
+        Adds the reply of the page to the query, from the cache or
+        fetched from Redis with the next page in a single pipeline.
+        """
+        query = self.object_list
+        args = query.get_search_args()
+
+        if query.has_prefetched_result(args):
+            return
+
+        raw_result = self.cache.get(self.get_cache_key(args))
+
+        if raw_result is None:
+            commands = [args]
+
+            if self.should_prefetch(number):
+                commands.append(query.get_search_args(offset=number * self.per_page))
+
+            raw_result, *next_results = query.send_pipeline(commands)
+
+            for next_args, next_result in zip(commands[1:], next_results):
+                self.cache.set(
+                    self.get_cache_key(next_args),
+                    next_result,
+                    timeout=self.cache_timeout,
+                )
+
+        query.add_prefetched_result(args, raw_result)
+
+    def page(self, number: Union[int, str]) -> Page:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        self.object_list.paginate(offset=bottom, limit=self.per_page)
+        self.prefetch(number)
+        result = self.object_list.execute(exhaust_results=False)
+
+        # The hit count of the result is used as count to avoid another query
+        if "count" not in self.__dict__:
+            self.__dict__["count"] = result.count()
+            self.cache.set(
+                self.get_count_key(), result.count(), timeout=self.cache_timeout
+            )
+
+        page = Page(result, number, self)
+
+        if number > self.num_pages:
+            if number == 1 and self.allow_empty_first_page:
+                pass
+            else:
+                raise EmptyPage("That page contains no results")
+
+        return page
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class KeysetPage(Sequence[Any]):
+    """A page of `KeysetPaginator` results"""
+
+    def __init__(
+        self,
+        object_list: RediSearchResult,
+        cursor: Union[str, None],
+        next_cursor: Union[str, None],
+        paginator: "KeysetPaginator",
+    ) -> None:
+        self.object_list = object_list
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.paginator = paginator
+
+    def __repr__(self) -> str:
+        return f"<Page after {self.cursor or 'start'}>"
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginator that continues after the last result of the previous page
+    ("search after") instead of using an offset, so deep pages cost the same
+    as the first one.
+
+    The results are sorted by a sortable numeric field (e.g: `"-price"`),
+    other fields raise `ImproperlyConfigured`.
+    The opaque cursor of the next page holds the last sort value and the
+    primary keys of the results with that value, which are excluded
+    from the next page to break ties.
+
+    RediSearch only sorts by a single field, so there is no secondary sort
+    to break ties: if more than `max_ties` results share the same sort value,
+    the next cursor can not be built and `InvalidCursor` is raised.
+    """
+
+    def __init__(
+        self, object_list: RediSearchQuery, per_page: int, sort_field: str
+    ) -> None:
+        self.field_name = sort_field.lstrip("-")
+        self.descending = sort_field.startswith("-")
+        self.object_list = object_list.sort_by(sort_field)
+        self.per_page = int(per_page)
+        self.check_sort_field()
+
+    def check_sort_field(self) -> None:
+        """
+        Raises `ImproperlyConfigured` if the sort field is not a NUMERIC field,
+        as cursors hold numbers that are used in range filters.
+        """
+        model = self.object_list.model
+        field = model.__fields__.get(self.field_name)
+
+        if (
+            field is None
+            or not getattr(field.field_info, "index", None)
+            or FindQuery.resolve_field_type(field, Operators.GE)
+            is not RediSearchFieldTypes.NUMERIC
+        ):
+            raise ImproperlyConfigured(
+                f"{model.__name__}.{self.field_name} is not a numeric field, "
+                f"{self.__class__.__name__} can only sort by numeric fields"
+            )
+
+    @cached_property
+    def max_ties(self) -> int:
+        return getattr(settings, "REDIS_SEARCH_PAGINATOR_KEYSET_MAX_TIES", 1000)
+
+    def encode_cursor(self, value: Any, pks: List[str]) -> str:
+        """Returns the opaque cursor of a sort value and primary keys"""
+        data = json.dumps({"v": str(value), "pks": pks}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> Tuple[str, List[str]]:
+        """Returns the sort value and primary keys of a cursor"""
+        try:
+            data = json.loads(
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            )
+            value, pks = data["v"], data["pks"]
+            # Only numbers can be used in numeric range filters
+            is_valid = Decimal(value).is_finite() and isinstance(pks, list)
+        except (TypeError, ValueError, KeyError, ArithmeticError):
+            is_valid = False
+
+        if not is_valid or len(pks) > self.max_ties:
+            raise InvalidCursor("That cursor is not valid")
+
+        return value, [str(pk) for pk in pks]
+
+    def get_query(self, cursor: Union[str, None] = None) -> RediSearchQuery:
+        """Returns the query of the page that starts after the cursor"""
+        query = self.object_list
+
+        if cursor is not None:
+            value, pks = self.decode_cursor(cursor)
+            field = getattr(query.model, self.field_name)
+            expression = field <= value if self.descending else field >= value
+
+            if pks:
+                expression = expression & ~(query.model.pk << pks)
+
+            query = query.copy(expressions=[*query.expressions, expression])
+
+        query.paginate(offset=0, limit=self.per_page)
+        return query
+
+    def get_next_cursor(
+        self, result: RediSearchResult, cursor: Union[str, None] = None
+    ) -> Union[str, None]:
+        """Returns the cursor of the next page (`None` if there are no more results)"""
+        if not result or result.count() <= len(result):
+            return None
+
+        documents: List[RedisModel] = result[:]
+        value = getattr(documents[-1], self.field_name)
+
+        # Documents without a value are sorted last and are not matched
+        # by range filters, so the pages after them can not be reached
+        if value is None:
+            raise InvalidCursor(
+                f"The last result has no {self.field_name!r} value, "
+                "the next page can not be paginated"
+            )
+
+        pks = [
+            str(document.pk)
+            for document in documents
+            if getattr(document, self.field_name) == value
+        ]
+
+        if cursor is not None:
+            cursor_value, cursor_pks = self.decode_cursor(cursor)
+
+            # The whole page has the same value as the previous page
+            if Decimal(cursor_value) == Decimal(str(value)):
+                pks = cursor_pks + pks
+
+        if len(pks) > self.max_ties:
+            raise InvalidCursor(
+                f"More than {self.max_ties} results have the same "
+                f"{self.field_name!r} value, the next page can not be paginated"
+            )
+
+        return self.encode_cursor(value, pks)
+
+    def page(self, cursor: Union[str, None] = None) -> KeysetPage:
+        """Returns the page of results after the cursor (the first page if `None`)"""
+        query = self.get_query(cursor)
+        result = query.execute(exhaust_results=False)
+        return KeysetPage(result, cursor, self.get_next_cursor(result, cursor), self)
+
+
+class AsyncKeysetPaginator(KeysetPaginator):
+    """Keyset Paginator that Allows Asynchronous Pagination"""
+
+    async def apage(self, cursor: Union[str, None] = None) -> KeysetPage:
+        """Asynchronous version of `page()`"""
+        query = self.get_query(cursor)
+        result = await query.aexecute(exhaust_results=False)
+        return KeysetPage(result, cursor, self.get_next_cursor(result, cursor), self)
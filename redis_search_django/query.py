@@ -1,22 +1,84 @@
-from typing import Any, Generator, List, Type, Union
+import inspect
+import json
+import time
+from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Generator, List, Tuple, Type, Union
 
+from django.conf import settings
 from django.db import models
 from django.db.models import Case, IntegerField, When
-from redis_om import FindQuery, RedisModel
+from django.utils.module_loading import import_string
+from redis import ResponseError
+from redis_om import FindQuery, JsonModel, RedisModel
+from redis_om.model.model import ExpressionProxy
+
+from .compiler import compile_query, get_params_args, use_query_params
+from .connection import get_async_redis_connection
+from .result_cache import (
+    aget_cached_replies,
+    aget_cached_reply,
+    get_cached_replies,
+    get_cached_reply,
+)
+from .signals import query_timed_out
+
+# Use `orjson` (if installed) to decode the JSON values of `values()` results
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads  # type: ignore[assignment]
+
+
+# Policies of timed out queries (a callable can be used as a fallback)
+TIMEOUT_PARTIAL = "partial"
+TIMEOUT_RAISE = "raise"
+
+
+class QueryTimeoutError(Exception):
+    """Raised when a search query exceeds its timeout"""
+
+
+class RawHit:
+    """Hit of a `FT.SEARCH` reply that is parsed on first access"""
+
+    __slots__ = ("key", "fields", "parser")
+
+    def __init__(
+        self, key: Any, fields: List[Any], parser: Callable[[List[Any]], RedisModel]
+    ) -> None:
+        self.key = key
+        self.fields = fields
+        self.parser = parser
+
+    def parse(self) -> RedisModel:
+        """Builds the document of the hit"""
+        return self.parser(self.fields)
 
 
 class RediSearchResult:
-    """Class That Stores Redis Search Results"""
+    """
+    Class That Stores Redis Search Results
+
+    Hits added from raw `FT.SEARCH` replies (see `add_raw()`) are only
+    parsed into documents when they are accessed.
+    """
+
+    __slots__ = ("_results", "hit_count", "django_model", "values_format")
 
     def __init__(
         self,
         results: List[RedisModel],
         hit_count: int,
         django_model: Union[Type[models.Model], None],
+        values_format: Union[str, None] = None,
     ):
-        self.results = results
+        self._results: List[Any] = results
         self.hit_count = hit_count
         self.django_model = django_model
+        # Format of `values()` / `values_list()` results (`None` for documents)
+        self.values_format = values_format
 
     def __str__(self) -> str:
         return repr(self)
@@ -27,34 +89,74 @@ class RediSearchResult:
         )
 
     def __iter__(self, *args: Any, **kwargs: Any) -> Generator[Any, None, None]:
-        yield from self.results
+        for index in range(len(self._results)):
+            yield self.get_result(index)
 
     def __len__(self) -> int:
-        return len(self.results)
+        return len(self._results)
 
-    def __getitem__(self, index: int) -> RedisModel:
-        return self.results[index]
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [
+                self.get_result(i) for i in range(*index.indices(len(self._results)))
+            ]
+        return self.get_result(index)
 
     def __setitem__(self, index: int, value: RedisModel) -> None:
-        self.results[index] = value
+        self._results[index] = value
 
     def __contains__(self, item: RedisModel) -> bool:
-        return item in self.results
+        return any(result == item for result in self)
 
     def __bool__(self) -> bool:
-        return bool(self.results)
+        return bool(self._results)
+
+    @property
+    def results(self) -> List[RedisModel]:
+        """Returns all results, parsing the hits that were not accessed yet"""
+        return self[:]
+
+    @results.setter
+    def results(self, results: List[RedisModel]) -> None:
+        self._results = results
+
+    def get_result(self, index: int) -> RedisModel:
+        """Returns the result at the index, parsing it on first access"""
+        result = self._results[index]
+
+        if isinstance(result, RawHit):
+            result = self._results[index] = result.parse()
+
+        return result
 
     def clear(self) -> None:
         """Clears the results"""
-        self.results = []
+        self._results = []
         self.hit_count = 0
 
     def add(self, data: Union[RedisModel, List[RedisModel]]) -> None:
         """Adds data to the results"""
         if isinstance(data, list):
-            self.results += data
+            self._results += data
         else:
-            self.results.append(data)
+            self._results.append(data)
+
+    def add_raw(
+        self, raw_result: List[Any], parser: Callable[[List[Any]], RedisModel]
+    ) -> int:
+        """
+        Adds the hits of a `FT.SEARCH` reply to the results without parsing them.
+
+        Each hit is parsed with `parser(fields)` on first access.
+        Returns the number of added hits.
+        """
+        hits = [
+            RawHit(raw_result[i], raw_result[i + 1], parser)
+            for i in range(1, len(raw_result) - 1, 2)
+            if raw_result[i + 1] is not None
+        ]
+        self._results += hits
+        return len(hits)
 
     def count(self) -> int:
         """
@@ -67,41 +169,304 @@ class RediSearchResult:
 
     def exists(self) -> bool:
         """Returns True if there are results"""
-        return bool(self.results)
+        return bool(self._results)
+
+    def check_documents(self, method: str) -> None:
+        """Raises `TypeError` if the results are values instead of documents"""
+        if self.values_format:
+            raise TypeError(f"Cannot call {method}() after .values() or .values_list()")
 
     def to_queryset(self) -> models.QuerySet:
         """Converts the search results to a Django QuerySet"""
+        self.check_documents("to_queryset")
+
         if not self.django_model:
             raise ValueError("No Django Model has been set")
 
-        # if no results, return empty queryset
-        if not self.results:
-            return self.django_model.objects.none()
+        return get_ordered_queryset(
+            self.django_model, [result.pk for result in self.results]
+        )
 
-        pks = [result.pk for result in self.results]
-        return self.django_model.objects.filter(pk__in=pks).order_by(
-            Case(
-                *[When(pk=pk, then=position) for position, pk in enumerate(pks)],
-                output_field=IntegerField(),
-            )
+    def as_model_instances(self) -> List[models.Model]:
+        """
+        Converts the search results to unsaved Django model instances
+        using the document data, without querying the database.
+        """
+        self.check_documents("as_model_instances")
+        return [result.to_model_instance() for result in self.results]
+
+    def hydrate(self) -> "HydratedResult":
+        """
+        Converts the search results to Django model instances.
+
+        Unlike `to_queryset()`, the search order is restored in Python.
+        """
+        self.check_documents("hydrate")
+
+        if not self.django_model:
+            raise ValueError("No Django Model has been set")
+
+        pk_field = self.django_model._meta.pk
+        return HydratedResult(
+            self.django_model._default_manager.all(),
+            [pk_field.to_python(result.pk) for result in self.results],
         )
 
 
+class HydratedResult:
+    """
+    List-like Django model instances of search results in the search order.
+
+    Model instances are fetched using `in_bulk()` and ordered in Python,
+    which avoids building a large SQL `CASE` expression for ordering.
+    """
+
+    def __init__(self, queryset: models.QuerySet, pks: List[Any]):
+        self.queryset = queryset
+        self.pks = pks
+        self._result_cache: Union[List[models.Model], None] = None
+
+    def __repr__(self) -> str:
+        return "<{} {}>".format(self.__class__.__name__, self._fetch_all())
+
+    def __iter__(self) -> Generator[models.Model, None, None]:
+        yield from self._fetch_all()
+
+    def __len__(self) -> int:
+        return len(self._fetch_all())
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._fetch_all()[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._fetch_all())
+
+    def _fetch_all(self) -> List[models.Model]:
+        """Fetches the model instances and restores the search order"""
+        if self._result_cache is None:
+            objects = self.queryset.in_bulk(self.pks) if self.pks else {}
+            # Skip the model instances that were deleted from the database
+            self._result_cache = [objects[pk] for pk in self.pks if pk in objects]
+        return self._result_cache
+
+    def _clone(self, queryset: models.QuerySet) -> "HydratedResult":
+        return self.__class__(queryset, self.pks)
+
+    def select_related(self, *fields: Any) -> "HydratedResult":
+        """Returns a new result that selects the given related objects"""
+        return self._clone(self.queryset.select_related(*fields))
+
+    def prefetch_related(self, *lookups: Any) -> "HydratedResult":
+        """Returns a new result that prefetches the given related objects"""
+        return self._clone(self.queryset.prefetch_related(*lookups))
+
+
+def get_ordered_queryset(
+    django_model: Type[models.Model], pks: List[Any]
+) -> models.QuerySet:
+    """Returns a QuerySet of the given primary keys in the same order"""
+    # if no results, return empty queryset
+    if not pks:
+        return django_model.objects.none()
+
+    return django_model.objects.filter(pk__in=pks).order_by(
+        Case(
+            *[When(pk=pk, then=position) for position, pk in enumerate(pks)],
+            output_field=IntegerField(),
+        )
+    )
+
+
+def is_timeout_error(error: Exception) -> bool:
+    """Returns True if the error was raised because RediSearch timed out"""
+    return "timeout limit was reached" in str(error).lower()
+
+
+def get_hit_count(result: Any) -> int:
+    """
+    Returns the number of hits of the results of an on timeout policy
+    (e.g: a `RediSearchResult`, a Django QuerySet or a list).
+    """
+    if isinstance(result, (RediSearchResult, models.QuerySet)):
+        return result.count()
+    return len(result)
+
+
+@lru_cache(maxsize=None)
+def get_partial_document_class(model: Type[RedisModel]) -> Type[RedisModel]:
+    """
+    Returns the class of the partial documents of a document class.
+
+    Fields that were not fetched are not set on partial documents, reading them
+    raises `AttributeError` instead of returning the field expression of the class.
+    The subclass is created with `type.__new__()` so that it is not registered
+    as another model by the metaclasses.
+    """
+
+    def __getattribute__(self: RedisModel, name: str) -> Any:
+        value = object.__getattribute__(self, name)
+
+        if isinstance(value, ExpressionProxy):
+            raise AttributeError(
+                f"{name!r} was not fetched, it is deferred by only() or defer()"
+            )
+        return value
+
+    return type.__new__(
+        type(model),
+        model.__name__,
+        (model,),
+        {
+            "__getattribute__": __getattribute__,
+            "__module__": model.__module__,
+            "__qualname__": model.__qualname__,
+        },
+    )
+
+
+def get_reply_size(raw_result: List[Any]) -> int:
+    """Returns the number of hits of a `FT.SEARCH` reply, including expired hits"""
+    return (len(raw_result) - 1) // 2
+
+
+def to_string(value: Any) -> Any:
+    """Decodes bytes returned by Redis"""
+    if isinstance(value, bytes):
+        return value.decode(errors="ignore")
+    return value
+
+
 class RediSearchQuery(FindQuery):
+    _query: Union[str, None]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.django_model = kwargs.pop("django_model", None)
+        self.only_fields: List[str] = kwargs.pop("only_fields", None) or []
+        # Format of `values()` / `values_list()` results (`None` for documents)
+        self.values_format: Union[str, None] = kwargs.pop("values_format", None)
+        self.values_fields: List[str] = kwargs.pop("values_fields", None) or []
+        # Query timeout in milliseconds and the on timeout policy
+        self.query_timeout: Union[int, None] = kwargs.pop("query_timeout", None)
+        self.on_timeout: Union[str, Callable[..., Any], None] = kwargs.pop(
+            "on_timeout", None
+        )
         super().__init__(*args, **kwargs)
+        self._query_params: Dict[str, str] = {}
+        # Raw `FT.SEARCH` replies fetched in advance by their command arguments
+        self._prefetched_results: Dict[Tuple[Any, ...], Any] = {}
         # Initialize the cache with empty RediSearchResult.
         self._model_cache: RediSearchResult = RediSearchResult(
-            results=[], hit_count=0, django_model=self.django_model
+            results=[],
+            hit_count=0,
+            django_model=self.django_model,
+            values_format=self.values_format,
         )
+        # Set when a reply was loaded to the cache (even without hits)
+        self._executed = False
+
+    @property
+    def query(self) -> str:
+        """
+        Resolve and return the RediSearch query for this query.
+
+        If `REDIS_SEARCH_QUERY_PARAMS` is enabled, the query is a cached template
+        and the values are bound using `PARAMS` (see `query_params`).
+        """
+        if self._query is None:
+            if use_query_params():
+                self._query, self._query_params = compile_query(self.expression)
+            else:
+                self._query = self.resolve_redisearch_query(self.expression)
+        return self._query
+
+    @property
+    def query_params(self) -> Dict[str, str]:
+        """Returns the values of the query parameters"""
+        # Make sure the query has been resolved
+        self.query
+        return self._query_params
+
+    def get_params_args(self) -> List[Any]:
+        """Returns the `PARAMS` and `DIALECT` arguments of the query"""
+        return get_params_args(self.query_params)
+
+    def check_documents(self, method: str) -> None:
+        """Raises `TypeError` if the results are values instead of documents"""
+        if self.values_format:
+            raise TypeError(f"Cannot call {method}() after .values() or .values_list()")
 
     def to_queryset(self) -> models.QuerySet:
         """Converts the search results to a Django QuerySet"""
+        self.check_documents("to_queryset")
+
         if self._model_cache:
             return self._model_cache.to_queryset()
-        # If no results, then execute the query and return Django QuerySet.
-        return self.execute().to_queryset()
+
+        if not self.django_model:
+            raise ValueError("No Django Model has been set")
+
+        # If no results, then only fetch the primary keys of the documents.
+        return get_ordered_queryset(self.django_model, self.pks())
+
+    def hydrate(self) -> HydratedResult:
+        """
+        Converts the search results to Django model instances.
+
+        Unlike `to_queryset()`, the search order is restored in Python.
+        """
+        self.check_documents("hydrate")
+
+        if self._model_cache:
+            return self._model_cache.hydrate()
+
+        if not self.django_model:
+            raise ValueError("No Django Model has been set")
+
+        # If no results, then only fetch the primary keys of the documents.
+        return HydratedResult(self.django_model._default_manager.all(), self.pks())
+
+    def as_model_instances(self) -> List[models.Model]:
+        """
+        Converts the search results to unsaved Django model instances
+        using the document data, without querying the database.
+        """
+        self.check_documents("as_model_instances")
+
+        if self._model_cache:
+            return self._model_cache.as_model_instances()
+        return self.execute().as_model_instances()
+
+    def pks(self) -> List[Any]:
+        """
+        Returns the primary keys of all search results.
+
+        Uses `_model_cache` if the query has been executed, otherwise
+        only the document keys are fetched from Redis (using `NOCONTENT`).
+        """
+        self.check_documents("pks")
+
+        if self._model_cache:
+            pks = [result.pk for result in self._model_cache]
+        else:
+            pks = self.fetch_pks()
+
+        if self.django_model:
+            return [self.django_model._meta.pk.to_python(pk) for pk in pks]
+        return pks
+
+    def fetch_pks(self) -> List[str]:
+        """Fetches the primary keys of all search results without the documents"""
+        query = self if self.nocontent else self.copy(nocontent=True)
+        raw_result = self.model.db().execute_command(*query.get_search_args())
+        keys = raw_result[1:]
+        fetched = query.offset + len(keys)
+
+        if keys and raw_result[0] > fetched:
+            for _raw_result in query.fetch_remaining_raw(fetched, raw_result[0]):
+                keys += _raw_result[1:]
+
+        prefix_length = len(self.model.make_primary_key(""))
+        return [to_string(key)[prefix_length:] for key in keys]
 
     def all(self, batch_size: int = 10) -> "RediSearchQuery":
         """
@@ -115,61 +480,793 @@ class RediSearchQuery(FindQuery):
         return self
 
     def count(self) -> int:
-        """Return the number of hits from `_model_cache`"""
-        return self._model_cache.count()
+        """
+        Return the number of hits.
+
+        Uses `_model_cache` if the query has been executed, otherwise
+        only the number of hits is fetched from Redis (without the documents).
+        """
+        if self._executed:
+            return self._model_cache.count()
+        return self.fetch_hit_count(limit=0)
 
     def exists(self) -> bool:
-        """Returns True if there are results from `_model_cache`"""
-        return self._model_cache.exists()
+        """
+        Returns True if there are results.
+
+        Uses `_model_cache` if the query has been executed, otherwise
+        a single document key is fetched from Redis.
+        """
+        if self._executed:
+            return self._model_cache.exists()
+        return self.fetch_hit_count(limit=1) > 0
+
+    async def acount(self) -> int:
+        """Asynchronous version of `count()`"""
+        if self._executed:
+            return self._model_cache.count()
+        return await self.afetch_hit_count(limit=0)
+
+    async def aexists(self) -> bool:
+        """Asynchronous version of `exists()`"""
+        if self._executed:
+            return self._model_cache.exists()
+        return await self.afetch_hit_count(limit=1) > 0
+
+    def fetch_hit_count(self, limit: int = 0) -> int:
+        """
+        Fetches the number of hits from Redis without the document contents.
+
+        Timeouts are handled like in `execute()`, if RediSearch fails with
+        a timeout error the number of hits of the on timeout policy results
+        is returned.
+        """
+        start = time.monotonic()
+
+        try:
+            raw_result = self.model.db().execute_command(
+                *self.get_hit_count_args(limit)
+            )
+        except ResponseError as error:
+            if not is_timeout_error(error):
+                raise
+            return get_hit_count(self.handle_timeout(time.monotonic() - start, error))
+
+        if self.is_timed_out(time.monotonic() - start):
+            self.report_timeout(time.monotonic() - start)
+        return raw_result[0]
+
+    async def afetch_hit_count(self, limit: int = 0) -> int:
+        """Asynchronous version of `fetch_hit_count()`"""
+        start = time.monotonic()
+
+        try:
+            raw_result = await get_async_redis_connection().execute_command(
+                *self.get_hit_count_args(limit)
+            )
+        except ResponseError as error:
+            if not is_timeout_error(error):
+                raise
+            result = self.handle_timeout(time.monotonic() - start, error)
+        else:
+            if self.is_timed_out(time.monotonic() - start):
+                self.report_timeout(time.monotonic() - start)
+            return raw_result[0]
+
+        # Fallback functions of async queries can be coroutines
+        if inspect.isawaitable(result):
+            result = await result
+        return get_hit_count(result)
+
+    def get_hit_count_args(self, limit: int) -> List[Any]:
+        """Returns the `FT.SEARCH` arguments used to fetch the number of hits"""
+        return [
+            "ft.search",
+            self.model.Meta.index_name,
+            self.query,
+            "LIMIT",
+            0,
+            limit,
+            "NOCONTENT",
+            *self.get_timeout_args(),
+            *self.get_params_args(),
+        ]
+
+    def dict(self) -> Dict[str, Any]:
+        """Returns the arguments used to create a copy of the query"""
+        return {
+            **super().dict(),
+            "django_model": self.django_model,
+            "only_fields": list(self.only_fields),
+            "values_format": self.values_format,
+            "values_fields": list(self.values_fields),
+            "query_timeout": self.query_timeout,
+            "on_timeout": self.on_timeout,
+        }
+
+    def timeout(
+        self, ms: int, on_timeout: Union[str, Callable[..., Any], None] = None
+    ) -> "RediSearchQuery":
+        """
+        Returns a copy of the query that is limited to `ms` milliseconds
+        (sent as the `TIMEOUT` argument of `FT.SEARCH`).
+
+        `on_timeout` is the policy used when the query times out:
+        `"partial"` returns the results fetched so far, `"raise"` raises
+        `QueryTimeoutError` and a callable is called with the query
+        to return fallback results.
+        """
+        return self.copy(query_timeout=ms, on_timeout=on_timeout)
+
+    def get_timeout(self) -> Union[int, None]:
+        """
+        Returns the timeout of the query in milliseconds.
+
+        Defaults to `REDIS_SEARCH_QUERY_TIMEOUT` setting, which can be
+        a number or a dictionary of timeouts by document class name
+        (with a `"default"` key for other document classes).
+        """
+        if self.query_timeout is not None:
+            return self.query_timeout
+
+        config = getattr(settings, "REDIS_SEARCH_QUERY_TIMEOUT", None)
+
+        if isinstance(config, dict):
+            return config.get(self.model.__name__, config.get("default"))
+        return config
+
+    def get_timeout_policy(self) -> Union[str, Callable[..., Any]]:
+        """
+        Returns the on timeout policy of the query.
+
+        Defaults to `REDIS_SEARCH_QUERY_TIMEOUT_POLICY` setting, a policy name
+        or the import path of a fallback function.
+        """
+        policy = self.on_timeout
+
+        if policy is None:
+            policy = getattr(
+                settings, "REDIS_SEARCH_QUERY_TIMEOUT_POLICY", TIMEOUT_PARTIAL
+            )
+
+        if isinstance(policy, str) and policy not in (TIMEOUT_PARTIAL, TIMEOUT_RAISE):
+            return import_string(policy)
+        return policy
+
+    def get_timeout_args(self) -> List[Any]:
+        """Returns the `TIMEOUT` arguments of the query"""
+        timeout = self.get_timeout()
+        return [] if timeout is None else ["TIMEOUT", timeout]
+
+    def is_timed_out(self, elapsed: float) -> bool:
+        """
+        Returns True if a request that took `elapsed` seconds exceeded the timeout,
+        in which case RediSearch may have returned partial results.
+        """
+        timeout = self.get_timeout()
+        return timeout is not None and elapsed * 1000 >= timeout
+
+    def report_timeout(
+        self, elapsed: float, error: Union[Exception, None] = None
+    ) -> None:
+        """Reports a timed out query using the `query_timed_out` signal"""
+        query_timed_out.send(
+            sender=self.model,
+            query=self,
+            timeout=self.get_timeout(),
+            elapsed=elapsed,
+            error=error,
+        )
+
+    def handle_timeout(self, elapsed: float, error: Exception) -> Any:
+        """
+        Reports a query that RediSearch failed with a timeout error
+        and returns the results of the on timeout policy.
+        """
+        timeout = self.get_timeout()
+        self.report_timeout(elapsed, error)
+        policy = self.get_timeout_policy()
+
+        if policy == TIMEOUT_RAISE:
+            raise QueryTimeoutError(
+                f"Search query on {self.model.Meta.index_name!r} "
+                f"exceeded the timeout of {timeout}ms"
+            ) from error
+
+        if callable(policy):
+            return policy(self)
+        return self._model_cache
+
+    def only(self, *fields: str) -> "RediSearchQuery":
+        """
+        Returns a copy of the query that only fetches the given fields.
+
+        The results are partial documents that are built without validation,
+        so accessing a field that was not fetched raises `AttributeError`.
+        """
+        for field_name in fields:
+            if field_name not in self.model.__fields__:
+                raise ValueError(
+                    f"{field_name!r} is not a field of {self.model.__name__}"
+                )
+
+        only_fields = ["pk"]
+        only_fields += [name for name in fields if name not in only_fields]
+        return self.copy(only_fields=only_fields)
+
+    def defer(self, *fields: str) -> "RediSearchQuery":
+        """Returns a copy of the query that fetches all fields except the given ones"""
+        for field_name in fields:
+            if field_name not in self.model.__fields__:
+                raise ValueError(
+                    f"{field_name!r} is not a field of {self.model.__name__}"
+                )
+
+        field_names = self.only_fields or list(self.model.__fields__)
+        return self.only(*[name for name in field_names if name not in fields])
+
+    def values(self, *fields: str) -> "RediSearchQuery":
+        """
+        Returns a copy of the query whose results are dictionaries
+        of the given fields (or all fields) instead of documents.
+
+        Values are decoded from the reply as JSON (or as strings and numbers
+        for Hash documents) without building or validating documents.
+        """
+        query = self.only(*fields) if fields else self
+        return query.copy(values_format="dict", values_fields=list(fields))
+
+    def values_list(self, *fields: str, flat: bool = False) -> "RediSearchQuery":
+        """
+        Returns a copy of the query whose results are tuples
+        of the given fields (or all fields) instead of documents.
+
+        If `flat` is True, the results are the values of the single field.
+        """
+        if flat and len(fields) != 1:
+            raise TypeError(
+                "'flat' is not valid when values_list is called "
+                "with more or less than one field."
+            )
+
+        query = self.only(*fields) if fields else self
+        return query.copy(
+            values_format="flat" if flat else "tuple",
+            values_fields=list(fields or self.model.__fields__),
+        )
+
+    def get_return_args(self) -> List[Any]:
+        """
+        Returns the `RETURN` arguments of `only_fields`.
+
+        JSON documents use JSONPath aliases so that the results
+        contain the same field names as the document.
+        """
+        if not issubclass(self.model, JsonModel):
+            return ["RETURN", len(self.only_fields), *self.only_fields]
+
+        args: List[Any] = []
+
+        for field_name in self.only_fields:
+            args += [f"$.{field_name}", "AS", field_name]
+
+        return ["RETURN", len(args), *args]
+
+    def from_redis(self, raw_result: List[Any]) -> List[RedisModel]:
+        """Builds the documents (or partial documents) from a `FT.SEARCH` reply"""
+        return [
+            self.parse_hit(fields) for fields in raw_result[2::2] if fields is not None
+        ]
+
+    def parse_hit(self, fields: List[Any]) -> RedisModel:
+        """
+        Builds the document (or partial document) from the fields of a hit.
+
+        Override this method in a custom query class to change how hits are parsed.
+        """
+        data = dict(zip(map(to_string, fields[::2]), map(to_string, fields[1::2])))
+
+        if self.values_format:
+            return self.build_values(data)
+
+        if self.only_fields:
+            return self.build_partial_document(data)
+
+        # `$` is the value of a JSON document
+        if data.get("$"):
+            return self.model(**json.loads(data.pop("$")))
+        return self.model(**data)
+
+    def build_values(self, data: Dict[str, Any]) -> Any:
+        """Builds the `values()` / `values_list()` result of the fields of a hit"""
+        if data.get("$"):
+            document = json_loads(data["$"])
+        else:
+            document = {
+                field_name: self.decode_value(field_name, value)
+                for field_name, value in data.items()
+            }
+
+        if self.values_format == "flat":
+            return document.get(self.values_fields[0])
+
+        if self.values_format == "tuple":
+            return tuple(document.get(field_name) for field_name in self.values_fields)
+
+        if self.values_fields:
+            return {
+                field_name: document.get(field_name)
+                for field_name in self.values_fields
+            }
+        return document
+
+    def decode_value(self, field_name: str, value: Any) -> Any:
+        """Decodes a returned field value without validation"""
+        field = self.model.__fields__.get(field_name)
+
+        if field is None or field.type_ is str or not isinstance(value, str):
+            return value
+
+        # JSONPath values of non string fields are returned as JSON,
+        # Hash values are strings so only numbers are decoded.
+        if issubclass(self.model, JsonModel) or (field.type_ in (int, float, Decimal)):
+            try:
+                return json_loads(value)
+            except ValueError:
+                return value
+
+        return value
+
+    def build_partial_document(self, data: Dict[str, Any]) -> RedisModel:
+        """Builds a partial document from the returned fields without validation"""
+        values: Dict[str, Any] = {}
+
+        for field_name, value in data.items():
+            field = self.model.__fields__.get(field_name)
+
+            if field is None:
+                continue
+
+            # JSONPath values of non string fields are returned as JSON
+            if isinstance(value, str) and field.type_ is not str:
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass
+
+            validated_value, errors = field.validate(value, values, loc=field_name)
+            values[field_name] = value if errors else validated_value
+
+        # Unlike `construct()`, the defaults of the fields that were not fetched
+        # are not set, so reading them raises `AttributeError`.
+        document_class = get_partial_document_class(self.model)
+        document = object.__new__(document_class)
+        object.__setattr__(document, "__dict__", values)
+        object.__setattr__(document, "__fields_set__", set(values))
+        document._init_private_attributes()
+        return document
 
     def copy(self, **kwargs: Any) -> "RediSearchQuery":
-        """ "Returns a copy of the class"""
-        original = self.dict()
-        original.update(**kwargs)
-        return self.__class__(**original)
+        """
+        Returns a shallow copy of the query with the given arguments changed.
+
+        The resolved query, its parameters and pagination are reused
+        unless the arguments they depend on are changed.
+        The copy starts with an empty result cache.
+        """
+        unknown = [name for name in kwargs if name not in self.__dict__]
+
+        if unknown:
+            raise TypeError(f"Unexpected arguments: {', '.join(sorted(unknown))}")
+
+        if "model" in kwargs:
+            return self.__class__(**{**self.dict(), **kwargs})
+
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.expressions = list(self.expressions)
+        clone.sort_fields = list(self.sort_fields)
+        clone.only_fields = list(self.only_fields)
+
+        for name, value in kwargs.items():
+            if name == "sort_fields":
+                value = self.validate_sort_fields(value) if value else []
+            elif name in ("expressions", "only_fields"):
+                value = list(value or [])
+            setattr(clone, name, value)
+
+        if "expressions" in kwargs:
+            clone._expression = None
+            clone._query = None
+            clone._query_params = {}
+
+        if "offset" in kwargs or "limit" in kwargs:
+            clone._pagination = []
+
+        clone._prefetched_results = {}
+        clone._model_cache = RediSearchResult(
+            results=[],
+            hit_count=0,
+            django_model=clone.django_model,
+            values_format=clone.values_format,
+        )
+        clone._executed = False
+        return clone
 
     def paginate(self, offset: int = 0, limit: int = 100) -> None:
         """Paginates the results."""
         self.offset = offset
         self.limit = limit
+        # Resolve the `LIMIT` arguments again on the next request
+        self._pagination: List[str] = []
 
-    def execute(self, exhaust_results: bool = True) -> RediSearchResult:
-        """Executes the search query and returns a RediSearchResult"""
-        args = ["ft.search", self.model.Meta.index_name, self.query, *self.pagination]
+    def get_search_args(
+        self, offset: Union[int, None] = None, limit: Union[int, None] = None
+    ) -> List[Any]:
+        """Returns the `FT.SEARCH` command arguments of the query"""
+        if offset is None and limit is None:
+            pagination = self.pagination
+        else:
+            pagination = [
+                "LIMIT",
+                self.offset if offset is None else offset,
+                self.limit if limit is None else limit,
+            ]
+
+        args = ["ft.search", self.model.Meta.index_name, self.query, *pagination]
 
         if self.sort_fields:
             args += self.resolve_redisearch_sort_fields()
 
+        if self.nocontent:
+            args.append("NOCONTENT")
+        elif self.only_fields:
+            args += self.get_return_args()
+
+        return args + self.get_timeout_args() + self.get_params_args()
+
+    def get_exhaust_page_size(self, remaining: int) -> int:
+        """
+        Returns the page size used to fetch the remaining results.
+
+        Larger pages are used so that fewer commands are sent to Redis,
+        but the page size is never smaller than `page_size`.
+        """
+        max_page_size = getattr(settings, "REDIS_SEARCH_EXHAUST_PAGE_SIZE", 1000)
+        return max(self.page_size, min(remaining, max_page_size))
+
+    def fetch_remaining(self, offset: int, hit_count: int) -> List[RedisModel]:
+        """
+        Fetches the results from `offset` to `hit_count`.
+
+        All page requests are sent to Redis in a single pipeline.
+        """
+        results: List[RedisModel] = []
+
+        for raw_result in self.fetch_remaining_raw(offset, hit_count):
+            results += self.from_redis(raw_result)
+
+        return results
+
+    def fetch_remaining_raw(self, offset: int, hit_count: int) -> List[Any]:
+        """
+        Fetches the raw `FT.SEARCH` replies from `offset` to `hit_count`.
+
+        All page requests are sent to Redis in a single pipeline,
+        the replies are not cached if the pipeline exceeded the timeout.
+        """
+        timed_out = False
+
+        def fetch(commands: List[List[Any]]) -> List[Any]:
+            nonlocal timed_out
+            start = time.monotonic()
+            replies = self.send_pipeline(commands)
+            timed_out = self.is_timed_out(time.monotonic() - start)
+            return replies
+
+        return get_cached_replies(
+            self.model.Meta.index_name,
+            self.get_remaining_search_args(offset, hit_count),
+            fetch,
+            is_cacheable=lambda reply: not timed_out,
+        )
+
+    def send_pipeline(self, commands: List[List[Any]]) -> List[Any]:
+        """Sends the commands to Redis in a single pipeline"""
+        pipeline = self.model.db().pipeline(transaction=False)
+
+        for args in commands:
+            pipeline.execute_command(*args)
+
+        return pipeline.execute()
+
+    async def afetch_remaining_raw(self, offset: int, hit_count: int) -> List[Any]:
+        """Asynchronous version of `fetch_remaining_raw()`"""
+        timed_out = False
+
+        async def fetch(commands: List[List[Any]]) -> List[Any]:
+            nonlocal timed_out
+            start = time.monotonic()
+            pipeline = get_async_redis_connection().pipeline(transaction=False)
+
+            for args in commands:
+                pipeline.execute_command(*args)
+
+            replies = await pipeline.execute()
+            timed_out = self.is_timed_out(time.monotonic() - start)
+            return replies
+
+        return await aget_cached_replies(
+            self.model.Meta.index_name,
+            self.get_remaining_search_args(offset, hit_count),
+            fetch,
+            is_cacheable=lambda reply: not timed_out,
+        )
+
+    def get_remaining_search_args(self, offset: int, hit_count: int) -> List[Any]:
+        """Returns the `FT.SEARCH` arguments of each remaining page"""
+        page_size = self.get_exhaust_page_size(hit_count - offset)
+        return [
+            self.get_search_args(offset=page_offset, limit=page_size)
+            for page_offset in range(offset, hit_count, page_size)
+        ]
+
+    def iterator(self, chunk_size: int = 1000) -> Generator[RedisModel, None, None]:
+        """
+        Yields the search results page by page.
+
+        Only one page of `chunk_size` results is kept in memory at a time
+        and the results are not stored in the cache.
+        """
+        offset = self.offset
+
+        while True:
+            raw_result = self.model.db().execute_command(
+                *self.get_search_args(offset=offset, limit=chunk_size)
+            )
+            returned = get_reply_size(raw_result)
+
+            yield from self.from_redis(raw_result)
+
+            # Expired hits are skipped but still move the offset forward
+            offset += returned
+
+            if not returned or offset >= raw_result[0]:
+                break
+
+    def get_scan_load_args(self) -> List[Any]:
+        """Returns the `LOAD` arguments needed to build the documents"""
+        if self.only_fields:
+            # Same field names as the `RETURN` arguments of `get_return_args()`
+            if issubclass(self.model, JsonModel):
+                args: List[Any] = []
+
+                for field_name in self.only_fields:
+                    args += [f"$.{field_name}", "AS", field_name]
+            else:
+                args = [f"@{field_name}" for field_name in self.only_fields]
+
+            return ["LOAD", len(args), *args]
+
+        if issubclass(self.model, JsonModel):
+            return ["LOAD", 1, "$"]
+        return ["LOAD", "*"]
+
+    def get_scan_args(self, count: int) -> List[Any]:
+        """Returns the `FT.AGGREGATE` command arguments used by `scan()`"""
+        args = [
+            "ft.aggregate",
+            self.model.Meta.index_name,
+            self.query,
+            *self.get_scan_load_args(),
+        ]
+
+        if self.sort_fields:
+            sort_fields = self.resolve_redisearch_sort_fields()[1:]
+            args += [
+                "SORTBY",
+                len(sort_fields),
+                *[
+                    f"@{value}" if position % 2 == 0 else value.upper()
+                    for position, value in enumerate(sort_fields)
+                ],
+            ]
+
+        return args + self.get_params_args() + ["WITHCURSOR", "COUNT", count]
+
+    def scan(self, count: int = 1000) -> Generator[RedisModel, None, None]:
+        """
+        Yields all search results using a RediSearch cursor.
+
+        Unlike offset pagination, each page costs the same no matter how deep
+        the scan goes and the results are not limited by `MAXSEARCHRESULTS`.
+        The cursor is deleted if the generator is closed before it is exhausted.
+        """
+        db = self.model.db()
+        index_name = self.model.Meta.index_name
+        raw_result, cursor_id = db.execute_command(*self.get_scan_args(count))
+
+        try:
+            while True:
+                rows = raw_result[1:]
+                # Aggregation rows do not include the document keys,
+                # use the same format as `FT.SEARCH` to build the documents
+                # (or the `only()` / `values()` results).
+                yield from self.from_redis(
+                    [len(rows), *chain.from_iterable((None, row) for row in rows)]
+                )
+
+                if not cursor_id:
+                    break
+
+                raw_result, cursor_id = db.execute_command(
+                    "ft.cursor", "READ", index_name, cursor_id, "COUNT", count
+                )
+        finally:
+            if cursor_id:
+                try:
+                    db.execute_command("ft.cursor", "DEL", index_name, cursor_id)
+                except ResponseError:
+                    # The cursor may already be expired
+                    pass
+
+    def execute(self, exhaust_results: bool = True) -> RediSearchResult:
+        """
+        Executes the search query and returns a RediSearchResult
+
+        If RediSearch fails with a timeout error (see `timeout()`),
+        the result of the on timeout policy is returned.
+        """
+        start = time.monotonic()
+
+        try:
+            timed_out = self.fetch_results(exhaust_results)
+        except ResponseError as error:
+            if not is_timeout_error(error):
+                raise
+            return self.handle_timeout(time.monotonic() - start, error)
+
+        if timed_out:
+            self.report_timeout(time.monotonic() - start)
+        return self._model_cache
+
+    def fetch_results(self, exhaust_results: bool = True) -> bool:
+        """
+        Fetches the search results to the cache.
+
+        Returns True if the first request exceeded the timeout. RediSearch
+        may have returned partial results, so the reply is not cached,
+        but the remaining pages are still fetched.
+        """
+        args = self.get_search_args()
+
         # Reset the cache if we're executing from offset 0.
         if self.offset == 0:
             self._model_cache.clear()
 
         # If the offset is greater than 0, we're paginating through a result set,
         # so append the new results to results already in the cache.
-        raw_result = self.model.db().execute_command(*args)
-        count = raw_result[0]
-        results = self.model.from_redis(raw_result)
-        # Update the cache with the new results.
-        self._model_cache.add(results)
-        self._model_cache.hit_count = count
+        raw_result = self.pop_prefetched_result(args)
 
-        if not exhaust_results:
-            return self._model_cache
+        timed_out = False
+
+        def fetch() -> List[Any]:
+            nonlocal timed_out
+            start = time.monotonic()
+            reply = self.model.db().execute_command(*args)
+            timed_out = self.is_timed_out(time.monotonic() - start)
+            return reply
+
+        if raw_result is None:
+            raw_result = get_cached_reply(
+                self.model.Meta.index_name,
+                args,
+                fetch,
+                is_cacheable=lambda reply: not timed_out,
+            )
+
+        fetched = self.load_result(raw_result)
+
+        # Now that the hit count is known, fetch all remaining pages
+        # in a single round trip instead of one request per page.
+        if exhaust_results and fetched is not None:
+            for _raw_result in self.fetch_remaining_raw(
+                fetched, self._model_cache.hit_count
+            ):
+                self._model_cache.add_raw(_raw_result, self.parse_hit)
 
-        # The query returned all results, so we have no more work to do.
-        if count <= len(results):
+        return timed_out
+
+    async def aexecute(self, exhaust_results: bool = True) -> RediSearchResult:
+        """Asynchronous version of `execute()`"""
+        start = time.monotonic()
+
+        try:
+            timed_out = await self.afetch_results(exhaust_results)
+        except ResponseError as error:
+            if not is_timeout_error(error):
+                raise
+            result = self.handle_timeout(time.monotonic() - start, error)
+        else:
+            if timed_out:
+                self.report_timeout(time.monotonic() - start)
             return self._model_cache
 
-        # Transparently (to the user) make subsequent requests to paginate
-        # through the results and finally return them all.
-        query = self
-        while True:
-            # Make a query for each pass of the loop, with a new offset equal to the
-            # current offset plus `page_size`, until we stop getting results back.
-            query = query.copy(offset=query.offset + query.page_size)
-            _results = query.execute(exhaust_results=False)
-            if not _results:
-                break
-            self._model_cache.add(_results)
+        # Fallback functions of async queries can be coroutines
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
-        return self._model_cache
+    async def afetch_results(self, exhaust_results: bool = True) -> bool:
+        """Asynchronous version of `fetch_results()`"""
+        args = self.get_search_args()
+
+        if self.offset == 0:
+            self._model_cache.clear()
+
+        raw_result = self.pop_prefetched_result(args)
+        timed_out = False
+
+        async def fetch() -> List[Any]:
+            nonlocal timed_out
+            start = time.monotonic()
+            reply = await get_async_redis_connection().execute_command(*args)
+            timed_out = self.is_timed_out(time.monotonic() - start)
+            return reply
+
+        if raw_result is None:
+            raw_result = await aget_cached_reply(
+                self.model.Meta.index_name,
+                args,
+                fetch,
+                is_cacheable=lambda reply: not timed_out,
+            )
+
+        fetched = self.load_result(raw_result)
+
+        if exhaust_results and fetched is not None:
+            for _raw_result in await self.afetch_remaining_raw(
+                fetched, self._model_cache.hit_count
+            ):
+                self._model_cache.add_raw(_raw_result, self.parse_hit)
+
+        return timed_out
+
+    def add_prefetched_result(self, args: List[Any], raw_result: List[Any]) -> None:
+        """
+        Adds a raw `FT.SEARCH` reply that was fetched in advance (e.g: in a pipeline).
+
+        The reply is used instead of sending the command when the query
+        is executed with the same command arguments.
+        """
+        self._prefetched_results[tuple(args)] = raw_result
+
+    def has_prefetched_result(self, args: List[Any]) -> bool:
+        """Returns True if a reply of the command arguments was fetched in advance"""
+        return tuple(args) in self._prefetched_results
+
+    def pop_prefetched_result(self, args: List[Any]) -> Union[List[Any], None]:
+        """Removes and returns the prefetched reply of the command arguments"""
+        return self._prefetched_results.pop(tuple(args), None)
+
+    def load_result(self, raw_result: List[Any]) -> Union[int, None]:
+        """
+        Adds the results of a `FT.SEARCH` reply to the cache.
+
+        Returns the offset of the remaining results or `None`
+        if the query returned all results.
+        """
+        count = raw_result[0]
+        # Update the cache with the new results, hits are parsed on first access.
+        self._model_cache.add_raw(raw_result, self.parse_hit)
+        self._model_cache.hit_count = count
+        self._executed = True
+
+        # Hits that expired before they were loaded are not added to the cache,
+        # but they still take a place in the results of the index.
+        returned = get_reply_size(raw_result)
+        fetched = self.offset + returned
+
+        if not returned or count <= fetched:
+            return None
+        return fetched
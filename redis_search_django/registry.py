@@ -1,13 +1,37 @@
+import logging
+import threading
+import time
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Set, Type, Union
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from django.conf import settings
 from django.db import models
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from .result_cache import bump_generation
 
 if TYPE_CHECKING:
     from .documents import Document
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class DocumentRegistry:
@@ -20,6 +44,9 @@ class DocumentRegistry:
         """Initialize the registry."""
         self.django_model_map = defaultdict(set)
         self.related_django_model_map = defaultdict(set)
+        # Thread local state used by `deferred()`
+        self._local = threading.local()
+        self._circuit_breaker: Union[CircuitBreaker, None] = None
 
     def register(self, document_class: Type["Document"]) -> None:
         """Register a Document class."""
@@ -33,6 +60,12 @@ class DocumentRegistry:
         if not getattr(settings, "REDIS_SEARCH_AUTO_INDEX", True):
             return
 
+        if self.is_deferred:
+            self.mark_dirty(
+                model_object.__class__, [model_object.pk], model_object._state.db
+            )
+            return
+
         document_classes = self.django_model_map.get(model_object.__class__, set())
 
         for document_class in document_classes:
@@ -41,7 +74,15 @@ class DocumentRegistry:
                 continue
 
             # Try to Update the Document if not object is created.
-            document_class.update_from_model_instance(model_object, create=create)
+            self.run_index_operation(
+                document_class,
+                partial(
+                    document_class.update_from_model_instance,
+                    model_object,
+                    create=create,
+                ),
+                [model_object.pk],
+            )
 
     def update_related_documents(
         self,
@@ -61,15 +102,130 @@ class DocumentRegistry:
             if not document_class._django.auto_index:
                 continue
 
-            document_class.update_from_related_model_instance(
-                model_object, exclude=exclude
+            if self.is_deferred:
+                # Related objects may not exist anymore when the deferred
+                # documents are indexed, so the affected pks are collected now.
+                self.mark_dirty(
+                    document_class._django.model,
+                    document_class.get_related_pks(model_object),
+                    model_object._state.db,
+                )
+                continue
+
+            self.run_index_operation(
+                document_class,
+                partial(
+                    document_class.update_from_related_model_instance,
+                    model_object,
+                    exclude=exclude,
+                ),
+                partial(document_class.get_related_pks, model_object),
             )
 
+    def update_m2m_documents(
+        self,
+        model_object: models.Model,
+        through: Type[models.Model],
+        related_model: Type[models.Model],
+        pk_set: Union[Set[Any], None],
+        reverse: Union[bool, None] = None,
+    ) -> None:
+        """
+        Update documents affected by a change of a many-to-many relation.
+
+        Only the embedded list of the changed relation is updated
+        for the documents of `model_object` and of the objects in `pk_set`.
+        """
+        if not getattr(settings, "REDIS_SEARCH_AUTO_INDEX", True):
+            return
+
+        field_name, related_field_name = get_m2m_field_names(
+            model_object.__class__, through, reverse
+        )
+        related_objects = (
+            related_model._default_manager.filter(pk__in=pk_set).prefetch_related(
+                related_field_name
+            )
+            if pk_set
+            else related_model._default_manager.none()
+        )
+
+        if self.is_deferred:
+            using = model_object._state.db
+            self.mark_dirty(model_object.__class__, [model_object.pk], using)
+            self.mark_dirty(related_model, pk_set or [], using)
+
+        for model, objects, name in (
+            (model_object.__class__, [model_object], field_name),
+            (related_model, related_objects, related_field_name),
+        ):
+            for document_class in self.django_model_map.get(model, set()):
+                if not document_class._django.auto_index or self.is_deferred:
+                    continue
+
+                self.run_index_operation(
+                    document_class,
+                    partial(document_class.update_related_field, objects, name),
+                    partial(get_pks, objects),
+                )
+
+            # Documents where the changed object is embedded
+            # only need to be updated if the relation is embedded as well.
+            for document_class in self.related_django_model_map.get(model, set()):
+                if not document_class._django.auto_index:
+                    continue
+
+                if document_class.has_embedded_field(model, name):
+                    for obj in objects:
+                        if self.is_deferred:
+                            self.mark_dirty(
+                                document_class._django.model,
+                                document_class.get_related_pks(obj),
+                                model_object._state.db,
+                            )
+                        else:
+                            self.run_index_operation(
+                                document_class,
+                                partial(
+                                    document_class.update_from_related_model_instance,
+                                    obj,
+                                ),
+                                partial(document_class.get_related_pks, obj),
+                            )
+
+    def get_m2m_related_pks(
+        self,
+        model_object: models.Model,
+        through: Type[models.Model],
+        reverse: Union[bool, None] = None,
+    ) -> Set[Any]:
+        """Get primary keys of the objects related through a many-to-many relation."""
+        if not getattr(settings, "REDIS_SEARCH_AUTO_INDEX", True):
+            return set()
+
+        field_name, _ = get_m2m_field_names(model_object.__class__, through, reverse)
+        related_manager = getattr(model_object, field_name)
+
+        # Skip the query if the related objects are not indexed at all.
+        if not (
+            self.django_model_map.get(related_manager.model)
+            or self.related_django_model_map.get(related_manager.model)
+        ):
+            return set()
+
+        return set(related_manager.values_list("pk", flat=True))
+
     def remove_document(self, model_object: models.Model) -> None:
         """Remove document of a specific model."""
         if not getattr(settings, "REDIS_SEARCH_AUTO_INDEX", True):
             return
 
+        if self.is_deferred:
+            self.mark_dirty(
+                model_object.__class__, [model_object.pk], model_object._state.db
+            )
+            return
+
         document_classes = self.django_model_map.get(model_object.__class__, set())
 
         for document_class in document_classes:
@@ -78,7 +234,11 @@ class DocumentRegistry:
                 continue
 
             # Try to Delete the Document from Redis Index.
-            document_class.delete(model_object.pk)
+            self.run_index_operation(
+                document_class,
+                partial(document_class.delete, model_object.pk),
+                [model_object.pk],
+            )
 
     def index_documents(self, models: Union[List[str], None] = None) -> None:
         """Index documents for all or specific registered Django models."""
@@ -87,11 +247,286 @@ class DocumentRegistry:
             document_classes,
         ) in self.django_model_map.items():
             for document_class in document_classes:
-                if models:
-                    if django_model._meta.label in models:
-                        document_class.index_all()
-                else:
+                if models and django_model._meta.label not in models:
+                    continue
+
+                try:
                     document_class.index_all()
+                finally:
+                    bump_generation(document_class._meta.index_name)
+
+    def run_index_operation(
+        self,
+        document_class: Type["Document"],
+        operation: Callable[[], Any],
+        pks: Union[Iterable[Any], Callable[[], Iterable[Any]]],
+    ) -> None:
+        """
+        Run an index operation of a Document class.
+
+        If the dead letter queue is enabled, instead of raising the error
+        primary keys of the failed operation are added to the queue
+        to be retried later.
+
+        If the circuit breaker is enabled, operations are skipped while
+        the circuit is open and primary keys of the skipped operations
+        or of operations that failed because Redis is unavailable
+        are handed off to be indexed by a worker (see `defer_skipped()`).
+
+        Cached search results of the index are invalidated
+        after every operation that was run.
+        """
+        django_model = document_class._django.model
+        circuit_breaker = self.circuit_breaker
+
+        if circuit_breaker and not circuit_breaker.allow():
+            self.defer_skipped(django_model, resolve_pks(pks))
+            return
+
+        start = time.monotonic()
+
+        try:
+            operation()
+        except Exception as error:
+            # The operation may have partially updated the index
+            bump_generation(document_class._meta.index_name)
+            # Only count errors of an unavailable Redis server as failures,
+            # other errors (e.g: validation errors) do not open the circuit.
+            is_unavailable = isinstance(
+                error, (RedisConnectionError, RedisTimeoutError)
+            )
+
+            if circuit_breaker:
+                if is_unavailable:
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.release()
+
+            if self.use_dead_letter_queue:
+                from .dead_letter import dead_letter_queue
+
+                logger.exception(
+                    "Failed to index '%s' document, "
+                    "adding it to the dead letter queue",
+                    document_class.__name__,
+                )
+                dead_letter_queue.push(django_model, resolve_pks(pks), error)
+            elif circuit_breaker and is_unavailable:
+                logger.exception(
+                    "Failed to index '%s' document, "
+                    "it will be indexed when the circuit breaker is closed",
+                    document_class.__name__,
+                )
+                self.defer_skipped(django_model, resolve_pks(pks))
+            else:
+                raise
+            return
+
+        bump_generation(document_class._meta.index_name)
+
+        if circuit_breaker and circuit_breaker.record_success(time.monotonic() - start):
+            self.reconcile()
+
+    def defer_skipped(self, model: Type[models.Model], pks: Iterable[Any]) -> None:
+        """
+        Record primary keys skipped by the circuit breaker.
+
+        If the outbox is enabled (`REDIS_SEARCH_AUTO_INDEX_OUTBOX`), they are
+        stored in the outbox table (indexed by `search_outbox_drain`),
+        otherwise they are kept in memory until the circuit is closed
+        (see `reconcile()`).
+        """
+        if self.use_outbox:
+            from .outbox.models import IndexOutbox
+
+            IndexOutbox.objects.add(model, pks)
+            return
+
+        if self.circuit_breaker:
+            self.circuit_breaker.mark_dirty(model, pks)
+
+    def reconcile(self) -> None:
+        """
+        Index documents skipped while the circuit breaker was open.
+
+        If the dead letter queue is enabled, the primary keys are added to
+        the queue (a single Redis pipeline), so they are indexed by the
+        `search_dead_letter` worker instead of inside the request.
+        Otherwise they are indexed in bulk.
+        """
+        circuit_breaker = self.circuit_breaker
+
+        if not circuit_breaker:
+            return
+
+        dirty = circuit_breaker.pop_dirty()
+
+        if not dirty:
+            return
+
+        if not self.use_dead_letter_queue:
+            try:
+                self.index_dirty(dirty)
+            except (RedisConnectionError, RedisTimeoutError):
+                logger.exception(
+                    "Failed to index documents skipped by the circuit breaker"
+                )
+                # Keep the primary keys until the next time the circuit is closed
+                for django_model, pks in dirty.items():
+                    circuit_breaker.mark_dirty(django_model, pks)
+            return
+
+        from .dead_letter import dead_letter_queue
+
+        for django_model, pks in dirty.items():
+            if not dead_letter_queue.push(
+                django_model,
+                pks,
+                CircuitBreakerOpenError("Skipped by the circuit breaker"),
+            ):
+                # Keep the primary keys until the next time the circuit is closed
+                circuit_breaker.mark_dirty(django_model, pks)
+
+    @property
+    def circuit_breaker(self) -> Union[CircuitBreaker, None]:
+        """Circuit breaker configured by `REDIS_SEARCH_CIRCUIT_BREAKER` setting."""
+        config = getattr(settings, "REDIS_SEARCH_CIRCUIT_BREAKER", None)
+
+        if not config:
+            return None
+
+        if self._circuit_breaker is None:
+            self._circuit_breaker = CircuitBreaker(
+                **(config if isinstance(config, dict) else {})
+            )
+        return self._circuit_breaker
+
+    @property
+    def use_dead_letter_queue(self) -> bool:
+        """Returns True if failed index operations are added to dead letter queue."""
+        return getattr(settings, "REDIS_SEARCH_DEAD_LETTER_QUEUE", False)
+
+    @property
+    def is_deferred(self) -> bool:
+        """Returns True if documents are not indexed synchronously."""
+        return self._dirty is not None or self.use_outbox
+
+    @property
+    def use_outbox(self) -> bool:
+        """Returns True if documents are indexed using the outbox table."""
+        return getattr(settings, "REDIS_SEARCH_AUTO_INDEX_OUTBOX", False)
+
+    @property
+    def _dirty(self) -> Union[Dict[Type[models.Model], Set[Any]], None]:
+        """Primary keys recorded by `deferred()` in the current thread."""
+        return getattr(self._local, "dirty", None)
+
+    def mark_dirty(
+        self,
+        model: Type[models.Model],
+        pks: Iterable[Any],
+        using: Union[str, None] = None,
+    ) -> None:
+        """
+        Record primary keys of a model that need to be indexed.
+
+        `using` is the database alias of the change, outbox entries
+        are written to it (in the same transaction as the change).
+        """
+        # Skip models that do not have any Document classes.
+        if model not in self.django_model_map:
+            return
+
+        if self._dirty is not None:
+            self._dirty[model].update(pks)
+        elif self.use_outbox:
+            from .outbox.models import IndexOutbox
+
+            IndexOutbox.objects.add(model, pks, using=using)
+
+    @contextmanager
+    def deferred(self, chunk_size: int = 2000) -> Iterator[None]:
+        """
+        Defer auto indexing in the current thread until the context exits.
+
+        Primary keys of the affected model instances are recorded
+        and only those instances are indexed in bulk on exit.
+        Nested contexts are indexed when the outermost context exits.
+        """
+        if self._dirty is not None:
+            yield
+            return
+
+        self._local.dirty = defaultdict(set)
+
+        try:
+            yield
+        finally:
+            dirty = self._local.dirty
+            self._local.dirty = None
+            self.index_dirty(dirty, chunk_size=chunk_size)
+
+    def index_dirty(
+        self,
+        dirty: Dict[Type[models.Model], Set[Any]],
+        chunk_size: int = 2000,
+    ) -> None:
+        """Index documents of the given model instance primary keys."""
+        for django_model, pks in dirty.items():
+            if not pks:
+                continue
+
+            for document_class in self.django_model_map.get(django_model, set()):
+                if not document_class._django.auto_index:
+                    continue
+
+                try:
+                    document_class.index_pks(pks, chunk_size=chunk_size)
+                finally:
+                    bump_generation(document_class._meta.index_name)
+
+
+def get_m2m_field_names(
+    model: Type[models.Model],
+    through: Type[models.Model],
+    reverse: Union[bool, None] = None,
+) -> Tuple[str, str]:
+    """
+    Get the attribute names of both sides of a many-to-many relation.
+
+    Returns a tuple of the attribute name on `model`
+    and the attribute name on the related model.
+    `reverse` is the argument of the `m2m_changed` signal, both sides
+    of a self-referential relation have the same `through` model,
+    so it selects the forward (`False`) or reverse (`True`) side.
+    """
+    for field in model._meta.get_fields():
+        if isinstance(field, models.ManyToManyField):
+            if not reverse and field.remote_field.through == through:
+                # Symmetrical relations do not have a reverse accessor
+                return (
+                    field.name,
+                    field.remote_field.get_accessor_name() or field.name,
+                )
+        elif isinstance(field, models.ManyToManyRel):
+            if reverse is not False and field.through == through:
+                return field.get_accessor_name(), field.field.name
+
+    raise ValueError(
+        f"'{through.__name__}' is not a many-to-many relation of '{model.__name__}'"
+    )
+
+
+def resolve_pks(
+    pks: Union[Iterable[Any], Callable[[], Iterable[Any]]]
+) -> Iterable[Any]:
+    """Get primary keys from an iterable or a callable that returns them."""
+    return pks() if callable(pks) else pks
+
+
+def get_pks(objects: Iterable[models.Model]) -> List[Any]:
+    """Get primary keys of the model instances."""
+    return [obj.pk for obj in objects]
 
 
 document_registry: DocumentRegistry = DocumentRegistry()
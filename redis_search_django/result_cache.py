@@ -0,0 +1,212 @@
+import hashlib
+import json
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Union
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+# Use an in-process LRU cache instead of a Django cache alias
+LOCAL_RESULT_CACHE = "local"
+
+GENERATION_KEY_PREFIX = "redis_search:generation"
+RESULT_KEY_PREFIX = "redis_search:result"
+
+
+@lru_cache(maxsize=None)
+def get_local_cache(max_entries: int) -> LocMemCache:
+    """
+    Returns the in-process LRU cache with the given maximum entries.
+
+    The generation counters are stored in the same cache, so writes
+    only invalidate the cached results of the current process.
+    """
+    return LocMemCache(
+        "redis-search-django-results",
+        {"MAX_ENTRIES": max_entries, "CULL_FREQUENCY": max_entries},
+    )
+
+
+def get_result_cache() -> Union[BaseCache, None]:
+    """
+    Returns the cache used to store search results,
+    or `None` if the result cache is disabled.
+    """
+    alias = getattr(settings, "REDIS_SEARCH_RESULT_CACHE", None)
+
+    if not alias:
+        return None
+
+    if alias == LOCAL_RESULT_CACHE:
+        return get_local_cache(
+            getattr(settings, "REDIS_SEARCH_RESULT_CACHE_MAX_ENTRIES", 1000)
+        )
+    return caches[alias]
+
+
+def get_result_cache_timeout() -> Union[int, None]:
+    """Returns the number of seconds search results are cached for"""
+    return getattr(settings, "REDIS_SEARCH_RESULT_CACHE_TIMEOUT", 60)
+
+
+def get_generation_key(index_name: str) -> str:
+    """Returns the cache key of the generation counter of the index"""
+    return f"{GENERATION_KEY_PREFIX}:{index_name}"
+
+
+def get_generation(cache: BaseCache, index_name: str) -> int:
+    """
+    Returns the current generation of the index.
+
+    A missing counter (e.g: evicted from the cache) is initialized from
+    the current time, so that it never goes back to a previous generation.
+    """
+    key = get_generation_key(index_name)
+    generation = cache.get(key)
+
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key, time.time_ns())
+
+    return generation
+
+
+def bump_generation(index_name: str) -> None:
+    """
+    Invalidates the cached search results of the index
+    by incrementing its generation counter.
+    """
+    cache = get_result_cache()
+
+    if cache is None:
+        return
+
+    try:
+        cache.incr(get_generation_key(index_name))
+    except ValueError:
+        # The counter does not exist (yet), start a new generation
+        cache.set(get_generation_key(index_name), time.time_ns(), timeout=None)
+
+
+def get_result_key(index_name: str, generation: int, command: List[Any]) -> str:
+    """Returns the cache key of the reply of a command"""
+    digest = hashlib.md5(json.dumps(command, default=str).encode("utf-8")).hexdigest()
+    return f"{RESULT_KEY_PREFIX}:{index_name}:{generation}:{digest}"
+
+
+def get_cached_lookup(
+    cache: BaseCache, index_name: str, commands: List[List[Any]]
+) -> Tuple[List[str], Dict[str, Any], List[int]]:
+    """
+    Returns the cache keys of the commands of an index,
+    the cached replies by key and the positions of the missing replies.
+    """
+    generation = get_generation(cache, index_name)
+    keys = [get_result_key(index_name, generation, command) for command in commands]
+    cached = cache.get_many(keys)
+    missing = [index for index, key in enumerate(keys) if key not in cached]
+    return keys, cached, missing
+
+
+def store_replies(
+    cache: BaseCache,
+    fetched: Dict[str, Any],
+    is_cacheable: Union[Callable[[Any], bool], None] = None,
+) -> None:
+    """Stores the fetched replies for which `is_cacheable(reply)` is not False"""
+    cache.set_many(
+        {
+            key: reply
+            for key, reply in fetched.items()
+            if is_cacheable is None or is_cacheable(reply)
+        },
+        timeout=get_result_cache_timeout(),
+    )
+
+
+def get_cached_replies(
+    index_name: str,
+    commands: List[List[Any]],
+    fetch: Callable[[List[List[Any]]], List[Any]],
+    is_cacheable: Union[Callable[[Any], bool], None] = None,
+) -> List[Any]:
+    """
+    Returns the replies of the commands of an index.
+
+    If the result cache is enabled, cached replies of the current
+    generation of the index are returned and only the missing
+    replies are fetched from Redis using `fetch(commands)`.
+    Fetched replies for which `is_cacheable(reply)` returns False
+    (e.g: partial results) are not stored.
+    """
+    cache = get_result_cache()
+
+    if cache is None or not commands:
+        return fetch(commands)
+
+    keys, cached, missing = get_cached_lookup(cache, index_name, commands)
+
+    if missing:
+        replies = fetch([commands[index] for index in missing])
+        fetched = {keys[index]: reply for index, reply in zip(missing, replies)}
+        store_replies(cache, fetched, is_cacheable)
+        cached.update(fetched)
+
+    return [cached[key] for key in keys]
+
+
+def get_cached_reply(
+    index_name: str,
+    command: List[Any],
+    fetch: Callable[[], Any],
+    is_cacheable: Union[Callable[[Any], bool], None] = None,
+) -> Any:
+    """Returns the reply of a single command of an index (see `get_cached_replies`)"""
+    return get_cached_replies(
+        index_name, [command], lambda commands: [fetch()], is_cacheable
+    )[0]
+
+
+async def aget_cached_replies(
+    index_name: str,
+    commands: List[List[Any]],
+    fetch: Callable[[List[List[Any]]], Awaitable[List[Any]]],
+    is_cacheable: Union[Callable[[Any], bool], None] = None,
+) -> List[Any]:
+    """Async version of `get_cached_replies`, awaits `fetch(commands)`"""
+    cache = get_result_cache()
+
+    if cache is None or not commands:
+        return await fetch(commands)
+
+    keys, cached, missing = await sync_to_async(get_cached_lookup)(
+        cache, index_name, commands
+    )
+
+    if missing:
+        replies = await fetch([commands[index] for index in missing])
+        fetched = {keys[index]: reply for index, reply in zip(missing, replies)}
+        await sync_to_async(store_replies)(cache, fetched, is_cacheable)
+        cached.update(fetched)
+
+    return [cached[key] for key in keys]
+
+
+async def aget_cached_reply(
+    index_name: str,
+    command: List[Any],
+    fetch: Callable[[], Awaitable[Any]],
+    is_cacheable: Union[Callable[[Any], bool], None] = None,
+) -> Any:
+    """Async version of `get_cached_reply`, awaits `fetch()`"""
+
+    async def fetch_replies(commands: List[List[Any]]) -> List[Any]:
+        return [await fetch()]
+
+    replies = await aget_cached_replies(
+        index_name, [command], fetch_replies, is_cacheable
+    )
+    return replies[0]
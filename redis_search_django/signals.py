@@ -1,11 +1,21 @@
-from typing import Any, Type
+from typing import Any, Set, Type, Union
 
 from django.conf import settings
 from django.db import models
 from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import Signal
 
 from .registry import document_registry
 
+# Sent when a search query exceeds its timeout, with the `query`,
+# `timeout` (milliseconds), `elapsed` (seconds) and `error` arguments
+# (`error` is None if the request was only slower than the timeout).
+query_timed_out = Signal()
+
+# Instance attribute used to store related object pks between
+# `pre_clear` and `post_clear` actions of `m2m_changed` signal.
+M2M_CLEARED_PKS_ATTRIBUTE = "_redis_search_m2m_cleared_pks"
+
 
 def add_document_to_redis_index(
     sender: Type[models.Model], instance: models.Model, created: bool, **kwargs: Any
@@ -32,14 +42,28 @@ def remove_related_documents_from_redis_index(
 
 
 def update_redis_index_on_m2m_changed(
-    sender: Type[models.Model], instance: models.Model, action: str, **kwargs: Any
+    sender: Type[models.Model],
+    instance: models.Model,
+    action: str,
+    model: Type[models.Model],
+    pk_set: Union[Set[Any], None],
+    reverse: bool = False,
+    **kwargs: Any,
 ) -> None:
     """Signal handler for updating redis index on m2m changed."""
-    if action in ("post_add", "post_remove", "post_clear"):
-        document_registry.update_document(instance, create=True)
-        document_registry.update_related_documents(instance, exclude=None)
-    elif action in ("pre_remove", "pre_clear"):
-        document_registry.update_related_documents(instance, exclude=instance)
+    if action == "pre_clear":
+        # `pk_set` is not provided when a relation is cleared,
+        # so store the related object pks to update them on `post_clear`.
+        instance.__dict__.setdefault(M2M_CLEARED_PKS_ATTRIBUTE, {})[
+            sender
+        ] = document_registry.get_m2m_related_pks(instance, sender, reverse)
+    elif action == "post_clear":
+        cleared_pks = instance.__dict__.get(M2M_CLEARED_PKS_ATTRIBUTE, {})
+        document_registry.update_m2m_documents(
+            instance, sender, model, cleared_pks.pop(sender, None), reverse
+        )
+    elif action in ("post_add", "post_remove"):
+        document_registry.update_m2m_documents(instance, sender, model, pk_set, reverse)
 
 
 # Check if Auto Index is globally turned off using Django settings.
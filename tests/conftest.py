@@ -1,10 +1,12 @@
 import datetime
 import uuid
 from typing import List, Optional
+from unittest import mock
 
 import pytest
 
 from redis_search_django.documents import EmbeddedJsonDocument, JsonDocument
+from redis_search_django.registry import DocumentRegistry
 
 from .models import Category, Product, Tag, Vendor
 
@@ -34,6 +36,17 @@ def document_class():
     return build_document_class
 
 
+@pytest.fixture
+def category_registry():
+    """A registry with a mocked Document class of the `Category` model"""
+    document_class = mock.MagicMock(__name__="CategoryDocument")
+    document_class._django.model = Category
+    document_class._django.related_models = {}
+    registry = DocumentRegistry()
+    registry.register(document_class)
+    return registry, document_class
+
+
 @pytest.fixture(scope="session")
 def nested_document_class(document_class):
     CategoryEmbeddedJsonDocument = document_class(
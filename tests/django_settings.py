@@ -7,6 +7,7 @@ SECRET_KEY = "django-insecure-secret"
 INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "redis_search_django",
+    "redis_search_django.outbox",
     "tests",
 ]
 
@@ -14,7 +15,11 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+    },
+    "other": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "other.sqlite3",
+    },
 }
 
 REDIS_SEARCH_AUTO_INDEX = True
@@ -48,3 +48,16 @@ class Product(models.Model):
 
     def __str__(self) -> str:
         return self.name
+
+
+class Person(models.Model):
+    name = models.CharField(max_length=30)
+    following = models.ManyToManyField(
+        "self", symmetrical=False, related_name="followers", blank=True
+    )
+
+    class Meta:
+        app_label = "tests"
+
+    def __str__(self) -> str:
+        return self.name
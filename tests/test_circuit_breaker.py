@@ -0,0 +1,243 @@
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from redis_search_django.circuit_breaker import CircuitBreaker
+from redis_search_django.outbox.models import IndexOutbox
+
+from .models import Category
+
+
+def test_circuit_breaker_opens_after_failures():
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+    assert circuit_breaker.allow()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+    assert circuit_breaker.allow()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    assert not circuit_breaker.allow()
+    assert circuit_breaker.metrics() == {
+        "state": "open",
+        "consecutive_failures": 2,
+        "calls": 2,
+        "failures": 2,
+        "slow_calls": 0,
+        "skipped_calls": 1,
+        "times_opened": 1,
+        "dirty": 0,
+    }
+
+
+def test_circuit_breaker_success_resets_failures():
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.record_success(0) is False
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+    assert circuit_breaker.consecutive_failures == 1
+
+
+def test_circuit_breaker_slow_calls():
+    circuit_breaker = CircuitBreaker(failure_threshold=2, slow_call_threshold=0.5)
+
+    circuit_breaker.record_success(1)
+    circuit_breaker.record_success(1)
+
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+    assert circuit_breaker.metrics()["slow_calls"] == 2
+
+
+@mock.patch("redis_search_django.circuit_breaker.time.monotonic")
+def test_circuit_breaker_half_open(monotonic):
+    monotonic.return_value = 100
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    circuit_breaker.record_failure()
+
+    monotonic.return_value = 105
+    assert not circuit_breaker.allow()
+
+    monotonic.return_value = 110
+    # Only a single trial call is allowed
+    assert circuit_breaker.allow()
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert not circuit_breaker.allow()
+
+    # Failed trial opens the circuit again
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+    assert circuit_breaker.times_opened == 2
+
+    monotonic.return_value = 120
+    assert circuit_breaker.allow()
+    assert circuit_breaker.record_success(0) is True
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_dirty():
+    circuit_breaker = CircuitBreaker()
+
+    circuit_breaker.mark_dirty(Category, [1, 2])
+    circuit_breaker.mark_dirty(Category, [2, 3])
+
+    assert circuit_breaker.metrics()["dirty"] == 3
+    assert circuit_breaker.pop_dirty() == {Category: {1, 2, 3}}
+    assert circuit_breaker.pop_dirty() == {}
+
+
+def test_circuit_breaker_release():
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.allow()
+    assert not circuit_breaker.allow()
+    circuit_breaker.release()
+
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert circuit_breaker.allow()
+
+
+def test_registry_without_circuit_breaker(category_registry):
+    registry, _ = category_registry
+
+    assert registry.circuit_breaker is None
+
+
+def test_registry_circuit_breaker_config(settings, category_registry):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = {"failure_threshold": 3}
+    registry, _ = category_registry
+
+    assert registry.circuit_breaker is registry.circuit_breaker
+    assert registry.circuit_breaker.failure_threshold == 3
+
+
+def test_registry_with_circuit_breaker(settings, category_registry):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = {"failure_threshold": 2}
+    registry, document_class = category_registry
+    document_class.update_from_model_instance.side_effect = RedisConnectionError
+
+    # Failures do not raise the error
+    registry.update_document(Category(pk=1, name="test"))
+    registry.update_document(Category(pk=2, name="test"))
+
+    assert registry.circuit_breaker.state == CircuitBreaker.OPEN
+    assert document_class.update_from_model_instance.call_count == 2
+
+    # Operations are skipped while the circuit is open
+    registry.update_document(Category(pk=3, name="test"))
+    registry.remove_document(Category(pk=4, name="test"))
+
+    assert document_class.update_from_model_instance.call_count == 2
+    document_class.delete.assert_not_called()
+    assert registry.circuit_breaker.dirty == {Category: {1, 2, 3, 4}}
+
+
+def test_registry_circuit_breaker_ignores_other_errors(settings, category_registry):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = {"failure_threshold": 1}
+    registry, document_class = category_registry
+    document_class.update_from_model_instance.side_effect = ValueError
+
+    with pytest.raises(ValueError):
+        registry.update_document(Category(pk=1, name="test"))
+
+    assert registry.circuit_breaker.state == CircuitBreaker.CLOSED
+    assert registry.circuit_breaker.failures == 0
+
+
+@pytest.mark.django_db
+def test_registry_circuit_breaker_skipped_to_outbox(settings, category_registry):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = {"failure_threshold": 1}
+    settings.REDIS_SEARCH_AUTO_INDEX_OUTBOX = True
+    registry, _ = category_registry
+    registry.circuit_breaker.record_failure()
+
+    registry.defer_skipped(Category, [1])
+
+    assert list(IndexOutbox.objects.values_list("model", "object_pk")) == [
+        ("tests.Category", "1")
+    ]
+    assert registry.circuit_breaker.dirty == {}
+
+
+@pytest.mark.django_db
+def test_registry_circuit_breaker_skipped_without_outbox(settings, category_registry):
+    # The outbox app is installed, but the outbox is not enabled
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = {"failure_threshold": 1}
+    registry, document_class = category_registry
+    registry.circuit_breaker.record_failure()
+
+    registry.update_document(Category(pk=1, name="test"))
+
+    document_class.update_from_model_instance.assert_not_called()
+    assert not IndexOutbox.objects.exists()
+    assert registry.circuit_breaker.dirty == {Category: {1}}
+
+
+@mock.patch("redis_search_django.registry.DocumentRegistry.index_dirty")
+@mock.patch("redis_search_django.dead_letter.dead_letter_queue.push")
+def test_registry_circuit_breaker_reconcile(
+    push, index_dirty, settings, category_registry
+):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = {"failure_threshold": 1}
+    settings.REDIS_SEARCH_DEAD_LETTER_QUEUE = True
+    registry, document_class = category_registry
+    registry.circuit_breaker.record_failure()
+    registry.circuit_breaker.mark_dirty(Category, [1])
+    registry.circuit_breaker.opened_at = 0
+
+    registry.update_document(Category(pk=2, name="test"))
+
+    document_class.update_from_model_instance.assert_called_once()
+    assert registry.circuit_breaker.state == CircuitBreaker.CLOSED
+    # The skipped documents are indexed by the dead letter queue worker
+    index_dirty.assert_not_called()
+    push.assert_called_once()
+    assert push.call_args[0][:2] == (Category, {1})
+    assert registry.circuit_breaker.dirty == {}
+
+
+@mock.patch(
+    "redis_search_django.dead_letter.dead_letter_queue.push", return_value=False
+)
+def test_registry_circuit_breaker_reconcile_push_failed(
+    push, settings, category_registry
+):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = True
+    settings.REDIS_SEARCH_DEAD_LETTER_QUEUE = True
+    registry, _ = category_registry
+    registry.circuit_breaker.mark_dirty(Category, [1])
+
+    registry.reconcile()
+
+    push.assert_called_once()
+    assert registry.circuit_breaker.dirty == {Category: {1}}
+
+
+@mock.patch("redis_search_django.registry.DocumentRegistry.index_dirty")
+@mock.patch("redis_search_django.dead_letter.dead_letter_queue.push")
+def test_registry_circuit_breaker_reconcile_without_dead_letter_queue(
+    push, index_dirty, settings, category_registry
+):
+    settings.REDIS_SEARCH_CIRCUIT_BREAKER = True
+    registry, _ = category_registry
+    registry.circuit_breaker.mark_dirty(Category, [1])
+
+    registry.reconcile()
+
+    push.assert_not_called()
+    index_dirty.assert_called_once_with({Category: {1}})
+    assert registry.circuit_breaker.dirty == {}
+
+    # The primary keys are kept if Redis is still unavailable
+    index_dirty.side_effect = RedisConnectionError
+    registry.circuit_breaker.mark_dirty(Category, [1])
+
+    registry.reconcile()
+
+    assert registry.circuit_breaker.dirty == {Category: {1}}
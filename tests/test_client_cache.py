@@ -0,0 +1,256 @@
+from unittest import mock
+
+import pytest
+from redis import Connection, ConnectionError
+from redis_om.model.model import NotFoundError
+
+from redis_search_django import client_cache
+from redis_search_django.client_cache import (
+    INVALIDATION_CHANNEL,
+    ClientSideCache,
+    get_client_side_cache,
+)
+from redis_search_django.documents import HashDocument, JsonDocument
+
+from .models import Category
+
+
+@pytest.fixture
+def cache():
+    cache = ClientSideCache(max_size=2)
+
+    with mock.patch.object(cache, "connect"):
+        cache._thread = mock.MagicMock()
+        cache._prefixes = {"prefix:"}
+        yield cache
+
+
+def test_get_client_side_cache_disabled(settings):
+    settings.REDIS_SEARCH_CLIENT_SIDE_CACHE = None
+    assert get_client_side_cache() is None
+
+
+def test_get_client_side_cache(settings):
+    settings.REDIS_SEARCH_CLIENT_SIDE_CACHE = {"max_size": 10}
+
+    with mock.patch.object(client_cache, "_client_side_cache", None):
+        cache = get_client_side_cache()
+
+        assert cache.max_size == 10
+        assert get_client_side_cache() is cache
+
+
+def test_client_side_cache_get(cache):
+    fetch = mock.Mock(return_value={"name": "test"})
+
+    assert cache.get(mock.Mock(), "prefix:", "prefix:1", fetch) == {"name": "test"}
+    assert cache.get(mock.Mock(), "prefix:", "prefix:1", fetch) == {"name": "test"}
+    fetch.assert_called_once()
+    assert cache.metrics() == {
+        "connected": True,
+        "size": 1,
+        "max_size": 2,
+        "hits": 1,
+        "misses": 1,
+        "invalidations": 0,
+        "flushes": 0,
+    }
+
+
+def test_client_side_cache_get_evicts_least_recently_used(cache):
+    for key in ["prefix:1", "prefix:2", "prefix:1", "prefix:3"]:
+        cache.get(mock.Mock(), "prefix:", key, lambda key=key: key)
+
+    assert list(cache._entries) == ["prefix:1", "prefix:3"]
+
+
+def test_client_side_cache_get_without_tracking():
+    cache = ClientSideCache()
+    fetch = mock.Mock(return_value="value")
+
+    with mock.patch.object(cache, "connect", side_effect=ConnectionError):
+        assert cache.get(mock.Mock(), "prefix:", "prefix:1", fetch) == "value"
+        assert cache.get(mock.Mock(), "prefix:", "prefix:1", fetch) == "value"
+
+    assert fetch.call_count == 2
+    assert len(cache) == 0
+    assert not cache.is_connected
+
+
+def test_client_side_cache_invalidation_during_fetch(cache):
+    def fetch():
+        cache.handle_message({"data": ["prefix:1"]})
+        return "stale"
+
+    assert cache.get(mock.Mock(), "prefix:", "prefix:1", fetch) == "stale"
+    assert len(cache) == 0
+
+
+def test_client_side_cache_handle_message(cache):
+    cache.get(mock.Mock(), "prefix:", "prefix:1", lambda: 1)
+    cache.get(mock.Mock(), "prefix:", "prefix:2", lambda: 2)
+
+    cache.handle_message({"data": [b"prefix:1", "prefix:3"]})
+
+    assert list(cache._entries) == ["prefix:2"]
+    assert cache.invalidations == 1
+
+    cache.handle_message({"data": None})
+
+    assert len(cache) == 0
+    assert cache.flushes == 1
+
+
+def test_client_side_cache_track_new_prefix(cache):
+    thread = cache._thread
+
+    assert cache.track(mock.Mock(), "prefix:")
+    cache.connect.assert_not_called()
+
+    db = mock.Mock()
+    assert cache.track(db, "other:")
+    thread.stop.assert_called_once()
+    cache.connect.assert_called_once_with(db, {"prefix:", "other:"})
+
+
+def test_client_side_cache_connect():
+    cache = ClientSideCache(sleep_time=0.5)
+    cache.handle_message({"data": None})
+    db = mock.MagicMock()
+    pubsub = db.pubsub()
+    pubsub.parse_response.side_effect = [10, "OK"]
+
+    cache.connect(db, {"b:", "a:"})
+
+    assert pubsub.execute_command.call_args_list == [
+        mock.call("CLIENT", "ID"),
+        mock.call(
+            "CLIENT",
+            "TRACKING",
+            "ON",
+            "REDIRECT",
+            10,
+            "BCAST",
+            "PREFIX",
+            "a:",
+            "PREFIX",
+            "b:",
+        ),
+    ]
+    pubsub.subscribe.assert_called_once_with(
+        **{INVALIDATION_CHANNEL: cache.handle_message}
+    )
+    pubsub.run_in_thread.assert_called_once_with(
+        sleep_time=0.5, daemon=True, exception_handler=cache.handle_error
+    )
+    assert cache.is_connected
+    assert cache._prefixes == {"a:", "b:"}
+    pubsub.connection.clear_connect_callbacks.assert_called_once()
+    assert pubsub.connection.register_connect_callback.call_args_list == [
+        mock.call(cache.handle_connect),
+        mock.call(pubsub.on_connect),
+    ]
+
+
+def test_client_side_cache_handle_connect(cache):
+    cache.get(mock.Mock(), "prefix:", "prefix:1", lambda: 1)
+    connection = mock.Mock()
+    connection.read_response.side_effect = [20, "OK"]
+
+    cache.handle_connect(connection)
+
+    assert connection.send_command.call_args_list == [
+        mock.call("CLIENT", "ID"),
+        mock.call(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", 20, "BCAST", "PREFIX", "prefix:"
+        ),
+    ]
+    assert len(cache) == 0
+    assert cache.flushes == 1
+
+
+class ConnectCallbacks:
+    def __init__(self):
+        self.calls = []
+
+    def enable_tracking(self, connection):
+        self.calls.append("tracking")
+
+    def subscribe(self, connection):
+        self.calls.append("subscribe")
+
+
+def test_client_side_cache_reconnect_enables_tracking_before_subscribe():
+    cache = ClientSideCache()
+    db = mock.MagicMock()
+    pubsub = db.pubsub()
+    pubsub.parse_response.side_effect = [10, "OK"]
+    pubsub.connection = connection = Connection()
+    callbacks = ConnectCallbacks()
+    pubsub.on_connect = callbacks.subscribe
+    # redis-py registers the re-subscription callback first
+    connection.register_connect_callback(callbacks.subscribe)
+
+    with mock.patch.object(cache, "handle_connect", callbacks.enable_tracking):
+        cache.connect(db, {"a:"})
+
+    # The callbacks are run after each (re)connection
+    for ref in connection._connect_callbacks:
+        ref()(connection)
+
+    assert callbacks.calls == ["tracking", "subscribe"]
+
+
+def test_client_side_cache_connect_error():
+    cache = ClientSideCache()
+    db = mock.MagicMock()
+    db.pubsub().execute_command.side_effect = ConnectionError
+
+    with pytest.raises(ConnectionError):
+        cache.connect(db, {"a:"})
+
+    db.pubsub().close.assert_called_once()
+    assert not cache.is_connected
+
+
+def test_client_side_cache_handle_error(cache):
+    thread = cache._thread
+    cache.get(mock.Mock(), "prefix:", "prefix:1", lambda: 1)
+
+    cache.handle_error(ConnectionError(), mock.Mock(), thread)
+
+    thread.stop.assert_called_once()
+    assert not cache.is_connected
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    "document_type, method", [(JsonDocument, "json().get"), (HashDocument, "hgetall")]
+)
+def test_document_get_with_client_side_cache(
+    document_class, settings, document_type, method
+):
+    settings.REDIS_SEARCH_CLIENT_SIDE_CACHE = True
+    CategoryDocument = document_class(document_type, Category, ["name"])
+    cache = ClientSideCache()
+
+    with mock.patch.object(
+        client_cache, "_client_side_cache", cache
+    ), mock.patch.object(cache, "track", return_value=True), mock.patch.object(
+        CategoryDocument, "db"
+    ) as db:
+        fetch = db().json().get if method == "json().get" else db().hgetall
+        fetch.return_value = {"pk": "1", "name": "test"}
+
+        assert CategoryDocument.get(1).name == "test"
+        assert CategoryDocument.get(1).name == "test"
+        fetch.assert_called_once_with(CategoryDocument.make_primary_key(1))
+        cache.track.assert_called_with(db(), CategoryDocument.make_primary_key(""))
+
+        fetch.return_value = None
+
+        with pytest.raises(NotFoundError):
+            CategoryDocument.get(2)
+
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["misses"] == 2
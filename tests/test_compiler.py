@@ -0,0 +1,173 @@
+import re
+
+import pytest
+from redis_om.model.model import (
+    Expression,
+    FindQuery,
+    Operators,
+    QueryNotSupportedError,
+    QuerySyntaxError,
+)
+from redis_om.model.token_escaper import TokenEscaper
+
+from redis_search_django.compiler import (
+    QueryTemplateCache,
+    compile_query,
+    get_params_args,
+    query_template_cache,
+    use_query_params,
+)
+from redis_search_django.documents import JsonDocument
+
+from .models import Product
+
+
+@pytest.fixture
+def product_document_class(document_class):
+    return document_class(JsonDocument, Product, ["name", "description", "price"])
+
+
+@pytest.fixture(autouse=True)
+def clear_query_template_cache():
+    query_template_cache.clear()
+
+
+def bind_params(query, params):
+    """Replaces the parameters of a compiled query by their (escaped) values"""
+    escaper = TokenEscaper()
+
+    def bind_tags(match):
+        names = match.group(1).split(" | ")
+        return "{%s}" % "|".join(escaper.escape(params[name[1:]]) for name in names)
+
+    query = re.sub(r"\{(\$p\d+(?: \| \$p\d+)*)\}", bind_tags, query)
+    return re.sub(r"\$(p\d+)", lambda match: params[match.group(1)], query)
+
+
+def test_use_query_params_default(settings):
+    del settings.REDIS_SEARCH_QUERY_PARAMS
+
+    assert not use_query_params()
+
+
+@pytest.mark.parametrize(
+    "build_expression",
+    [
+        lambda doc: doc.price == 10,
+        lambda doc: doc.price != 10,
+        lambda doc: doc.price > 10,
+        lambda doc: doc.price < 100.5,
+        lambda doc: doc.price >= 10,
+        lambda doc: doc.price <= 10,
+        lambda doc: doc.name == "Blue Shoe",
+        lambda doc: doc.name != "shoe",
+        lambda doc: doc.name << ["a", "b c"],
+        lambda doc: doc.name >> ["a", "b"],
+        lambda doc: doc.pk == "1",
+        lambda doc: doc.vendor.name == "vendor",
+        lambda doc: ~(doc.price > 10),
+        lambda doc: (doc.price > 10) & ~(doc.name == "shoe"),
+        lambda doc: (doc.price > 10) | (doc.name % "shoe"),
+        lambda doc: ~((doc.price >= 10) & (doc.name << ["a", "b"])),
+    ],
+)
+def test_compile_query_matches_redis_om(nested_document_class, build_expression):
+    expression = build_expression(nested_document_class[0])
+
+    compiled = compile_query(expression)
+
+    assert compiled.params
+    assert bind_params(*compiled) == FindQuery.resolve_redisearch_query(expression)
+
+
+def test_compile_query_numeric(product_document_class):
+    compiled = compile_query(
+        (product_document_class.price >= 10) & (product_document_class.price < 100.5)
+    )
+
+    assert compiled.query == "(@price:[$p0 +inf]) (@price:[-inf ($p1])"
+    assert compiled.params == {"p0": "10", "p1": "100.5"}
+
+
+def test_compile_query_tag(product_document_class):
+    compiled = compile_query(
+        (product_document_class.name == "Blue Shoe")
+        | ~(product_document_class.name << ["a", "b"])
+    )
+
+    assert compiled.query == "(@name:{$p0})| -((@name:{$p1 | $p2}))"
+    assert compiled.params == {"p0": "Blue Shoe", "p1": "a", "p2": "b"}
+
+
+def test_compile_query_inline_values(product_document_class):
+    expression = (product_document_class.name % "shoe") & (
+        product_document_class.name == "a|b"
+    )
+
+    compiled = compile_query(expression)
+
+    assert compiled.query == FindQuery.resolve_redisearch_query(expression)
+    assert compiled.params == {}
+
+
+def test_compile_query_all():
+    expression = Expression(left=None, right=None, op=Operators.ALL, parents=[])
+
+    assert compile_query(expression) == ("*", {})
+
+    with pytest.raises(QueryNotSupportedError):
+        compile_query(~expression)
+
+
+def test_compile_query_not_supported(product_document_class):
+    with pytest.raises(QuerySyntaxError):
+        compile_query(product_document_class.price % "test")
+
+
+def test_compile_query_cached(product_document_class):
+    compiled = compile_query(
+        (product_document_class.price > 10) & (product_document_class.name % "shoe")
+    )
+    other_compiled = compile_query(
+        (product_document_class.price > 20) & (product_document_class.name % "shoe")
+    )
+    text_compiled = compile_query(
+        (product_document_class.price > 20) & (product_document_class.name % "hat")
+    )
+
+    assert compiled.query == other_compiled.query
+    assert other_compiled.params == {"p0": "20"}
+    assert text_compiled.query == "(@price:[($p0 +inf]) (@name_fts:hat)"
+    assert len(query_template_cache) == 2
+
+
+def test_query_template_cache():
+    cache = QueryTemplateCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert len(cache) == 2
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_get_params_args():
+    assert get_params_args({}) == []
+    assert get_params_args({"p0": "1", "p1": "a"}) == [
+        "PARAMS",
+        4,
+        "p0",
+        "1",
+        "p1",
+        "a",
+        "DIALECT",
+        2,
+    ]
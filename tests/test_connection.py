@@ -0,0 +1,33 @@
+import asyncio
+
+from redis_search_django.connection import (
+    get_async_redis_connection,
+    get_async_redis_url,
+)
+
+
+def test_get_async_redis_url(settings, monkeypatch):
+    monkeypatch.delenv("REDIS_OM_URL", raising=False)
+    assert get_async_redis_url() == "redis://localhost:6379"
+
+    monkeypatch.setenv("REDIS_OM_URL", "redis://redis:6379")
+    assert get_async_redis_url() == "redis://redis:6379"
+
+    settings.REDIS_SEARCH_ASYNC_REDIS_URL = "redis://search:6379/1"
+    assert get_async_redis_url() == "redis://search:6379/1"
+
+
+def test_get_async_redis_connection(settings):
+    settings.REDIS_SEARCH_ASYNC_MAX_CONNECTIONS = 20
+
+    async def get_connections():
+        return get_async_redis_connection(), get_async_redis_connection()
+
+    first, second = asyncio.run(get_connections())
+    other, _ = asyncio.run(get_connections())
+
+    # The connection is shared in the same event loop
+    assert first is second
+    assert first is not other
+    assert first.connection_pool.max_connections == 20
+    assert first.connection_pool.connection_kwargs["decode_responses"] is True
@@ -0,0 +1,211 @@
+import json
+from unittest import mock
+
+import pytest
+import redis
+from django.core.management import call_command
+
+from redis_search_django.dead_letter import DeadLetterQueue
+from redis_search_django.registry import DocumentRegistry
+
+from .models import Category
+
+
+def build_entry(pk, attempts=0):
+    return {
+        "model": "tests.Category",
+        "pk": str(pk),
+        "error": "ValueError: error",
+        "attempts": attempts,
+        "failed_at": 0,
+    }
+
+
+@pytest.fixture
+def queue():
+    queue = DeadLetterQueue(key_prefix="test")
+    queue._db = mock.MagicMock()
+    return queue
+
+
+def test_get_backoff(queue, settings):
+    settings.REDIS_SEARCH_DEAD_LETTER_BACKOFF = 10
+
+    assert queue.get_backoff(0) == 10
+    assert queue.get_backoff(1) == 20
+    assert queue.get_backoff(3) == 80
+    assert queue.get_backoff(20) == queue.max_backoff
+
+
+@mock.patch("redis_search_django.dead_letter.time.time", return_value=100)
+def test_push(time, queue, settings):
+    settings.REDIS_SEARCH_DEAD_LETTER_BACKOFF = 10
+    pipeline = queue.db().pipeline()
+
+    queue.push(Category, [1], ValueError("error"))
+
+    entry = build_entry(1)
+    entry["failed_at"] = 100
+    pipeline.hset.assert_called_once_with(
+        "test:entries", "tests.Category:1", json.dumps(entry)
+    )
+    pipeline.zadd.assert_called_once_with("test:retry", {"tests.Category:1": 110})
+    pipeline.execute.assert_called_once()
+
+
+def test_push_redis_error(queue):
+    queue.db().pipeline().execute.side_effect = redis.ConnectionError
+
+    # The error is only logged
+    queue.push(Category, [1], ValueError("error"))
+
+
+@mock.patch("redis_search_django.dead_letter.document_registry.index_dirty")
+def test_retry(index_dirty, queue):
+    queue.db().zrangebyscore.return_value = ["tests.Category:1", "tests.Category:2"]
+    queue.db().hmget.return_value = [
+        json.dumps(build_entry(1)),
+        json.dumps(build_entry(2)),
+    ]
+
+    with mock.patch.object(queue, "_remove") as remove, mock.patch.object(
+        queue, "_fail"
+    ) as fail:
+        assert queue.retry(batch_size=10) == (2, 0)
+
+    index_dirty.assert_called_once_with({Category: {"1", "2"}})
+    remove.assert_called_once_with(["tests.Category:1", "tests.Category:2"])
+    fail.assert_called_once_with([])
+
+
+@mock.patch("redis_search_django.dead_letter.document_registry.index_dirty")
+def test_retry_with_failure(index_dirty, queue):
+    queue.db().zrangebyscore.return_value = ["tests.Category:1", "tests.Category:2"]
+    queue.db().hmget.return_value = [
+        json.dumps(build_entry(1)),
+        json.dumps(build_entry(2)),
+    ]
+    index_dirty.side_effect = [ValueError("batch"), None, ValueError("failed")]
+
+    with mock.patch.object(queue, "_remove") as remove, mock.patch.object(
+        queue, "_fail"
+    ) as fail:
+        assert queue.retry() == (1, 1)
+
+    remove.assert_called_once_with(["tests.Category:1"])
+    failed_entry = build_entry(2)
+    failed_entry["error"] = "ValueError: failed"
+    fail.assert_called_once_with([failed_entry])
+
+
+def test_retry_without_due_entries(queue):
+    queue.db().zrangebyscore.return_value = []
+
+    assert queue.retry() == (0, 0)
+
+
+@mock.patch("redis_search_django.dead_letter.time.time", return_value=100)
+def test_fail(time, queue, settings):
+    settings.REDIS_SEARCH_DEAD_LETTER_MAX_RETRIES = 2
+    settings.REDIS_SEARCH_DEAD_LETTER_BACKOFF = 10
+    pipeline = queue.db().pipeline()
+
+    queue._fail([build_entry(1), build_entry(2, attempts=1)])
+
+    assert pipeline.zadd.call_args_list == [
+        mock.call("test:retry", {"tests.Category:1": 120}),
+        mock.call("test:dead", {"tests.Category:2": 100}),
+    ]
+    pipeline.zrem.assert_called_once_with("test:retry", "tests.Category:2")
+
+
+@mock.patch("redis_search_django.dead_letter.time.time", return_value=100)
+def test_replay(time, queue):
+    queue.db().zrange.return_value = ["tests.Category:1"]
+    queue.db().hmget.return_value = [json.dumps(build_entry(1, attempts=5))]
+    pipeline = queue.db().pipeline()
+
+    assert queue.replay() == 1
+
+    pipeline.zrem.assert_called_once_with("test:dead", "tests.Category:1")
+    pipeline.hset.assert_called_once_with(
+        "test:entries", "tests.Category:1", json.dumps(build_entry(1))
+    )
+    pipeline.zadd.assert_called_once_with("test:retry", {"tests.Category:1": 100})
+
+
+def test_dead_letters(queue):
+    queue.db().zrange.return_value = ["tests.Category:1", "tests.Category:2"]
+    queue.db().hmget.return_value = [json.dumps(build_entry(1)), None]
+
+    assert queue.dead_letters() == [build_entry(1)]
+
+
+@mock.patch("redis_search_django.dead_letter.dead_letter_queue.push")
+def test_registry_with_dead_letter_queue(push, settings):
+    settings.REDIS_SEARCH_DEAD_LETTER_QUEUE = True
+    document_class = mock.MagicMock(__name__="CategoryDocument")
+    document_class._django.model = Category
+    document_class._django.related_models = {}
+    error = ValueError("error")
+    document_class.update_from_model_instance.side_effect = error
+    registry = DocumentRegistry()
+    registry.register(document_class)
+
+    registry.update_document(Category(pk=1, name="test"))
+
+    push.assert_called_once_with(Category, [1], error)
+
+
+@mock.patch("redis_search_django.dead_letter.dead_letter_queue.push")
+def test_registry_without_dead_letter_queue(push):
+    document_class = mock.MagicMock()
+    document_class._django.model = Category
+    document_class._django.related_models = {}
+    document_class.delete.side_effect = ValueError("error")
+    registry = DocumentRegistry()
+    registry.register(document_class)
+
+    with pytest.raises(ValueError):
+        registry.remove_document(Category(pk=1, name="test"))
+
+    push.assert_not_called()
+
+
+@mock.patch(
+    "redis_search_django.management.commands.search_dead_letter.dead_letter_queue"
+)
+def test_search_dead_letter_command(dead_letter_queue):
+    dead_letter_queue.retry.side_effect = [(10, 1), (0, 0)]
+
+    call_command("search_dead_letter", "--batch-size", "10")
+
+    assert dead_letter_queue.retry.call_args_list == [mock.call(batch_size=10)] * 2
+    dead_letter_queue.replay.assert_not_called()
+
+
+@mock.patch(
+    "redis_search_django.management.commands.search_dead_letter.dead_letter_queue"
+)
+def test_search_dead_letter_command_replay(dead_letter_queue):
+    dead_letter_queue.replay.return_value = 1
+    dead_letter_queue.retry.return_value = (0, 0)
+
+    call_command("search_dead_letter", "--replay")
+
+    dead_letter_queue.replay.assert_called_once()
+    dead_letter_queue.retry.assert_called_once()
+
+
+@mock.patch(
+    "redis_search_django.management.commands.search_dead_letter.dead_letter_queue"
+)
+def test_search_dead_letter_command_list(dead_letter_queue, capsys):
+    dead_letter_queue.dead_letters.return_value = [build_entry(1, attempts=5)]
+
+    call_command("search_dead_letter", "--list")
+
+    assert (
+        "tests.Category 1 (attempts: 5): ValueError: error" in capsys.readouterr().out
+    )
+    dead_letter_queue.retry.assert_not_called()
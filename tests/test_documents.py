@@ -1,9 +1,12 @@
+import asyncio
 import datetime
+from typing import List
 from unittest import mock
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
 from redis.commands.search import reducers
+from redis.exceptions import ResponseError
 from redis_om import Migrator, NotFoundError
 
 from redis_search_django.documents import (
@@ -382,6 +385,132 @@ def test_update_from_related_model_instance_with_exclude_optional_field(
     assert ProductDocumentCalss.get(pk=product.pk).tags == []
 
 
+def test_update_related_field(nested_document_class):
+    ProductDocumentClass, (_, TagDocumentClass, _) = nested_document_class
+    tag = Tag(pk=1, name="test")
+    product = mock.MagicMock(pk=1)
+    product.tags.all.return_value = [tag]
+    pipeline = mock.MagicMock()
+    pipeline.execute.return_value = [b"OK"]
+
+    with mock.patch.object(ProductDocumentClass, "db") as db, mock.patch.object(
+        TagDocumentClass, "db"
+    ), mock.patch.object(
+        ProductDocumentClass, "from_model_instance"
+    ) as from_model_instance:
+        db().pipeline.return_value = pipeline
+        ProductDocumentClass.update_related_field([product], "tags")
+
+    pipeline.json().set.assert_called_once_with(
+        ProductDocumentClass.make_primary_key(product.pk),
+        "$.tags",
+        [{"pk": "1", "name": "test"}],
+    )
+    from_model_instance.assert_not_called()
+
+
+def test_update_related_field_document_not_found(nested_document_class):
+    ProductDocumentClass = nested_document_class[0]
+    product = mock.MagicMock(pk=1)
+    product.tags.all.return_value = []
+    pipeline = mock.MagicMock()
+    pipeline.execute.return_value = [ResponseError()]
+
+    with mock.patch.object(ProductDocumentClass, "db") as db, mock.patch.object(
+        ProductDocumentClass, "from_model_instance"
+    ) as from_model_instance:
+        db().pipeline.return_value = pipeline
+        ProductDocumentClass.update_related_field([product], "tags")
+
+    from_model_instance.assert_called_once_with(product, save=True)
+
+
+def test_update_related_field_not_embedded(document_class):
+    CategoryDocumentClass = document_class(JsonDocument, Category, ["name"])
+    category = Category(pk=1, name="test")
+
+    with mock.patch.object(CategoryDocumentClass, "db") as db, mock.patch.object(
+        CategoryDocumentClass, "update_from_model_instance"
+    ) as update_from_model_instance:
+        CategoryDocumentClass.update_related_field([category], "name")
+        CategoryDocumentClass.update_related_field([category], "unknown")
+
+    update_from_model_instance.assert_called_once_with(category, create=True)
+    db.assert_not_called()
+
+
+def test_update_related_field_prepared_field(document_class):
+    class ProductDocumentClass(document_class(JsonDocument, Product, ["name"])):
+        tag_names: List[str] = []
+
+        @classmethod
+        def prepare_tag_names(cls, obj):
+            return [tag.name for tag in obj.tags.all()]
+
+    product = mock.MagicMock(pk=1)
+    product.tags.all.return_value = [Tag(pk=1, name="test")]
+
+    with mock.patch.object(ProductDocumentClass, "db") as db, mock.patch.object(
+        ProductDocumentClass, "update_from_model_instance"
+    ) as update_from_model_instance:
+        ProductDocumentClass.update_related_field([product], "tags")
+
+    update_from_model_instance.assert_called_once_with(product, create=True)
+    assert ProductDocumentClass.data_from_model_instance(product)["tag_names"] == [
+        "test"
+    ]
+    db().pipeline.assert_not_called()
+
+
+def test_index_pks(document_class):
+    CategoryDocumentClass = document_class(JsonDocument, Category, ["name"])
+    pipeline = mock.MagicMock()
+
+    with mock.patch.object(CategoryDocumentClass, "db") as db, mock.patch.object(
+        CategoryDocumentClass, "get_queryset"
+    ) as get_queryset, mock.patch.object(CategoryDocumentClass, "add") as add:
+        db().pipeline.return_value = pipeline
+        get_queryset().filter.side_effect = [
+            [Category(pk=1, name="test"), Category(pk=2, name="test")],
+            [],
+        ]
+        CategoryDocumentClass.index_pks([1, 2, 3, 4], chunk_size=2)
+
+    assert get_queryset().filter.call_args_list == [
+        mock.call(pk__in=[1, 2]),
+        mock.call(pk__in=[3, 4]),
+    ]
+    assert [obj.pk for obj in add.call_args_list[0][0][0]] == ["1", "2"]
+    assert add.call_args_list[1][0][0] == []
+    pipeline.delete.assert_called_once_with(
+        CategoryDocumentClass.make_primary_key(3),
+        CategoryDocumentClass.make_primary_key(4),
+    )
+    assert pipeline.execute.call_count == 2
+
+
+def test_get_related_pks(nested_document_class):
+    ProductDocumentClass = nested_document_class[0]
+    category = mock.MagicMock(spec=Category)
+    category.__class__ = Category
+    category.product_set.values_list.return_value = [1, 2]
+    vendor = mock.MagicMock(spec=Vendor)
+    vendor.__class__ = Vendor
+    vendor.product.pk = 3
+
+    assert ProductDocumentClass.get_related_pks(category) == [1, 2]
+    assert ProductDocumentClass.get_related_pks(vendor) == [3]
+    assert ProductDocumentClass.get_related_pks(Product(pk=1)) == []
+
+
+def test_has_embedded_field(nested_document_class):
+    ProductDocumentClass = nested_document_class[0]
+
+    assert ProductDocumentClass.has_embedded_field(Vendor, "name")
+    assert not ProductDocumentClass.has_embedded_field(Tag, "product_set")
+    assert not ProductDocumentClass.has_embedded_field(Product, "name")
+
+
 @pytest.mark.skipif(not is_redis_running(), reason="Redis is not running")
 @pytest.mark.django_db
 def test_data_from_model_instance(nested_document_class, product_with_tag):
@@ -459,12 +588,55 @@ def test_build_aggregate_request_without_expressions(document_class):
     assert request._query == "*"
 
 
-def test_build_aggregate_request_with_expressions(document_class):
+def test_build_aggregate_request_with_expressions(document_class, settings):
+    settings.REDIS_SEARCH_QUERY_PARAMS = True
+    CategoryDocumentCalss = document_class(JsonDocument, Category, ["name"])
+    request = CategoryDocumentCalss.build_aggregate_request(
+        CategoryDocumentCalss.name == "test"
+    )
+    assert request._query == "@name:{$p0}"
+    assert request.params == {"p0": "test"}
+    assert request.build_args() == ["@name:{$p0}", "DIALECT", 2]
+
+
+def test_build_aggregate_request_without_query_params(document_class, settings):
+    settings.REDIS_SEARCH_QUERY_PARAMS = False
     CategoryDocumentCalss = document_class(JsonDocument, Category, ["name"])
     request = CategoryDocumentCalss.build_aggregate_request(
         CategoryDocumentCalss.name == "test"
     )
     assert request._query == "@name:{test}"
+    assert request.params == {}
+
+
+def test_aggregate_with_query_params(document_class, settings):
+    settings.REDIS_SEARCH_QUERY_PARAMS = True
+    CategoryDocumentCalss = document_class(JsonDocument, Category, ["name"])
+    request = CategoryDocumentCalss.build_aggregate_request(
+        CategoryDocumentCalss.name == "test"
+    )
+
+    with mock.patch.object(CategoryDocumentCalss, "db") as db:
+        db().ft().aggregate().rows = [[b"count", b"1"]]
+
+        assert CategoryDocumentCalss.aggregate(request) == [{"count": "1"}]
+
+    db().ft().aggregate.assert_called_with(request, query_params={"p0": "test"})
+
+
+def test_aaggregate(document_class):
+    CategoryDocumentCalss = document_class(JsonDocument, Category, ["name"])
+    request = CategoryDocumentCalss.build_aggregate_request()
+
+    with mock.patch.object(CategoryDocumentCalss, "adb") as adb:
+        adb().ft().aggregate = mock.AsyncMock()
+        adb().ft().aggregate.return_value.rows = [["count", "1"]]
+
+        assert asyncio.run(CategoryDocumentCalss.aaggregate(request)) == [
+            {"count": "1"}
+        ]
+
+    adb().ft().aggregate.assert_awaited_once_with(request, query_params=None)
 
 
 @pytest.mark.skipif(not is_redis_running(), reason="Redis is not running")
@@ -504,3 +676,82 @@ def test_find(document_class):
 
     assert len(result) == 1
     assert result[0].pk == str(category_1.pk)
+
+
+def test_to_model_instance(nested_document_class):
+    ProductDocument, embedded_document_classes = nested_document_class
+    CategoryDocument, TagDocument, VendorDocument = embedded_document_classes
+    created_at = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+    with mock.patch.object(ProductDocument, "db"), mock.patch.object(
+        CategoryDocument, "db"
+    ), mock.patch.object(TagDocument, "db"), mock.patch.object(VendorDocument, "db"):
+        document = ProductDocument(
+            pk="1",
+            name="Shoe",
+            description="A shoe",
+            price=10.5,
+            created_at=created_at,
+            vendor=VendorDocument(
+                pk="2", name="Vendor", establishment_date=datetime.date(2020, 1, 1)
+            ),
+            category=CategoryDocument(pk="3", name="Shoes"),
+            tags=[TagDocument(pk="4", name="Blue"), TagDocument(pk="5", name="Red")],
+        )
+
+    # The database is not accessed (this test does not have database access)
+    product = document.to_model_instance()
+
+    assert isinstance(product, Product)
+    assert product._state.adding
+    assert product.pk == 1
+    assert product.name == "Shoe"
+    assert product.description == "A shoe"
+    assert str(product.price) == "10.5"
+    assert product.created_at == created_at
+    assert product.vendor.pk == 2
+    assert product.vendor.establishment_date == datetime.date(2020, 1, 1)
+    assert product.category_id == 3
+    assert product.category.name == "Shoes"
+    assert [tag.name for tag in product.tags.all()] == ["Blue", "Red"]
+    assert isinstance(product.tags.all()[0], Tag)
+
+
+def test_to_model_instance_without_related_objects(nested_document_class):
+    ProductDocument = nested_document_class[0]
+    VendorDocument = nested_document_class[1][2]
+
+    with mock.patch.object(ProductDocument, "db"), mock.patch.object(
+        VendorDocument, "db"
+    ):
+        document = ProductDocument.construct(
+            pk="1",
+            name="Shoe",
+            category=None,
+            tags=[],
+        )
+
+    product = document.to_model_instance()
+
+    assert product.name == "Shoe"
+    assert product.category is None
+    assert list(product.tags.all()) == []
+    # Fields missing from partial documents are not set
+    assert product.price is None
+
+
+def test_to_model_instance_skips_unset_fields(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db"):
+        document = ProductDocument.construct(pk="1", name="Shoe")
+
+    # `construct()` fills the defaults of the missing fields in `__dict__`
+    assert document.__dict__["description"] is None
+
+    product = document.to_model_instance()
+
+    assert product.name == "Shoe"
+    # The model field defaults are kept for the fields that were not set
+    assert product.description == ""
+    assert product.created_at is None
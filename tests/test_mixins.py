@@ -1,7 +1,9 @@
+import asyncio
 from unittest import mock
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404
 from django.test import RequestFactory
 from django.utils.functional import cached_property
 from django.views import View
@@ -9,13 +11,14 @@ from django.views.generic import ListView
 
 from redis_search_django.documents import JsonDocument
 from redis_search_django.mixins import (
+    AsyncRediSearchListViewMixin,
     RediSearchListViewMixin,
     RediSearchMixin,
     RediSearchMultipleObjectMixin,
     RediSearchTemplateResponseMixin,
 )
-from redis_search_django.paginator import RediSearchPaginator
-from redis_search_django.query import RediSearchQuery
+from redis_search_django.paginator import AsyncRediSearchPaginator, RediSearchPaginator
+from redis_search_django.query import RediSearchQuery, RediSearchResult
 
 from .helpers import is_redis_running
 from .models import Category
@@ -151,3 +154,165 @@ def test_list_view_mixin(find, document_class):
 
     find.assert_called_once()
     assert isinstance(response.context_data["paginator"], RediSearchPaginator)
+
+
+def test_async_list_view_mixin(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+    result = RediSearchResult([mock.MagicMock()], 30, Category)
+
+    class SearchView(AsyncRediSearchListViewMixin, ListView):
+        paginate_by = 20
+        model = Category
+        template_name = "core/search.html"
+        document_class = DocumentClass
+
+        async def afacets(self):
+            return ["facet"]
+
+    assert SearchView.view_is_async
+
+    request = RequestFactory().get("/some_url", {"page": "last"})
+
+    with mock.patch.object(
+        RediSearchQuery, "aexecute", return_value=result
+    ), mock.patch.object(RediSearchQuery, "acount", return_value=30):
+        response = asyncio.run(SearchView.as_view()(request))
+
+    paginator = response.context_data["paginator"]
+    assert isinstance(paginator, AsyncRediSearchPaginator)
+    assert paginator.num_pages == 2
+    assert response.context_data["page_obj"].number == 2
+    assert response.context_data["object_list"] is result
+    assert response.context_data["category_list"] is result
+    assert response.context_data["facets"] == ["facet"]
+
+
+def test_async_list_view_mixin_without_pagination(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+    result = RediSearchResult([mock.MagicMock()], 1, Category)
+
+    class SearchView(AsyncRediSearchListViewMixin, ListView):
+        model = Category
+        template_name = "core/search.html"
+        document_class = DocumentClass
+
+    request = RequestFactory().get("/some_url", {"page": "invalid"})
+
+    with mock.patch.object(RediSearchQuery, "aexecute", return_value=result):
+        response = asyncio.run(SearchView.as_view()(request))
+
+    assert response.context_data["paginator"] is None
+    assert response.context_data["object_list"] is result
+    assert response.context_data["facets"] is None
+
+
+def test_async_list_view_mixin_invalid_page(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+
+    class SearchView(AsyncRediSearchListViewMixin, ListView):
+        paginate_by = 20
+        model = Category
+        template_name = "core/search.html"
+        document_class = DocumentClass
+
+    request = RequestFactory().get("/some_url", {"page": "invalid"})
+
+    with pytest.raises(Http404):
+        asyncio.run(SearchView.as_view()(request))
+
+
+def build_facet_view(DocumentClass, mixin_class=RediSearchListViewMixin):
+    class SearchView(mixin_class, ListView):
+        paginate_by = 20
+        model = Category
+        template_name = "core/search.html"
+        document_class = DocumentClass
+        facet_fields = ["name", "pk"]
+
+    return SearchView
+
+
+FACET_PIPELINE_RESULTS = [
+    [1, "key", ["$", '{"pk": "1", "name": "Shoes"}']],
+    [1, ["name", "Shoes", "count", "1"]],
+    [1, ["pk", "1", "count", "1"]],
+]
+
+
+def test_list_view_mixin_facet_fields(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+    pipeline = DocumentClass.db().pipeline()
+    pipeline.execute.return_value = FACET_PIPELINE_RESULTS
+    SearchView = build_facet_view(DocumentClass)
+
+    request = RequestFactory().get("/some_url", {"page": "1"})
+    response = SearchView.as_view()(request)
+
+    # The search and the facets are sent in a single pipeline
+    pipeline.execute.assert_called_once()
+    assert [call.args[0] for call in pipeline.execute_command.call_args_list] == [
+        "ft.search",
+        "ft.aggregate",
+        "ft.aggregate",
+    ]
+    assert pipeline.execute_command.call_args_list[0].args[3:6] == ("LIMIT", 0, 20)
+    assert "@name" in pipeline.execute_command.call_args_list[1].args
+    assert response.context_data["facets"] == {
+        "name": [{"name": "Shoes", "count": "1"}],
+        "pk": [{"pk": "1", "count": "1"}],
+    }
+    assert response.context_data["paginator"].count == 1
+    assert response.context_data["object_list"][0].name == "Shoes"
+    assert not any(
+        call.args and call.args[0] == "ft.search"
+        for call in DocumentClass.db().execute_command.call_args_list
+    )
+
+
+def test_list_view_mixin_facet_fields_with_page_name(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+    DocumentClass.db().pipeline().execute.return_value = FACET_PIPELINE_RESULTS[1:]
+    view = build_facet_view(DocumentClass)()
+    view.setup(RequestFactory().get("/some_url", {"page": "last"}))
+    query = RediSearchQuery([], model=mock.MagicMock())
+
+    assert view.get_prefetch_query(query) is None
+
+    view.fetch_facets()
+
+    assert len(DocumentClass.db().pipeline().execute_command.call_args_list) == 2
+    assert list(view.facets()) == ["name", "pk"]
+
+
+def test_redis_search_mixin_facets(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+    DocumentClass.db().pipeline().execute.return_value = FACET_PIPELINE_RESULTS[1:]
+    mixin = RediSearchMixin()
+    mixin.document_class = DocumentClass
+    mixin.facet_fields = ["name", "pk"]
+
+    assert mixin.facets()["name"] == [{"name": "Shoes", "count": "1"}]
+    assert mixin.facets()["pk"] == [{"pk": "1", "count": "1"}]
+    DocumentClass.db().pipeline().execute.assert_called_once()
+
+
+def test_async_list_view_mixin_facet_fields(document_class):
+    DocumentClass = document_class(JsonDocument, Category, ["name"])
+    DocumentClass.db = mock.MagicMock()
+    DocumentClass.adb = mock.MagicMock()
+    pipeline = DocumentClass.adb().pipeline()
+    pipeline.execute = mock.AsyncMock(return_value=FACET_PIPELINE_RESULTS)
+    SearchView = build_facet_view(DocumentClass, AsyncRediSearchListViewMixin)
+
+    request = RequestFactory().get("/some_url")
+    response = asyncio.run(SearchView.as_view()(request))
+
+    pipeline.execute.assert_awaited_once()
+    assert response.context_data["facets"]["name"] == [{"name": "Shoes", "count": "1"}]
+    assert response.context_data["paginator"].count == 1
@@ -0,0 +1,166 @@
+from unittest import mock
+
+import pytest
+
+from redis_search_django.documents import JsonDocument
+from redis_search_django.multi_search import MultiSearch, parse_sort_key
+from redis_search_django.paginator import RediSearchPaginator
+
+from .models import Category, Product, Vendor
+
+
+@pytest.fixture
+def document_classes(document_class):
+    ProductDocument = document_class(JsonDocument, Product, ["name"])
+    VendorDocument = document_class(JsonDocument, Vendor, ["name"])
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+    return ProductDocument, VendorDocument, CategoryDocument
+
+
+def get_hit(pk, value, name):
+    return [f"key:{pk}", value, ["$", f'{{"pk": "{pk}", "name": "{name}"}}']]
+
+
+@pytest.fixture
+def multi_search(document_classes):
+    ProductDocument, VendorDocument, CategoryDocument = document_classes
+
+    with mock.patch.object(ProductDocument, "db") as db, mock.patch.object(
+        VendorDocument, "db"
+    ), mock.patch.object(CategoryDocument, "db"):
+        search = MultiSearch(
+            ProductDocument.find(ProductDocument.name % "shoe"),
+            VendorDocument.find(),
+            CategoryDocument.find(),
+        )
+        yield search, db
+
+
+def test_multi_search_requires_queries():
+    with pytest.raises(ValueError):
+        MultiSearch()
+
+
+def test_multi_search_execute_by_score(multi_search, document_classes):
+    search, db = multi_search
+    ProductDocument, VendorDocument, CategoryDocument = document_classes
+    db().pipeline().execute.return_value = [
+        [3, *get_hit(1, "5", "P1"), *get_hit(2, "1.5", "P2"), *get_hit(3, "1", "P3")],
+        [1, *get_hit(4, "3", "V1")],
+        [0],
+    ]
+    search.paginate(offset=1, limit=2)
+
+    result = search.execute()
+
+    assert [hit.key for hit in result] == ["key:4", "key:2"]
+    assert [hit.score for hit in result] == [3, 1.5]
+    assert isinstance(result[0].document, VendorDocument)
+    assert result[0].document.name == "V1"
+    assert [doc.name for doc in result.documents(ProductDocument)] == ["P2"]
+    assert result.hit_count == result.count() == 4
+    assert result.hit_counts == {
+        ProductDocument: 3,
+        VendorDocument: 1,
+        CategoryDocument: 0,
+    }
+
+    commands = [call.args for call in db().pipeline().execute_command.call_args_list]
+    assert len(commands) == 3
+    assert commands[0][:4] == (
+        "ft.search",
+        ProductDocument.Meta.index_name,
+        search.queries[0].query,
+        "WITHSCORES",
+    )
+    assert commands[0][4:7] == ("LIMIT", 0, 3)
+    db().pipeline().execute.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "sort_field, expected",
+    [
+        ("name", ["key:1", "key:3", "key:2", "key:4"]),
+        ("-name", ["key:2", "key:3", "key:1", "key:4"]),
+    ],
+)
+def test_multi_search_execute_by_sort_field(document_classes, sort_field, expected):
+    ProductDocument, VendorDocument, _ = document_classes
+
+    with mock.patch.object(ProductDocument, "db") as db, mock.patch.object(
+        VendorDocument, "db"
+    ):
+        search = MultiSearch(
+            ProductDocument.find(), VendorDocument.find(), sort_field=sort_field
+        )
+        product_hits = [get_hit(1, "$a", "A"), get_hit(2, "$c", "C")]
+        vendor_hits = [get_hit(3, "$b", "B"), get_hit(4, None, "-")]
+
+        # Each index returns its hits sorted, missing values last
+        if sort_field.startswith("-"):
+            product_hits.reverse()
+
+        db().pipeline().execute.return_value = [
+            [2, *product_hits[0], *product_hits[1]],
+            [2, *vendor_hits[0], *vendor_hits[1]],
+        ]
+        search.paginate(offset=0, limit=4)
+        result = search.execute()
+
+    assert [hit.key for hit in result] == expected
+    assert search.queries[0].sort_fields == [sort_field]
+    assert "WITHSORTKEYS" in db().pipeline().execute_command.call_args.args
+
+
+def test_multi_search_count(multi_search):
+    search, db = multi_search
+    db().pipeline().execute.return_value = [[3], [1], [0]]
+
+    assert search.count() == 4
+    assert all(
+        call.args[3:7] == ("LIMIT", 0, 0, "NOCONTENT")
+        for call in db().pipeline().execute_command.call_args_list
+    )
+
+
+def test_multi_search_count_after_execute(multi_search):
+    search, db = multi_search
+    db().pipeline().execute.return_value = [
+        [3, *get_hit(1, "5", "P1")],
+        [1, *get_hit(4, "3", "V1")],
+        [0],
+    ]
+
+    search.execute()
+
+    assert search.count() == 4
+    db().pipeline().execute.assert_called_once()
+
+
+def test_multi_search_paginator(multi_search):
+    search, db = multi_search
+    db().pipeline().execute.return_value = [
+        [
+            3,
+            *get_hit(1, "5", "P1"),
+            *get_hit(2, "1.5", "P2"),
+            *get_hit(3, "1", "P3"),
+        ],
+        [1, *get_hit(4, "3", "V1")],
+        [0],
+    ]
+    paginator = RediSearchPaginator(search, 2)
+
+    page = paginator.page(2)
+
+    assert paginator.num_pages == 2
+    assert [hit.key for hit in page] == ["key:2", "key:3"]
+    # The count is taken from the executed page
+    db().pipeline().execute.assert_called_once()
+
+
+def test_parse_sort_key():
+    assert parse_sort_key(b"#10.5") == 10.5
+    assert parse_sort_key("$shoes") == "shoes"
+    assert parse_sort_key("none") is None
+    assert parse_sort_key(None) is None
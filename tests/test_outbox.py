@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+
+from redis_search_django.outbox.models import IndexOutbox
+
+from .models import Category
+
+
+@pytest.mark.django_db
+def test_outbox_add():
+    IndexOutbox.objects.add(Category, [1, 2])
+
+    assert list(IndexOutbox.objects.values_list("model", "object_pk")) == [
+        ("tests.Category", "1"),
+        ("tests.Category", "2"),
+    ]
+
+
+@pytest.mark.django_db
+def test_registry_with_outbox(settings, category_registry):
+    settings.REDIS_SEARCH_AUTO_INDEX_OUTBOX = True
+    registry, document_class = category_registry
+
+    registry.update_document(Category(pk=1, name="test"))
+    registry.remove_document(Category(pk=2, name="test"))
+
+    document_class.update_from_model_instance.assert_not_called()
+    document_class.delete.assert_not_called()
+    assert list(IndexOutbox.objects.values_list("model", "object_pk")) == [
+        ("tests.Category", "1"),
+        ("tests.Category", "2"),
+    ]
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+def test_registry_with_outbox_uses_instance_database(settings, category_registry):
+    settings.REDIS_SEARCH_AUTO_INDEX_OUTBOX = True
+    registry, _ = category_registry
+    category = Category.objects.using("other").create(name="test")
+
+    registry.update_document(category)
+
+    assert not IndexOutbox.objects.exists()
+    assert list(
+        IndexOutbox.objects.using("other").values_list("model", "object_pk")
+    ) == [("tests.Category", str(category.pk))]
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+def test_outbox_add_using():
+    IndexOutbox.objects.add(Category, [1], using="other")
+
+    assert not IndexOutbox.objects.exists()
+    assert IndexOutbox.objects.using("other").count() == 1
+
+
+@pytest.mark.django_db
+def test_registry_without_outbox(category_registry):
+    registry, document_class = category_registry
+
+    registry.update_document(Category(pk=1, name="test"))
+
+    document_class.update_from_model_instance.assert_called_once()
+    assert not IndexOutbox.objects.exists()
+
+
+@pytest.mark.django_db
+@mock.patch("redis_search_django.outbox.models.document_registry.index_dirty")
+def test_outbox_drain(index_dirty):
+    IndexOutbox.objects.add(Category, [1, 1, 2])
+    IndexOutbox.objects.create(model="tests.DoesNotExist", object_pk="1")
+
+    assert IndexOutbox.objects.drain(batch_size=10) == 4
+
+    index_dirty.assert_called_once_with({Category: {"1", "2"}}, chunk_size=10)
+    assert not IndexOutbox.objects.exists()
+    assert IndexOutbox.objects.drain() == 0
+
+
+@pytest.mark.django_db
+@mock.patch("redis_search_django.outbox.models.document_registry.index_dirty")
+def test_outbox_drain_batch_size(index_dirty):
+    IndexOutbox.objects.add(Category, [1, 2, 3])
+
+    assert IndexOutbox.objects.drain(batch_size=2) == 2
+
+    index_dirty.assert_called_once_with({Category: {"1", "2"}}, chunk_size=2)
+    assert list(IndexOutbox.objects.values_list("object_pk", flat=True)) == ["3"]
+
+
+@pytest.mark.django_db
+@mock.patch("redis_search_django.outbox.models.document_registry.index_dirty")
+def test_outbox_drain_failure_keeps_entries(index_dirty):
+    index_dirty.side_effect = ConnectionError
+    IndexOutbox.objects.add(Category, [1])
+
+    with pytest.raises(ConnectionError):
+        IndexOutbox.objects.drain()
+
+    assert IndexOutbox.objects.count() == 1
+
+
+@mock.patch(
+    "redis_search_django.outbox.management.commands.search_outbox_drain"
+    ".IndexOutbox.objects.drain"
+)
+def test_search_outbox_drain_command(drain):
+    drain.side_effect = [10, 5, 0]
+
+    call_command("search_outbox_drain", "--batch-size", "10")
+
+    assert drain.call_args_list == [mock.call(batch_size=10)] * 3
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+@mock.patch("redis_search_django.outbox.models.document_registry.index_dirty")
+def test_search_outbox_drain_command_database(index_dirty):
+    IndexOutbox.objects.add(Category, [1], using="other")
+
+    call_command("search_outbox_drain", "--database", "other")
+
+    index_dirty.assert_called_once_with({Category: {"1"}}, chunk_size=1000)
+    assert not IndexOutbox.objects.using("other").exists()
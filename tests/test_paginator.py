@@ -1,12 +1,25 @@
+import asyncio
+import base64
 from unittest import mock
 
 import pytest
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
 from django.core.paginator import EmptyPage, PageNotAnInteger
 
-from redis_search_django.paginator import RediSearchPaginator
+from redis_search_django.documents import HashDocument
+from redis_search_django.paginator import (
+    AsyncKeysetPaginator,
+    AsyncRediSearchPaginator,
+    CachedRediSearchPaginator,
+    InvalidCursor,
+    KeysetPaginator,
+    RediSearchPaginator,
+)
 from redis_search_django.query import RediSearchQuery, RediSearchResult
+from redis_search_django.result_cache import bump_generation, get_result_cache
 
-from .models import Category
+from .models import Category, Product
 
 
 def test_paginator_validate_number():
@@ -29,6 +42,7 @@ def test_paginator(execute):
     query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
     result = RediSearchResult([mock.MagicMock()], 100, Category)
     query._model_cache = result
+    query._executed = True
     execute.return_value = result
 
     paginator = RediSearchPaginator(query, 5)
@@ -39,3 +53,302 @@ def test_paginator(execute):
 
     with pytest.raises(EmptyPage):
         paginator.page(50)
+
+
+@mock.patch("redis_search_django.query.RediSearchQuery.aexecute")
+def test_async_paginator(aexecute):
+    query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
+    result = RediSearchResult([mock.MagicMock()], 100, Category)
+    aexecute.return_value = result
+
+    paginator = AsyncRediSearchPaginator(query, 5)
+    page = asyncio.run(paginator.apage(2))
+
+    assert page.object_list is result
+    assert query.offset == 5
+    assert query.limit == 5
+    aexecute.assert_awaited_once_with(exhaust_results=False)
+    assert paginator.count == 100
+    assert asyncio.run(paginator.anum_pages()) == 20
+
+    with pytest.raises(EmptyPage):
+        asyncio.run(paginator.apage(50))
+
+
+@mock.patch("redis_search_django.query.RediSearchQuery.acount")
+def test_async_paginator_acount(acount):
+    acount.return_value = 12
+    query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
+
+    paginator = AsyncRediSearchPaginator(query, 5)
+
+    assert asyncio.run(paginator.acount()) == 12
+    assert asyncio.run(paginator.anum_pages()) == 3
+    acount.assert_awaited_once()
+
+
+@pytest.fixture
+def keyset_document(document_class):
+    ProductDocument = document_class(HashDocument, Product, ["name", "price"])
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        yield ProductDocument, db
+
+
+def get_keyset_reply(hit_count, *hits):
+    reply = [hit_count]
+
+    for pk, price in hits:
+        reply += [f"key:{pk}", ["pk", str(pk), "name", f"P{pk}", "price", str(price)]]
+
+    return reply
+
+
+def test_keyset_paginator(keyset_document):
+    ProductDocument, db = keyset_document
+    paginator = KeysetPaginator(ProductDocument.find(), 3, "price")
+
+    db().execute_command.return_value = get_keyset_reply(5, (1, 10), (2, 20), (3, 20))
+    first_page = paginator.page()
+
+    assert [document.pk for document in first_page] == ["1", "2", "3"]
+    assert first_page.has_next()
+    assert not first_page.has_previous()
+    args = db().execute_command.call_args.args
+    assert args[2] == "*"
+    assert args[3:9] == ("LIMIT", 0, 3, "SORTBY", "price", "asc")
+
+    db().execute_command.return_value = get_keyset_reply(2, (4, 20), (5, 30))
+    second_page = paginator.page(first_page.next_cursor)
+
+    assert [document.pk for document in second_page] == ["4", "5"]
+    assert not second_page.has_next()
+    assert second_page.has_previous()
+    args = db().execute_command.call_args.args
+    assert args[2] == "(@price:[20 +inf]) -((@pk:{2|3}))"
+    assert args[3:6] == ("LIMIT", 0, 3)
+    assert "PARAMS" not in args
+
+
+def test_keyset_paginator_descending(keyset_document):
+    ProductDocument, db = keyset_document
+    paginator = KeysetPaginator(ProductDocument.find(), 2, "-price")
+    cursor = paginator.encode_cursor(30, ["7"])
+
+    db().execute_command.return_value = get_keyset_reply(3, (8, 30), (9, 20))
+    page = paginator.page(cursor)
+
+    assert paginator.decode_cursor(page.next_cursor) == ("20", ["9"])
+    args = db().execute_command.call_args.args
+    assert args[2] == "(@price:[-inf 30]) -((@pk:{7}))"
+    assert args[6:9] == ("SORTBY", "price", "desc")
+
+
+def test_keyset_paginator_ties_across_pages(keyset_document):
+    ProductDocument, db = keyset_document
+    paginator = KeysetPaginator(ProductDocument.find(), 2, "price")
+    cursor = paginator.encode_cursor(20, ["1", "2"])
+
+    db().execute_command.return_value = get_keyset_reply(3, (3, 20), (4, 20))
+    page = paginator.page(cursor)
+
+    assert paginator.decode_cursor(page.next_cursor) == ("20", ["1", "2", "3", "4"])
+
+
+def test_keyset_paginator_max_ties(keyset_document, settings):
+    settings.REDIS_SEARCH_PAGINATOR_KEYSET_MAX_TIES = 3
+    ProductDocument, db = keyset_document
+    paginator = KeysetPaginator(ProductDocument.find(), 2, "price")
+    cursor = paginator.encode_cursor(20, ["1", "2"])
+
+    db().execute_command.return_value = get_keyset_reply(3, (3, 20), (4, 20))
+
+    with pytest.raises(InvalidCursor, match="More than 3 results"):
+        paginator.page(cursor)
+
+    # Cursors with more ties are not accepted either
+    with pytest.raises(InvalidCursor):
+        paginator.page(paginator.encode_cursor(20, ["1", "2", "3", "4"]))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "abc",
+        "!!!",
+        base64.urlsafe_b64encode(b'{"v": "abc", "pks": []}').decode(),
+        base64.urlsafe_b64encode(b'{"v": "NaN", "pks": []}').decode(),
+        base64.urlsafe_b64encode(b'{"v": "1", "pks": "1"}').decode(),
+        base64.urlsafe_b64encode(b'["1"]').decode(),
+    ],
+)
+def test_keyset_paginator_invalid_cursor(keyset_document, cursor):
+    ProductDocument, db = keyset_document
+    paginator = KeysetPaginator(ProductDocument.find(), 2, "price")
+    db().execute_command.reset_mock()
+
+    with pytest.raises(InvalidCursor):
+        paginator.page(cursor)
+
+    db().execute_command.assert_not_called()
+
+
+@pytest.mark.parametrize("sort_field", ["name", "-name"])
+def test_keyset_paginator_not_numeric_sort_field(keyset_document, sort_field):
+    ProductDocument, _ = keyset_document
+
+    with pytest.raises(ImproperlyConfigured, match="is not a numeric field"):
+        KeysetPaginator(ProductDocument.find(), 2, sort_field)
+
+
+def test_keyset_paginator_last_result_without_value(keyset_document):
+    ProductDocument, _ = keyset_document
+    paginator = KeysetPaginator(ProductDocument.find(), 2, "price")
+    documents = [mock.Mock(pk="1", price=10), mock.Mock(pk="2", price=None)]
+
+    # Results without a value are sorted last, there are no pages after them
+    assert paginator.get_next_cursor(RediSearchResult(documents, 2, None)) is None
+
+    with pytest.raises(InvalidCursor, match="has no 'price' value"):
+        paginator.get_next_cursor(RediSearchResult(documents, 5, None))
+
+
+def test_async_keyset_paginator(keyset_document):
+    ProductDocument, _ = keyset_document
+    paginator = AsyncKeysetPaginator(ProductDocument.find(), 2, "price")
+    result = RediSearchResult([ProductDocument(pk="1", name="P1", price=10)], 1, None)
+
+    with mock.patch.object(
+        RediSearchQuery, "aexecute", mock.AsyncMock(return_value=result)
+    ) as aexecute:
+        page = asyncio.run(paginator.apage())
+
+    assert page.object_list is result
+    assert not page.has_next()
+    aexecute.assert_awaited_once_with(exhaust_results=False)
+
+
+@pytest.fixture
+def cached_paginator_query():
+    caches["default"].clear()
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    model.side_effect = lambda pk: pk
+    query = RediSearchQuery([], model=model)
+    model.db().execute_command.reset_mock()
+    yield query, model.db()
+    caches["default"].clear()
+
+
+def get_page_reply(hit_count, *pks):
+    reply = [hit_count]
+
+    for pk in pks:
+        reply += [f"key:{pk}", ["pk", str(pk)]]
+
+    return reply
+
+
+def test_cached_paginator_prefetches_next_page(cached_paginator_query):
+    query, db = cached_paginator_query
+    db.pipeline().execute.return_value = [
+        get_page_reply(5, 1, 2),
+        get_page_reply(5, 3, 4),
+    ]
+
+    paginator = CachedRediSearchPaginator(query, 2, session_key="session")
+    page = paginator.page(1)
+
+    assert list(page) == ["1", "2"]
+    assert paginator.count == 5
+    commands = [call.args for call in db.pipeline().execute_command.call_args_list]
+    assert [args[3:6] for args in commands] == [("LIMIT", 0, 2), ("LIMIT", 2, 2)]
+
+    # The next page and the count are served from the cache
+    db.reset_mock()
+    paginator = CachedRediSearchPaginator(query.copy(), 2, session_key="session")
+    page = paginator.page(2)
+
+    assert list(page) == ["3", "4"]
+    assert paginator.num_pages == 3
+    db.pipeline().execute.assert_not_called()
+    db.execute_command.assert_not_called()
+
+
+def test_cached_paginator_last_page_not_prefetched(cached_paginator_query):
+    query, db = cached_paginator_query
+    caches["default"].set(
+        CachedRediSearchPaginator(query, 2).get_count_key(), 4, timeout=None
+    )
+    db.pipeline().execute.return_value = [get_page_reply(4, 3, 4)]
+
+    paginator = CachedRediSearchPaginator(query, 2)
+    page = paginator.page(2)
+
+    assert list(page) == ["3", "4"]
+    assert not page.has_next()
+    db.pipeline().execute_command.assert_called_once()
+
+
+def test_cached_paginator_prefetch_max_size(cached_paginator_query, settings):
+    settings.REDIS_SEARCH_PAGINATOR_PREFETCH_MAX_SIZE = 1
+    query, db = cached_paginator_query
+    db.pipeline().execute.return_value = [get_page_reply(5, 1, 2)]
+
+    CachedRediSearchPaginator(query, 2).page(1)
+
+    db.pipeline().execute_command.assert_called_once()
+
+
+def test_cached_paginator_uses_prefetched_result(cached_paginator_query):
+    query, db = cached_paginator_query
+    query.paginate(offset=0, limit=2)
+    query.add_prefetched_result(query.get_search_args(), get_page_reply(2, 1, 2))
+
+    page = CachedRediSearchPaginator(query, 2).page(1)
+
+    assert list(page) == ["1", "2"]
+    db.pipeline().execute.assert_not_called()
+
+
+def test_cached_paginator_should_prefetch_uses_count(cached_paginator_query):
+    query, db = cached_paginator_query
+    paginator = CachedRediSearchPaginator(query, 2)
+    paginator.__dict__["count"] = 4
+
+    with mock.patch.object(caches["default"], "get") as get:
+        assert paginator.should_prefetch(1)
+        assert not paginator.should_prefetch(2)
+
+    get.assert_not_called()
+
+
+def test_cached_paginator_invalidated_by_generation(cached_paginator_query, settings):
+    settings.REDIS_SEARCH_RESULT_CACHE = "local"
+    get_result_cache().clear()
+    query, db = cached_paginator_query
+    db.pipeline().execute.return_value = [
+        get_page_reply(5, 1, 2),
+        get_page_reply(5, 3, 4),
+    ]
+    CachedRediSearchPaginator(query, 2).page(1)
+
+    bump_generation("index")
+    db.reset_mock()
+    db.pipeline().execute.return_value = [get_page_reply(5, 3, 4)]
+    paginator = CachedRediSearchPaginator(query.copy(), 2)
+    page = paginator.page(2)
+
+    assert list(page) == ["3", "4"]
+    db.pipeline().execute.assert_called_once()
+    assert "index" in paginator.get_count_key()
+
+
+def test_cached_paginator_count_per_session(cached_paginator_query):
+    query, db = cached_paginator_query
+    db.execute_command.return_value = [7]
+
+    assert CachedRediSearchPaginator(query, 2, session_key="a").count == 7
+    assert CachedRediSearchPaginator(query, 2, session_key="a").count == 7
+    assert CachedRediSearchPaginator(query, 2, session_key="b").count == 7
+    assert db.execute_command.call_count == 2
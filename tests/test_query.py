@@ -1,11 +1,34 @@
+import asyncio
 from unittest import mock
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest_django.asserts import assertQuerysetEqual
+from redis import ResponseError
+from redis_om import HashModel, JsonModel
+from redis_om.model.model import QueryNotSupportedError
 
-from redis_search_django.query import RediSearchQuery, RediSearchResult
+from redis_search_django.documents import HashDocument, JsonDocument
+from redis_search_django.query import (
+    HydratedResult,
+    QueryTimeoutError,
+    RediSearchQuery,
+    RediSearchResult,
+)
+from redis_search_django.signals import query_timed_out
 
-from .models import Category
+from .models import Category, Product
+
+
+def get_raw_result(hit_count, pks):
+    """Builds a `FT.SEARCH` reply with the hits of the primary keys"""
+    raw_result = [hit_count]
+
+    for pk in pks:
+        raw_result += [f"key:{pk}", ["pk", str(pk)]]
+
+    return raw_result
 
 
 def test_search_result_str():
@@ -86,6 +109,35 @@ def test_search_result_add():
     assert len(result) == 3
 
 
+def test_search_result_add_raw():
+    parser = mock.Mock(side_effect=lambda fields: fields[1])
+    result = RediSearchResult([], 3, None)
+
+    assert result.add_raw(get_raw_result(3, [1, 2]) + ["key:3", None], parser) == 2
+    assert len(result) == 2
+    assert result
+    assert result.exists()
+    assert result.count() == 3
+    parser.assert_not_called()
+
+    assert result[1] == "2"
+    parser.assert_called_once_with(["pk", "2"])
+    assert result[1] == "2"
+    assert parser.call_count == 1
+
+    assert result[:] == ["1", "2"]
+    assert list(result) == ["1", "2"]
+    assert result.results == ["1", "2"]
+    assert parser.call_count == 2
+
+
+def test_search_result_slots():
+    result = RediSearchResult([], 0, None)
+
+    with pytest.raises(AttributeError):
+        result.extra = True
+
+
 def test_search_result_count():
     result = RediSearchResult([], 10, None)
 
@@ -121,6 +173,75 @@ def test_search_result_to_queryset(category_obj):
 
 
 @pytest.mark.django_db
+@pytest.mark.django_db
+def test_search_result_hydrate():
+    categories = [Category.objects.create(name=f"Test {i}") for i in range(3)]
+    results = [
+        mock.MagicMock(pk=str(categories[2].pk)),
+        mock.MagicMock(pk="0"),
+        mock.MagicMock(pk=str(categories[0].pk)),
+    ]
+    result = RediSearchResult(results, 3, Category)
+
+    hydrated = result.hydrate()
+
+    assert isinstance(hydrated, HydratedResult)
+    assert list(hydrated) == [categories[2], categories[0]]
+    assert len(hydrated) == 2
+    assert hydrated[0] == categories[2]
+    assert bool(hydrated)
+    assert repr(hydrated).startswith("<HydratedResult")
+
+
+@pytest.mark.django_db
+def test_hydrated_result_related(product_with_tag):
+    product, tag = product_with_tag
+    hydrated = HydratedResult(Product.objects.all(), [product.pk])
+
+    with CaptureQueriesContext(connection) as queries:
+        products = list(
+            hydrated.select_related("vendor", "category").prefetch_related("tags")
+        )
+        assert products[0].vendor.name == product.vendor.name
+        assert list(products[0].tags.all()) == [tag]
+
+    assert len(queries) == 2
+
+
+@pytest.mark.django_db
+def test_hydrated_result_without_pks():
+    with CaptureQueriesContext(connection) as queries:
+        assert not HydratedResult(Category.objects.all(), [])
+
+    assert len(queries) == 0
+
+
+def test_search_result_as_model_instances():
+    item = mock.MagicMock()
+    result = RediSearchResult([item], 1, Category)
+
+    assert result.as_model_instances() == [item.to_model_instance()]
+
+
+@mock.patch("redis_search_django.query.RediSearchQuery.execute")
+def test_search_query_as_model_instances(execute):
+    item = mock.MagicMock()
+    query = RediSearchQuery([], model=mock.MagicMock())
+
+    assert query.as_model_instances() == execute().as_model_instances()
+
+    query._model_cache = RediSearchResult([item], 1, Category)
+
+    assert query.as_model_instances() == [item.to_model_instance()]
+
+
+def test_search_result_hydrate_no_model_set():
+    result = RediSearchResult([], 10, None)
+
+    with pytest.raises(ValueError):
+        result.hydrate()
+
+
 def test_search_result_to_queryset_no_model_set():
     with pytest.raises(ValueError):
         RediSearchResult([], 10, None).to_queryset()
@@ -137,13 +258,76 @@ def test_search_query_to_queryset(category_obj):
 
 
 @mock.patch("redis_search_django.query.RediSearchQuery.execute")
+@mock.patch("redis_search_django.query.RediSearchQuery.fetch_pks")
 @pytest.mark.django_db
-def test_search_query_to_queryset_without_result(execute, category_obj):
+def test_search_query_to_queryset_without_result(fetch_pks, execute, category_obj):
+    fetch_pks.return_value = [str(category_obj.pk)]
+    query = RediSearchQuery(
+        mock.MagicMock(), model=mock.MagicMock(), django_model=Category
+    )
+
+    assertQuerysetEqual(query.to_queryset(), Category.objects.all())
+    execute.assert_not_called()
+
+
+def test_search_query_to_queryset_without_model():
     query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
 
-    query.to_queryset()
+    with pytest.raises(ValueError):
+        query.to_queryset()
 
-    execute().to_queryset.assert_called_once()
+
+@mock.patch("redis_search_django.query.RediSearchQuery.fetch_pks")
+@pytest.mark.django_db
+def test_search_query_hydrate(fetch_pks, category_obj):
+    fetch_pks.return_value = [str(category_obj.pk)]
+    query = RediSearchQuery([], model=mock.MagicMock(), django_model=Category)
+
+    assert list(query.hydrate()) == [category_obj]
+
+    query._model_cache = RediSearchResult(
+        [mock.MagicMock(pk=str(category_obj.pk))], 1, Category
+    )
+
+    assert list(query.hydrate()) == [category_obj]
+    fetch_pks.assert_called_once()
+
+    with pytest.raises(ValueError):
+        RediSearchQuery([], model=mock.MagicMock()).hydrate()
+
+
+def test_search_query_pks():
+    query = RediSearchQuery([], model=mock.MagicMock(), django_model=Category)
+    query._model_cache = RediSearchResult(
+        [mock.MagicMock(pk="1"), mock.MagicMock(pk="2")], 2, Category
+    )
+
+    assert query.pks() == [1, 2]
+
+
+def test_search_query_fetch_pks(nested_document_class, settings):
+    settings.REDIS_SEARCH_EXHAUST_PAGE_SIZE = 2
+    ProductDocument = nested_document_class[0]
+    prefix = ProductDocument.make_primary_key("")
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery(
+            [], model=ProductDocument, django_model=Category, limit=1, page_size=1
+        )
+        db().execute_command.return_value = [4, f"{prefix}1".encode()]
+        db().pipeline().execute.return_value = [
+            [4, f"{prefix}2", f"{prefix}3"],
+            [4, f"{prefix}4"],
+        ]
+
+        assert query.pks() == [1, 2, 3, 4]
+
+    db().execute_command.assert_called_with(
+        "ft.search", ProductDocument.Meta.index_name, "*", "LIMIT", 0, 1, "NOCONTENT"
+    )
+    db().pipeline().execute_command.assert_called_with(
+        "ft.search", ProductDocument.Meta.index_name, "*", "LIMIT", 3, 2, "NOCONTENT"
+    )
 
 
 @pytest.mark.django_db
@@ -158,6 +342,7 @@ def test_search_query_all():
 def test_search_query_count():
     query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
     query._model_cache = RediSearchResult([], 10, None)
+    query._executed = True
 
     assert query.count() == 10
 
@@ -165,7 +350,53 @@ def test_search_query_count():
 def test_search_query_exists():
     query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
     query._model_cache = RediSearchResult([mock.MagicMock()], 10, None)
+    query._executed = True
+    assert query.exists()
+
+
+def test_search_query_count_after_execute_without_hits():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    model.db().execute_command.return_value = [0]
+
+    query.execute()
+    model.db().execute_command.reset_mock()
+
+    assert query.count() == 0
+    assert not query.exists()
+    assert asyncio.run(query.acount()) == 0
+    assert not asyncio.run(query.aexists())
+    model.db().execute_command.assert_not_called()
+    # Copies are not executed
+    assert query.copy().count() == 0
+    model.db().execute_command.assert_called_once()
+
+
+def test_search_query_count_without_cache():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    model.db().execute_command.return_value = [25]
+
+    assert query.count() == 25
+    model.db().execute_command.assert_called_with(
+        "ft.search", model.Meta.index_name, query.query, "LIMIT", 0, 0, "NOCONTENT"
+    )
+    model.from_redis.assert_not_called()
+
+
+def test_search_query_exists_without_cache():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    model.db().execute_command.return_value = [25, "key"]
+
     assert query.exists()
+    model.db().execute_command.assert_called_with(
+        "ft.search", model.Meta.index_name, query.query, "LIMIT", 0, 1, "NOCONTENT"
+    )
+
+    model.db().execute_command.return_value = [0]
+
+    assert not query.exists()
 
 
 def test_search_query_copy():
@@ -174,6 +405,63 @@ def test_search_query_copy():
     assert query is not new_query
 
 
+def test_search_query_copy_reuses_compiled_query(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery(
+            [ProductDocument.price > 10], model=ProductDocument, django_model=Category
+        )
+        query.query
+        query._model_cache.add([mock.MagicMock()])
+        db().execute_command.reset_mock()
+
+        with mock.patch("redis_search_django.query.compile_query") as compile_query:
+            new_query = query.copy(offset=10, limit=5)
+
+    compile_query.assert_not_called()
+    db().execute_command.assert_not_called()
+    assert new_query.query == query.query
+    assert new_query.query_params == query.query_params
+    assert new_query.django_model is Category
+    assert not new_query._model_cache
+    assert new_query._model_cache is not query._model_cache
+    assert new_query.get_search_args()[3:6] == ["LIMIT", 10, 5]
+    assert query.get_search_args()[3:6] == ["LIMIT", 0, 1000]
+
+
+def test_search_query_copy_with_sort_fields(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db"):
+        query = RediSearchQuery([], model=ProductDocument)
+        new_query = query.sort_by("-price")
+
+        assert new_query.sort_fields == ["-price"]
+        assert query.sort_fields == []
+
+        with pytest.raises(QueryNotSupportedError):
+            query.sort_by("unknown")
+
+
+def test_search_query_copy_with_expressions(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db"):
+        query = RediSearchQuery([ProductDocument.price > 10], model=ProductDocument)
+        new_query = query.copy(expressions=[ProductDocument.price < 10])
+
+    assert query.query == "@price:[(10 +inf]"
+    assert new_query.query == "@price:[-inf (10]"
+
+
+def test_search_query_copy_with_unknown_argument():
+    query = RediSearchQuery([], model=mock.MagicMock())
+
+    with pytest.raises(TypeError):
+        query.copy(unknown=True)
+
+
 def test_search_query_paginate():
     query = RediSearchQuery(mock.MagicMock(), model=mock.MagicMock())
     offset = 10
@@ -185,8 +473,7 @@ def test_search_query_paginate():
 
 def test_search_query_execute():
     model = mock.MagicMock()
-    model.db().execute_command.return_value = [1, [mock.MagicMock()]]
-    model.from_redis.return_value = [mock.MagicMock()]
+    model.db().execute_command.return_value = get_raw_result(1, [1])
     query = RediSearchQuery([], model=model)
 
     result = query.execute()
@@ -198,21 +485,257 @@ def test_search_query_execute():
 
 def test_search_query_execute_with_exhaust_results():
     model = mock.MagicMock()
-    model.db().execute_command.return_value = [2, [mock.MagicMock()]]
-    model.from_redis.side_effect = [[mock.MagicMock()], [mock.MagicMock()], []]
-    query = RediSearchQuery([], model=model)
+    model.db().execute_command.return_value = get_raw_result(2, [1])
+    model.db().pipeline().execute.return_value = [get_raw_result(2, [2])]
+    query = RediSearchQuery([], model=model, limit=1, page_size=1)
 
     result = query.execute(exhaust_results=True)
 
     assert isinstance(result, RediSearchResult)
     assert len(result) == 2
     assert result.hit_count == 2
+    model.db().pipeline().execute_command.assert_called_once_with(
+        "ft.search", model.Meta.index_name, query.query, "LIMIT", 1, 1
+    )
+
+
+def test_search_query_execute_with_exhaust_results_pipelined(settings):
+    settings.REDIS_SEARCH_EXHAUST_PAGE_SIZE = 1000
+    model = mock.MagicMock()
+    model.db().execute_command.return_value = get_raw_result(2510, range(10))
+    model.db().pipeline().execute.return_value = [
+        get_raw_result(2510, range(10, 1010)),
+        get_raw_result(2510, range(1010, 2010)),
+        get_raw_result(2510, range(2010, 2510)),
+    ]
+    query = RediSearchQuery([], model=model, limit=10, page_size=10)
+
+    result = query.execute(exhaust_results=True)
+
+    assert len(result) == 2510
+    assert result.hit_count == 2510
+    model.db().execute_command.assert_called_with(
+        "ft.search", model.Meta.index_name, query.query, "LIMIT", 0, 10
+    )
+    model.db().pipeline().execute.assert_called_once()
+    assert [
+        call.args[-2:] for call in model.db().pipeline().execute_command.call_args_list
+    ] == [(10, 1000), (1010, 1000), (2010, 1000)]
+
+
+def test_search_query_get_exhaust_page_size(settings):
+    settings.REDIS_SEARCH_EXHAUST_PAGE_SIZE = 500
+    query = RediSearchQuery([], model=mock.MagicMock(), page_size=20)
+
+    assert query.get_exhaust_page_size(5) == 20
+    assert query.get_exhaust_page_size(100) == 100
+    assert query.get_exhaust_page_size(5000) == 500
+
+
+def test_search_query_get_search_args():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model, offset=5, limit=15)
+
+    assert query.get_search_args() == [
+        "ft.search",
+        model.Meta.index_name,
+        query.query,
+        "LIMIT",
+        5,
+        15,
+    ]
+    assert query.get_search_args(offset=20)[-3:] == ["LIMIT", 20, 15]
+
+
+def test_search_query_iterator():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model, offset=0)
+    model.side_effect = lambda pk: pk
+    model.db().execute_command.side_effect = [
+        get_raw_result(5, [1, 2]),
+        get_raw_result(5, [3, 4]),
+        get_raw_result(5, [5]),
+    ]
+
+    iterator = query.iterator(chunk_size=2)
+
+    assert next(iterator) == "1"
+    assert model.db().execute_command.call_count == 2
+    assert list(iterator) == ["2", "3", "4", "5"]
+    assert [
+        call.args[-2:] for call in model.db().execute_command.call_args_list[1:]
+    ] == [
+        (0, 2),
+        (2, 2),
+        (4, 2),
+    ]
+    assert not query._model_cache
+
+
+def test_search_query_iterator_with_expired_hits():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model, offset=0)
+    model.side_effect = lambda pk: pk
+    model.db().execute_command.side_effect = [
+        [4, "key:1", None, "key:2", ["pk", "2"]],
+        get_raw_result(4, [3, 4]),
+    ]
+
+    assert list(query.iterator(chunk_size=2)) == ["2", "3", "4"]
+    assert [
+        call.args[-2:] for call in model.db().execute_command.call_args_list[1:]
+    ] == [(0, 2), (2, 2)]
+
+
+def test_search_query_execute_with_expired_hits():
+    model = mock.MagicMock()
+    model.side_effect = lambda pk: pk
+    query = RediSearchQuery([], model=model, limit=2, page_size=2)
+    model.db().execute_command.return_value = [3, "key:1", None, "key:2", ["pk", "2"]]
+    model.db().pipeline().execute.return_value = [get_raw_result(3, [3])]
+
+    result = query.execute(exhaust_results=True)
+
+    assert list(result) == ["2", "3"]
+    # The next page starts after the expired hit
+    model.db().pipeline().execute_command.assert_called_once_with(
+        "ft.search", model.Meta.index_name, query.query, "LIMIT", 2, 2
+    )
+
+
+def test_search_query_iterator_without_results():
+    model = mock.MagicMock()
+    model.db().execute_command.return_value = [0, mock.MagicMock()]
+    model.from_redis.return_value = []
+    query = RediSearchQuery([], model=model)
+
+    assert list(query.iterator()) == []
+
+
+def test_search_query_get_scan_load_args():
+    query = mock.MagicMock(model=JsonModel, only_fields=[])
+    assert RediSearchQuery.get_scan_load_args(query) == ["LOAD", 1, "$"]
+
+    query = mock.MagicMock(model=HashModel, only_fields=[])
+    assert RediSearchQuery.get_scan_load_args(query) == ["LOAD", "*"]
+
+
+@mock.patch.object(RediSearchQuery, "get_scan_load_args", return_value=["LOAD", "*"])
+def test_search_query_get_scan_args(get_scan_load_args):
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    query.sort_fields = ["-price", "name"]
+
+    assert query.get_scan_args(100) == [
+        "ft.aggregate",
+        model.Meta.index_name,
+        query.query,
+        "LOAD",
+        "*",
+        "SORTBY",
+        4,
+        "@price",
+        "DESC",
+        "@name",
+        "ASC",
+        "WITHCURSOR",
+        "COUNT",
+        100,
+    ]
+
+
+@mock.patch.object(RediSearchQuery, "get_scan_load_args", return_value=["LOAD", "*"])
+def test_search_query_scan(get_scan_load_args):
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    first_row = ["pk", "1", "name", "first"]
+    second_row = ["pk", "2", "name", "second"]
+    model.db().execute_command.side_effect = [
+        [[2, first_row], 10],
+        [[2, second_row], 0],
+    ]
+    model.side_effect = lambda **data: data
+
+    assert list(query.scan(count=1)) == [
+        {"pk": "1", "name": "first"},
+        {"pk": "2", "name": "second"},
+    ]
+    model.db().execute_command.assert_called_with(
+        "ft.cursor", "READ", model.Meta.index_name, 10, "COUNT", 1
+    )
+
+
+def test_search_query_scan_values(document_class):
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+
+    with mock.patch.object(CategoryDocument, "db") as db:
+        query = CategoryDocument.find().values("name")
+        db().execute_command.side_effect = [[[1, ["pk", "1", "name", "a"]], 0]]
+
+        assert list(query.scan()) == [{"name": "a"}]
+
+    assert db().execute_command.call_args.args[3:11] == (
+        "LOAD",
+        6,
+        "$.pk",
+        "AS",
+        "pk",
+        "$.name",
+        "AS",
+        "name",
+    )
+
+
+def test_search_query_scan_only_hash_document(document_class):
+    CategoryDocument = document_class(HashDocument, Category, ["name"])
+
+    with mock.patch.object(CategoryDocument, "db") as db:
+        query = CategoryDocument.find().only("name")
+        db().execute_command.side_effect = [[[1, ["pk", "1", "name", "a"]], 0]]
+
+        documents = list(query.scan())
+
+    assert documents[0].name == "a"
+    assert db().execute_command.call_args.args[3:7] == ("LOAD", 2, "@pk", "@name")
+
+
+@mock.patch.object(RediSearchQuery, "get_scan_load_args", return_value=["LOAD", "*"])
+def test_search_query_scan_closed_early(get_scan_load_args):
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    model.db().execute_command.side_effect = [
+        [[2, ["pk", "1"], ["pk", "2"]], 10],
+        "OK",
+    ]
+    model.side_effect = lambda pk: pk
+
+    scan = query.scan()
+    assert next(scan) == "1"
+    scan.close()
+
+    model.db().execute_command.assert_called_with(
+        "ft.cursor", "DEL", model.Meta.index_name, 10
+    )
+
+
+@mock.patch.object(RediSearchQuery, "get_scan_load_args", return_value=["LOAD", "*"])
+def test_search_query_scan_expired_cursor(get_scan_load_args):
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+    model.db().execute_command.side_effect = [
+        [[1, ["pk", "1"]], 10],
+        ResponseError("Cursor not found"),
+        ResponseError("Cursor not found"),
+    ]
+    model.side_effect = lambda pk: pk
+
+    with pytest.raises(ResponseError):
+        list(query.scan())
 
 
 def test_search_query_execute_without_offset():
     model = mock.MagicMock()
-    model.db().execute_command.return_value = [1, [mock.MagicMock()]]
-    model.from_redis.return_value = [mock.MagicMock()]
+    model.db().execute_command.return_value = get_raw_result(1, [1])
     query = RediSearchQuery([], model=model, offset=0)
     query._model_cache = RediSearchResult([mock.MagicMock()], 10, None)
 
@@ -225,8 +748,7 @@ def test_search_query_execute_without_offset():
 
 def test_search_query_execute_with_offset():
     model = mock.MagicMock()
-    model.db().execute_command.return_value = [1, [mock.MagicMock()]]
-    model.from_redis.return_value = [mock.MagicMock()]
+    model.db().execute_command.return_value = get_raw_result(1, [1])
     query = RediSearchQuery([], model=model, offset=10)
     query._model_cache = RediSearchResult([mock.MagicMock()], 10, None)
 
@@ -235,3 +757,603 @@ def test_search_query_execute_with_offset():
     assert isinstance(result, RediSearchResult)
     assert len(result) == 2
     assert result.hit_count == 1
+
+
+def test_search_query_only(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db"):
+        query = RediSearchQuery([], model=ProductDocument, django_model=Category)
+        new_query = query.only("name", "category")
+
+    assert new_query is not query
+    assert new_query.only_fields == ["pk", "name", "category"]
+    assert new_query.django_model is Category
+    assert (
+        new_query.get_search_args()[-10:]
+        == [
+            "RETURN",
+            9,
+            "$.pk",
+            "AS",
+            "pk",
+            "$.name",
+            "AS",
+            "name",
+            "$.category",
+            "AS",
+            "category",
+        ][-10:]
+    )
+
+    with pytest.raises(ValueError):
+        query.only("unknown")
+
+
+def test_search_query_defer(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db"):
+        query = RediSearchQuery([], model=ProductDocument)
+        new_query = query.defer("description", "tags")
+        only_query = query.only("name", "description").defer("description")
+
+    assert "description" not in new_query.only_fields
+    assert "tags" not in new_query.only_fields
+    assert "name" in new_query.only_fields
+    assert only_query.only_fields == ["pk", "name"]
+
+    with pytest.raises(ValueError):
+        query.defer("unknown")
+
+
+def test_search_query_get_return_args_for_hash():
+    query = mock.MagicMock(model=HashModel, only_fields=["pk", "name"])
+
+    assert RediSearchQuery.get_return_args(query) == ["RETURN", 2, "pk", "name"]
+
+
+def test_search_query_parse_hit():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model)
+
+    assert query.parse_hit([b"pk", b"1", b"name", b"Test"]) is model.return_value
+    model.assert_called_with(pk="1", name="Test")
+
+    query.parse_hit(["$", '{"pk": "1", "name": "Test"}'])
+    model.assert_called_with(pk="1", name="Test")
+
+
+def test_search_query_execute_parses_lazily():
+    model = mock.MagicMock(side_effect=lambda pk: pk)
+    model.db().execute_command.return_value = get_raw_result(3, [1, 2, 3])
+    query = RediSearchQuery([], model=model)
+
+    result = query.execute()
+
+    assert len(result) == 3
+    model.assert_not_called()
+    assert result[0] == "1"
+    model.assert_called_once_with(pk="1")
+
+
+def test_search_query_values(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery([], model=ProductDocument).values()
+        db().execute_command.return_value = [
+            1,
+            "product:1",
+            ["$", '{"pk": "1", "name": "Test", "price": 10.5}'],
+        ]
+        result = query.execute(exhaust_results=False)
+
+    assert query.get_search_args()[-1] == 1000
+    assert list(result) == [{"pk": "1", "name": "Test", "price": 10.5}]
+
+
+def test_search_query_values_with_fields(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery([], model=ProductDocument).values("name", "category")
+        db().execute_command.return_value = [
+            1,
+            b"product:1",
+            [
+                b"pk",
+                b"1",
+                b"name",
+                b"Test",
+                b"category",
+                b'{"pk": "2", "name": "Shoes"}',
+            ],
+        ]
+        result = query.execute(exhaust_results=False)
+
+    assert query.only_fields == ["pk", "name", "category"]
+    assert list(result) == [{"name": "Test", "category": {"pk": "2", "name": "Shoes"}}]
+
+    with pytest.raises(ValueError):
+        query.values("unknown")
+
+
+def test_search_query_values_list(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery([], model=ProductDocument)
+        db().execute_command.return_value = [
+            2,
+            "product:1",
+            ["pk", "1", "name", "First", "price", "10.5"],
+            "product:2",
+            ["pk", "2", "name", "Second", "price", "20"],
+        ]
+        values_list = query.values_list("name", "price").execute(exhaust_results=False)
+        flat = query.values_list("pk", flat=True).execute(exhaust_results=False)
+
+    assert list(values_list) == [("First", 10.5), ("Second", 20)]
+    assert list(flat) == ["1", "2"]
+
+    with pytest.raises(TypeError):
+        query.values_list("pk", "name", flat=True)
+
+
+@pytest.mark.parametrize(
+    "method", ["pks", "to_queryset", "hydrate", "as_model_instances"]
+)
+@pytest.mark.parametrize("executed", [False, True])
+def test_search_query_values_without_documents(nested_document_class, method, executed):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery([], model=ProductDocument).values_list("pk", flat=True)
+        db().execute_command.return_value = [1, "product:1", ["pk", "1"]]
+
+        if executed:
+            query.execute()
+
+        with pytest.raises(TypeError, match=rf"Cannot call {method}\(\) after"):
+            getattr(query, method)()
+
+
+@pytest.mark.parametrize("method", ["to_queryset", "hydrate", "as_model_instances"])
+@pytest.mark.parametrize("values_method", ["values", "values_list"])
+def test_search_result_values_without_documents(
+    nested_document_class, method, values_method
+):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = getattr(
+            RediSearchQuery([], model=ProductDocument, django_model=Category),
+            values_method,
+        )("pk")
+        db().execute_command.return_value = [1, "product:1", ["pk", "1"]]
+        result = query.execute()
+
+    with pytest.raises(TypeError, match=rf"Cannot call {method}\(\) after"):
+        getattr(result, method)()
+
+
+def test_search_query_values_list_hash_document(document_class):
+    ProductDocument = document_class(HashDocument, Product, ["name", "price"])
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery([], model=ProductDocument).values_list()
+        db().execute_command.return_value = [
+            1,
+            "product:1",
+            ["pk", "1", "name", "10", "price", "10.5"],
+        ]
+        result = query.execute(exhaust_results=False)
+
+    assert query.values_fields == ["pk", "name", "price"]
+    assert list(result) == [("1", "10", 10.5)]
+
+
+def test_search_query_execute_with_only(nested_document_class):
+    ProductDocument, (CategoryDocument, *_) = nested_document_class
+
+    with mock.patch.object(ProductDocument, "db") as db, mock.patch.object(
+        CategoryDocument, "db"
+    ):
+        query = RediSearchQuery([], model=ProductDocument).only(
+            "name", "price", "category"
+        )
+        db().execute_command.return_value = [
+            1,
+            b"product:1",
+            [
+                b"pk",
+                b"1",
+                b"name",
+                b"Test",
+                b"price",
+                b"10.5",
+                b"category",
+                b'{"pk": "2", "name": "Shoes"}',
+            ],
+        ]
+        result = query.execute(exhaust_results=False)
+        product = result[0]
+
+    assert isinstance(product, ProductDocument)
+    assert product.pk == "1"
+    assert product.name == "Test"
+    assert product.price == 10.5
+    assert isinstance(product.category, CategoryDocument)
+    assert product.category.name == "Shoes"
+    assert "description" not in product.__fields_set__
+    assert product.dict() == {
+        "pk": "1",
+        "name": "Test",
+        "price": 10.5,
+        "category": {"pk": "2", "name": "Shoes"},
+    }
+
+    # Deferred fields are not set, even if they have a default value
+    with pytest.raises(AttributeError):
+        product.description
+
+    with pytest.raises(AttributeError):
+        product.created_at
+
+    assert not hasattr(product, "tags")
+
+
+def test_search_query_with_query_params(nested_document_class, settings):
+    settings.REDIS_SEARCH_QUERY_PARAMS = True
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db") as db:
+        query = RediSearchQuery([ProductDocument.price > 10], model=ProductDocument)
+        db().execute_command.return_value = [0]
+
+        assert query.count() == 0
+
+    assert query.query == "@price:[($p0 +inf]"
+    assert query.query_params == {"p0": "10"}
+    assert query.get_search_args()[-6:] == ["PARAMS", 2, "p0", "10", "DIALECT", 2]
+    assert query.get_scan_args(10)[-9:-3] == ["PARAMS", 2, "p0", "10", "DIALECT", 2]
+    db().execute_command.assert_called_with(
+        "ft.search",
+        ProductDocument.Meta.index_name,
+        "@price:[($p0 +inf]",
+        "LIMIT",
+        0,
+        0,
+        "NOCONTENT",
+        "PARAMS",
+        2,
+        "p0",
+        "10",
+        "DIALECT",
+        2,
+    )
+
+
+def test_search_query_without_query_params(nested_document_class):
+    ProductDocument = nested_document_class[0]
+
+    with mock.patch.object(ProductDocument, "db"):
+        query = RediSearchQuery([ProductDocument.price > 10], model=ProductDocument)
+
+    assert query.query == "@price:[(10 +inf]"
+    assert query.query_params == {}
+    assert "PARAMS" not in query.get_search_args()
+
+
+def build_async_connection(*responses):
+    connection = mock.MagicMock()
+    connection.execute_command = mock.AsyncMock(side_effect=responses)
+    connection.pipeline().execute = mock.AsyncMock()
+    return connection
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_aexecute(get_async_redis_connection):
+    connection = build_async_connection(get_raw_result(3, [1, 2]))
+    connection.pipeline().execute.return_value = [get_raw_result(3, [3])]
+    get_async_redis_connection.return_value = connection
+    model = mock.MagicMock(side_effect=lambda pk: pk)
+    query = RediSearchQuery([], model=model, limit=2, page_size=2)
+
+    result = asyncio.run(query.aexecute())
+
+    assert list(result) == ["1", "2", "3"]
+    assert result.hit_count == 3
+    connection.execute_command.assert_awaited_once_with(*query.get_search_args())
+    connection.pipeline().execute_command.assert_called_once_with(
+        *query.get_search_args(offset=2, limit=2)
+    )
+    model.db().pipeline.assert_not_called()
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_aexecute_without_exhaust_results(get_async_redis_connection):
+    connection = build_async_connection(get_raw_result(3, [1, 2]))
+    get_async_redis_connection.return_value = connection
+    model = mock.MagicMock(side_effect=lambda pk: pk)
+    query = RediSearchQuery([], model=model, limit=2, page_size=2)
+
+    result = asyncio.run(query.aexecute(exhaust_results=False))
+
+    assert list(result) == ["1", "2"]
+    connection.pipeline().execute.assert_not_awaited()
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_acount_and_aexists(get_async_redis_connection):
+    connection = build_async_connection([25], [25, "key"])
+    get_async_redis_connection.return_value = connection
+    query = RediSearchQuery([], model=mock.MagicMock())
+
+    assert asyncio.run(query.acount()) == 25
+    assert asyncio.run(query.aexists())
+    connection.execute_command.assert_awaited_with(*query.get_hit_count_args(1))
+
+    query._model_cache = RediSearchResult([], 10, None)
+    query._executed = True
+
+    assert asyncio.run(query.acount()) == 10
+    assert not asyncio.run(query.aexists())
+
+
+def test_search_query_timeout_args():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model).timeout(100)
+
+    assert query.get_timeout() == 100
+    assert query.get_search_args()[-2:] == ["TIMEOUT", 100]
+    assert query.get_hit_count_args(0)[-2:] == ["TIMEOUT", 100]
+    assert query.copy().get_timeout() == 100
+
+
+def test_search_query_timeout_from_settings(settings):
+    model = mock.MagicMock()
+    model.__name__ = "ProductDocument"
+    query = RediSearchQuery([], model=model)
+
+    assert query.get_timeout() is None
+    assert "TIMEOUT" not in query.get_search_args()
+
+    settings.REDIS_SEARCH_QUERY_TIMEOUT = 500
+    assert query.get_timeout() == 500
+
+    settings.REDIS_SEARCH_QUERY_TIMEOUT = {"ProductDocument": 50, "default": 200}
+    assert query.get_timeout() == 50
+
+    model.__name__ = "CategoryDocument"
+    assert query.get_timeout() == 200
+    assert query.timeout(10).get_timeout() == 10
+
+
+def test_search_query_timeout_policy(settings):
+    query = RediSearchQuery([], model=mock.MagicMock())
+
+    assert query.get_timeout_policy() == "partial"
+    assert query.timeout(10, on_timeout="raise").get_timeout_policy() == "raise"
+
+    settings.REDIS_SEARCH_QUERY_TIMEOUT_POLICY = "tests.test_query.get_raw_result"
+    assert query.get_timeout_policy() is get_raw_result
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ResponseError("Timeout limit was reached"), None],
+)
+def test_search_query_execute_timed_out_partial(error):
+    model = mock.MagicMock(side_effect=lambda pk: pk)
+    query = RediSearchQuery([], model=model, limit=1, page_size=1).timeout(10)
+    handler = mock.Mock()
+    query_timed_out.connect(handler)
+
+    with mock.patch.object(
+        query, "fetch_results", side_effect=error, return_value=True
+    ), mock.patch("redis_search_django.query.time.monotonic", side_effect=[1, 3]):
+        result = query.execute()
+
+    query_timed_out.disconnect(handler)
+    assert result is query._model_cache
+    handler.assert_called_once_with(
+        signal=query_timed_out,
+        sender=model,
+        query=query,
+        timeout=10,
+        elapsed=2,
+        error=error,
+    )
+
+
+def test_search_query_execute_slow_first_page():
+    model = mock.MagicMock(side_effect=lambda pk: pk)
+    model.db().execute_command.return_value = get_raw_result(3, [1])
+    model.db().pipeline().execute.return_value = [
+        get_raw_result(3, [2]),
+        get_raw_result(3, [3]),
+    ]
+    query = RediSearchQuery([], model=model, limit=1, page_size=1).timeout(10, "raise")
+    handler = mock.Mock()
+    query_timed_out.connect(handler)
+
+    with mock.patch.object(query, "get_exhaust_page_size", return_value=1), mock.patch(
+        "redis_search_django.query.time.monotonic", side_effect=[0, 0, 1, 1, 1, 1]
+    ):
+        result = query.execute()
+
+    query_timed_out.disconnect(handler)
+    # The policy is not applied as RediSearch did not fail and
+    # the remaining pages are still fetched
+    assert list(result) == ["1", "2", "3"]
+    assert result.hit_count == 3
+    handler.assert_called_once_with(
+        signal=query_timed_out,
+        sender=model,
+        query=query,
+        timeout=10,
+        elapsed=1,
+        error=None,
+    )
+
+
+def test_search_query_execute_timed_out_raise():
+    query = RediSearchQuery([], model=mock.MagicMock()).timeout(10, "raise")
+
+    with mock.patch.object(
+        query,
+        "fetch_results",
+        side_effect=ResponseError("Timeout limit was reached"),
+    ), pytest.raises(QueryTimeoutError):
+        query.execute()
+
+
+def test_search_query_execute_timed_out_fallback():
+    fallback = mock.Mock()
+    query = RediSearchQuery([], model=mock.MagicMock()).timeout(10, fallback)
+
+    with mock.patch.object(
+        query,
+        "fetch_results",
+        side_effect=ResponseError("Timeout limit was reached"),
+    ):
+        assert query.execute() is fallback.return_value
+
+    fallback.assert_called_once_with(query)
+
+
+def test_search_query_count_timed_out_partial():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model).timeout(10)
+    error = ResponseError("Timeout limit was reached")
+    model.db().execute_command.side_effect = error
+    handler = mock.Mock()
+    query_timed_out.connect(handler)
+
+    with mock.patch("redis_search_django.query.time.monotonic", side_effect=[1, 3]):
+        assert query.count() == 0
+
+    query_timed_out.disconnect(handler)
+    handler.assert_called_once_with(
+        signal=query_timed_out,
+        sender=model,
+        query=query,
+        timeout=10,
+        elapsed=2,
+        error=error,
+    )
+
+
+def test_search_query_count_slow_reply():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model).timeout(10, "raise")
+    model.db().execute_command.return_value = [25]
+    handler = mock.Mock()
+    query_timed_out.connect(handler)
+
+    with mock.patch("redis_search_django.query.time.monotonic", side_effect=[0, 1, 1]):
+        assert query.count() == 25
+
+    query_timed_out.disconnect(handler)
+    assert model.db().execute_command.call_args.args[-2:] == ("TIMEOUT", 10)
+    handler.assert_called_once_with(
+        signal=query_timed_out,
+        sender=model,
+        query=query,
+        timeout=10,
+        elapsed=1,
+        error=None,
+    )
+
+
+def test_search_query_count_timed_out_raise():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model).timeout(10, "raise")
+    model.db().execute_command.side_effect = ResponseError("Timeout limit was reached")
+
+    with pytest.raises(QueryTimeoutError):
+        query.count()
+
+
+def test_search_query_exists_timed_out_fallback():
+    fallback = mock.Mock(return_value=["fallback"])
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model).timeout(10, fallback)
+    model.db().execute_command.side_effect = ResponseError("Timeout limit was reached")
+
+    assert query.exists()
+    fallback.assert_called_once_with(query)
+
+
+def test_search_query_count_error_is_not_timeout():
+    model = mock.MagicMock()
+    query = RediSearchQuery([], model=model).timeout(10)
+    model.db().execute_command.side_effect = ResponseError("Syntax error")
+
+    with pytest.raises(ResponseError):
+        query.count()
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_acount_timed_out_async_fallback(get_async_redis_connection):
+    async def fallback(query):
+        return RediSearchResult([], 5, None)
+
+    connection = get_async_redis_connection.return_value
+    connection.execute_command = mock.AsyncMock(
+        side_effect=ResponseError("Timeout limit was reached")
+    )
+    query = RediSearchQuery([], model=mock.MagicMock()).timeout(10, fallback)
+
+    assert asyncio.run(query.acount()) == 5
+    assert asyncio.run(query.aexists())
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_acount_slow_reply(get_async_redis_connection):
+    connection = get_async_redis_connection.return_value
+    connection.execute_command = mock.AsyncMock(return_value=[25])
+    query = RediSearchQuery([], model=mock.MagicMock()).timeout(10)
+
+    with mock.patch.object(query, "is_timed_out", return_value=True), mock.patch.object(
+        query, "report_timeout"
+    ) as report_timeout:
+        assert asyncio.run(query.acount()) == 25
+
+    report_timeout.assert_called_once()
+    assert report_timeout.call_args.args[1:] == ()
+
+
+def test_search_query_execute_error_is_not_timeout():
+    query = RediSearchQuery([], model=mock.MagicMock()).timeout(10)
+
+    with mock.patch.object(
+        query, "fetch_results", side_effect=ResponseError("Syntax error")
+    ), pytest.raises(ResponseError):
+        query.execute()
+
+
+def test_search_query_aexecute_timed_out_async_fallback():
+    async def fallback(query):
+        return "fallback"
+
+    query = RediSearchQuery([], model=mock.MagicMock()).timeout(10, fallback)
+
+    with mock.patch.object(
+        query,
+        "afetch_results",
+        side_effect=ResponseError("Timeout limit was reached"),
+    ):
+        assert asyncio.run(query.aexecute()) == "fallback"
+
+
+def test_search_query_paginate_after_search_args():
+    query = RediSearchQuery([], model=mock.MagicMock(), limit=10)
+    assert query.get_search_args()[3:6] == ["LIMIT", 0, 10]
+
+    query.copy().paginate(offset=20, limit=5)
+    query.paginate(offset=10, limit=5)
+
+    assert query.get_search_args()[3:6] == ["LIMIT", 10, 5]
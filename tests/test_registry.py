@@ -1,15 +1,18 @@
 import datetime
+import threading
 from collections import defaultdict
 from typing import List, Optional
 from unittest import mock
 
+import pytest
+
 from redis_search_django.documents import (
     EmbeddedJsonDocument,
     HashDocument,
     JsonDocument,
 )
-from redis_search_django.registry import DocumentRegistry
-from tests.models import Category, Product, Tag, Vendor
+from redis_search_django.registry import DocumentRegistry, get_m2m_field_names
+from tests.models import Category, Person, Product, Tag, Vendor
 
 
 def test_empty_registry():
@@ -248,6 +251,194 @@ def test_update_related_documents_with_global_auto_index_disabled(
     update_from_related_model_instance.assert_not_called()
 
 
+@mock.patch("redis_search_django.documents.JsonDocument.update_related_field")
+def test_update_m2m_documents(update_related_field, nested_document_class):
+    ProductJsonDocument = nested_document_class[0]
+    registry = DocumentRegistry()
+    registry.register(ProductJsonDocument)
+
+    product = Product(pk=1, name="test")
+    tag = Tag(pk=1, name="test")
+
+    registry.update_m2m_documents(product, Product.tags.through, Tag, {1})
+
+    update_related_field.assert_called_once_with([product], "tags")
+    update_related_field.reset_mock()
+
+    registry.update_m2m_documents(tag, Product.tags.through, Product, {1})
+
+    update_related_field.assert_called_once()
+    queryset, field_name = update_related_field.call_args[0]
+    assert queryset.model == Product
+    assert field_name == "tags"
+
+
+@mock.patch(
+    "redis_search_django.documents.JsonDocument.update_from_related_model_instance"
+)
+@mock.patch("redis_search_django.documents.JsonDocument.update_related_field")
+def test_update_m2m_documents_skips_related_documents_without_relation(
+    update_related_field, update_from_related_model_instance, nested_document_class
+):
+    ProductJsonDocument = nested_document_class[0]
+    registry = DocumentRegistry()
+    registry.register(ProductJsonDocument)
+
+    product = Product(pk=1, name="test")
+
+    registry.update_m2m_documents(product, Product.tags.through, Tag, None)
+
+    update_related_field.assert_called_once_with([product], "tags")
+    # Embedded Tag documents do not include the products
+    update_from_related_model_instance.assert_not_called()
+
+
+@mock.patch("redis_search_django.documents.JsonDocument.update_related_field")
+def test_update_m2m_documents_with_global_auto_index_disabled(
+    update_related_field, settings, nested_document_class
+):
+    settings.REDIS_SEARCH_AUTO_INDEX = False
+    ProductJsonDocument = nested_document_class[0]
+    registry = DocumentRegistry()
+    registry.register(ProductJsonDocument)
+
+    registry.update_m2m_documents(
+        Product(pk=1, name="test"), Product.tags.through, Tag, {1}
+    )
+
+    update_related_field.assert_not_called()
+
+
+def test_get_m2m_field_names():
+    assert get_m2m_field_names(Product, Product.tags.through) == (
+        "tags",
+        "product_set",
+    )
+    assert get_m2m_field_names(Tag, Product.tags.through) == ("product_set", "tags")
+
+    with pytest.raises(ValueError):
+        get_m2m_field_names(Category, Product.tags.through)
+
+
+def test_get_m2m_field_names_self_referential():
+    through = Person.following.through
+
+    assert get_m2m_field_names(Person, through, reverse=False) == (
+        "following",
+        "followers",
+    )
+    assert get_m2m_field_names(Person, through, reverse=True) == (
+        "followers",
+        "following",
+    )
+    assert get_m2m_field_names(Tag, Product.tags.through, reverse=True) == (
+        "product_set",
+        "tags",
+    )
+
+    with pytest.raises(ValueError):
+        get_m2m_field_names(Tag, Product.tags.through, reverse=False)
+
+
+@mock.patch("redis_search_django.documents.JsonDocument.index_pks")
+@mock.patch("redis_search_django.documents.JsonDocument.delete")
+@mock.patch("redis_search_django.documents.JsonDocument.update_from_model_instance")
+def test_deferred(update_from_model_instance, delete, index_pks, document_class):
+    CategoryJsonDocument = document_class(JsonDocument, Category, ["name"])
+    registry = DocumentRegistry()
+    registry.register(CategoryJsonDocument)
+
+    with registry.deferred(chunk_size=100):
+        assert registry.is_deferred
+
+        registry.update_document(Category(pk=1, name="test"))
+        registry.update_document(Category(pk=1, name="test"))
+        registry.update_document(Category(pk=2, name="test"))
+        registry.remove_document(Category(pk=3, name="test"))
+        # Tag is not registered, so it should not be recorded.
+        registry.update_document(Tag(pk=1, name="test"))
+
+        update_from_model_instance.assert_not_called()
+        delete.assert_not_called()
+        index_pks.assert_not_called()
+
+    assert not registry.is_deferred
+    index_pks.assert_called_once_with({1, 2, 3}, chunk_size=100)
+
+
+@mock.patch("redis_search_django.documents.JsonDocument.index_pks")
+def test_deferred_nested(index_pks, document_class):
+    CategoryJsonDocument = document_class(JsonDocument, Category, ["name"])
+    registry = DocumentRegistry()
+    registry.register(CategoryJsonDocument)
+
+    with registry.deferred():
+        with registry.deferred():
+            registry.update_document(Category(pk=1, name="test"))
+
+        index_pks.assert_not_called()
+        registry.update_document(Category(pk=2, name="test"))
+
+    index_pks.assert_called_once_with({1, 2}, chunk_size=2000)
+
+
+@mock.patch("redis_search_django.documents.JsonDocument.index_pks")
+@mock.patch("redis_search_django.documents.JsonDocument.update_from_model_instance")
+def test_deferred_is_thread_local(
+    update_from_model_instance, index_pks, document_class
+):
+    CategoryJsonDocument = document_class(JsonDocument, Category, ["name"])
+    registry = DocumentRegistry()
+    registry.register(CategoryJsonDocument)
+    model_obj = Category(pk=1, name="test")
+
+    with registry.deferred():
+        thread = threading.Thread(target=registry.update_document, args=(model_obj,))
+        thread.start()
+        thread.join()
+
+    update_from_model_instance.assert_called_once_with(model_obj, create=True)
+    index_pks.assert_not_called()
+
+
+@mock.patch("redis_search_django.documents.JsonDocument.index_pks")
+@mock.patch("redis_search_django.documents.JsonDocument.get_related_pks")
+@mock.patch(
+    "redis_search_django.documents.JsonDocument.update_from_related_model_instance"
+)
+def test_deferred_related_documents(
+    update_from_related_model_instance, get_related_pks, index_pks, document_class
+):
+    CategoryEmbeddedJsonDocument = document_class(
+        EmbeddedJsonDocument, Category, ["name"]
+    )
+
+    class ProductJsonDocument(JsonDocument):
+        category: Optional[CategoryEmbeddedJsonDocument]
+
+        class Django:
+            model = Product
+            fields = ["name"]
+            related_models = {
+                Category: {
+                    "related_name": "product_set",
+                    "many": True,
+                },
+            }
+
+    registry = DocumentRegistry()
+    registry.register(ProductJsonDocument)
+    get_related_pks.return_value = [1, 2]
+    model_obj = Category(pk=1, name="test")
+
+    with registry.deferred():
+        registry.update_related_documents(model_obj, exclude=model_obj)
+
+    get_related_pks.assert_called_once_with(model_obj)
+    update_from_related_model_instance.assert_not_called()
+    index_pks.assert_called_once_with({1, 2}, chunk_size=2000)
+
+
 @mock.patch("redis_search_django.documents.JsonDocument.delete")
 def test_remove_document(delete, document_class):
     CategoryJsonDocument = document_class(JsonDocument, Category, ["name"])
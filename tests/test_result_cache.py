@@ -0,0 +1,366 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from redis_search_django.documents import JsonDocument
+from redis_search_django.mixins import RediSearchMixin
+from redis_search_django.query import RediSearchQuery
+from redis_search_django.registry import DocumentRegistry
+from redis_search_django.result_cache import (
+    aget_cached_replies,
+    bump_generation,
+    get_cached_replies,
+    get_cached_reply,
+    get_local_cache,
+    get_result_cache,
+)
+from redis_search_django.signals import query_timed_out
+
+from .models import Category
+
+
+@pytest.fixture(autouse=True)
+def local_result_cache(settings):
+    settings.REDIS_SEARCH_RESULT_CACHE = "local"
+    cache = get_result_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_get_result_cache_disabled(settings):
+    settings.REDIS_SEARCH_RESULT_CACHE = None
+    assert get_result_cache() is None
+
+
+def test_get_result_cache_local(settings):
+    settings.REDIS_SEARCH_RESULT_CACHE_MAX_ENTRIES = 10
+    assert get_result_cache() is get_local_cache(10)
+
+
+def test_get_result_cache_alias(settings):
+    settings.REDIS_SEARCH_RESULT_CACHE = "default"
+
+    with mock.patch("redis_search_django.result_cache.caches") as caches:
+        assert get_result_cache() is caches.__getitem__.return_value
+
+    caches.__getitem__.assert_called_once_with("default")
+
+
+def test_get_cached_replies_disabled(settings):
+    settings.REDIS_SEARCH_RESULT_CACHE = None
+    fetch = mock.Mock(return_value=["reply"])
+
+    assert get_cached_replies("index", [["ft.search", "index", "*"]], fetch) == [
+        "reply"
+    ]
+    assert get_cached_replies("index", [["ft.search", "index", "*"]], fetch) == [
+        "reply"
+    ]
+    assert fetch.call_count == 2
+
+
+def test_get_cached_replies_fetches_missing_replies():
+    fetch = mock.Mock(side_effect=lambda commands: [c[-1] for c in commands])
+
+    assert get_cached_replies("index", [["ft.search", "a"]], fetch) == ["a"]
+    assert get_cached_replies(
+        "index", [["ft.search", "a"], ["ft.search", "b"]], fetch
+    ) == ["a", "b"]
+    assert fetch.call_args_list == [
+        mock.call([["ft.search", "a"]]),
+        mock.call([["ft.search", "b"]]),
+    ]
+
+
+def test_get_cached_replies_not_cacheable():
+    fetch = mock.Mock(side_effect=lambda commands: [c[-1] for c in commands])
+
+    def is_cacheable(reply):
+        return reply != "partial"
+
+    for _ in range(2):
+        assert get_cached_replies(
+            "index", [["ft.search", "a"], ["ft.search", "partial"]], fetch, is_cacheable
+        ) == ["a", "partial"]
+
+    assert fetch.call_args_list == [
+        mock.call([["ft.search", "a"], ["ft.search", "partial"]]),
+        mock.call([["ft.search", "partial"]]),
+    ]
+
+
+def test_aget_cached_replies_fetches_missing_replies():
+    fetch = mock.AsyncMock(side_effect=lambda commands: [c[-1] for c in commands])
+
+    async def get_replies():
+        return [
+            await aget_cached_replies("index", [["ft.search", "a"]], fetch),
+            await aget_cached_replies(
+                "index", [["ft.search", "a"], ["ft.search", "b"]], fetch
+            ),
+        ]
+
+    assert asyncio.run(get_replies()) == [["a"], ["a", "b"]]
+    assert fetch.await_args_list == [
+        mock.call([["ft.search", "a"]]),
+        mock.call([["ft.search", "b"]]),
+    ]
+
+
+def test_get_cached_replies_shared_with_aget_cached_replies():
+    fetch = mock.Mock(return_value=["reply"])
+    afetch = mock.AsyncMock(return_value=["other"])
+
+    assert get_cached_replies("index", [["ft.search", "a"]], fetch) == ["reply"]
+    assert asyncio.run(aget_cached_replies("index", [["ft.search", "a"]], afetch)) == [
+        "reply"
+    ]
+    afetch.assert_not_awaited()
+
+
+def test_bump_generation_invalidates_index_replies():
+    fetch = mock.Mock(return_value="reply")
+
+    get_cached_reply("index", ["ft.search", "index"], fetch)
+    get_cached_reply("other", ["ft.search", "other"], fetch)
+    bump_generation("index")
+    get_cached_reply("index", ["ft.search", "index"], fetch)
+    get_cached_reply("other", ["ft.search", "other"], fetch)
+
+    assert fetch.call_count == 3
+
+
+def test_bump_generation_without_counter(local_result_cache):
+    bump_generation("index")
+    assert local_result_cache.get("redis_search:generation:index") is not None
+
+
+def test_search_query_execute_cached():
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    model.side_effect = lambda pk: pk
+    model.db().execute_command.return_value = [1, "key", ["pk", "1"]]
+    query = RediSearchQuery([], model=model, limit=10)
+    model.db().execute_command.reset_mock()
+
+    assert list(query.execute()) == ["1"]
+    assert list(query.copy().execute()) == ["1"]
+    model.db().execute_command.assert_called_once()
+
+    bump_generation("index")
+
+    assert list(query.copy().execute()) == ["1"]
+    assert model.db().execute_command.call_count == 2
+
+
+def test_search_query_execute_timed_out_not_cached():
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    model.side_effect = lambda pk: pk
+    model.db().execute_command.return_value = [1, "key", ["pk", "1"]]
+    query = RediSearchQuery([], model=model, limit=10).timeout(10)
+    model.db().execute_command.reset_mock()
+    handler = mock.Mock()
+    query_timed_out.connect(handler)
+
+    # Each request takes 20ms
+    with mock.patch(
+        "redis_search_django.query.time.monotonic",
+        side_effect=[0, 0, 0.02, 0.02] * 2,
+    ):
+        assert list(query.execute()) == ["1"]
+        assert list(query.copy().execute()) == ["1"]
+
+    query_timed_out.disconnect(handler)
+    assert model.db().execute_command.call_count == 2
+    assert handler.call_count == 2
+
+
+def test_search_query_fetch_remaining_raw_cached():
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    model.db().pipeline().execute.return_value = [[2], [2]]
+    query = RediSearchQuery([], model=model, limit=10, page_size=1)
+
+    with mock.patch.object(query, "get_exhaust_page_size", return_value=1):
+        assert query.fetch_remaining_raw(0, 2) == [[2], [2]]
+        assert query.fetch_remaining_raw(0, 2) == [[2], [2]]
+
+    model.db().pipeline().execute.assert_called_once()
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_aexecute_cached(get_async_redis_connection):
+    connection = get_async_redis_connection.return_value
+    connection.execute_command = mock.AsyncMock(return_value=[1, "key", ["pk", "1"]])
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    model.side_effect = lambda pk: pk
+    query = RediSearchQuery([], model=model, limit=10)
+
+    assert list(asyncio.run(query.aexecute())) == ["1"]
+    assert list(asyncio.run(query.copy().aexecute())) == ["1"]
+    connection.execute_command.assert_awaited_once()
+
+    bump_generation("index")
+
+    assert list(asyncio.run(query.copy().aexecute())) == ["1"]
+    assert connection.execute_command.await_count == 2
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_aexecute_timed_out_not_cached(get_async_redis_connection):
+    connection = get_async_redis_connection.return_value
+    connection.execute_command = mock.AsyncMock(return_value=[1, "key", ["pk", "1"]])
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    model.side_effect = lambda pk: pk
+    query = RediSearchQuery([], model=model, limit=10).timeout(10)
+
+    with mock.patch.object(RediSearchQuery, "is_timed_out", return_value=True):
+        assert list(asyncio.run(query.aexecute())) == ["1"]
+        assert list(asyncio.run(query.copy().aexecute())) == ["1"]
+
+    assert connection.execute_command.await_count == 2
+
+
+@mock.patch("redis_search_django.query.get_async_redis_connection")
+def test_search_query_afetch_remaining_raw_cached(get_async_redis_connection):
+    pipeline = get_async_redis_connection().pipeline()
+    pipeline.execute = mock.AsyncMock(return_value=[[2], [2]])
+    model = mock.MagicMock()
+    model.Meta.index_name = "index"
+    query = RediSearchQuery([], model=model, limit=10, page_size=1)
+
+    with mock.patch.object(query, "get_exhaust_page_size", return_value=1):
+        assert asyncio.run(query.afetch_remaining_raw(0, 2)) == [[2], [2]]
+        assert asyncio.run(query.afetch_remaining_raw(0, 2)) == [[2], [2]]
+
+    pipeline.execute.assert_awaited_once()
+
+
+def test_aggregate_cached(document_class):
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+    request = CategoryDocument.build_aggregate_request(CategoryDocument.name == "test")
+
+    with mock.patch.object(CategoryDocument, "db") as db:
+        db().ft().aggregate().rows = [[b"count", b"1"]]
+        db().ft().aggregate.reset_mock()
+
+        assert CategoryDocument.aggregate(request) == [{"count": "1"}]
+        assert CategoryDocument.aggregate(request) == [{"count": "1"}]
+        db().ft().aggregate.assert_called_once()
+
+        other_request = CategoryDocument.build_aggregate_request(
+            CategoryDocument.name == "other"
+        )
+        CategoryDocument.aggregate(other_request)
+        assert db().ft().aggregate.call_count == 2
+
+
+def test_aggregate_with_cursor_not_cached(document_class):
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+    request = CategoryDocument.build_aggregate_request().cursor(count=10)
+
+    with mock.patch.object(CategoryDocument, "db") as db:
+        db().ft().aggregate().rows = []
+        db().ft().aggregate.reset_mock()
+
+        CategoryDocument.aggregate(request)
+        CategoryDocument.aggregate(request)
+
+    assert db().ft().aggregate.call_count == 2
+
+
+def test_aaggregate_cached(document_class):
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+    request = CategoryDocument.build_aggregate_request(CategoryDocument.name == "test")
+
+    with mock.patch.object(CategoryDocument, "adb") as adb:
+        adb().ft().aggregate = mock.AsyncMock()
+        adb().ft().aggregate.return_value.rows = [[b"count", b"1"]]
+
+        assert asyncio.run(CategoryDocument.aaggregate(request)) == [{"count": "1"}]
+        assert asyncio.run(CategoryDocument.aaggregate(request)) == [{"count": "1"}]
+
+    adb().ft().aggregate.assert_awaited_once()
+
+
+def build_facet_mixin(DocumentClass):
+    mixin = RediSearchMixin()
+    mixin.document_class = DocumentClass
+    mixin.facet_fields = ["name"]
+    return mixin
+
+
+def test_fetch_facets_cached(document_class):
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+    CategoryDocument.db = mock.MagicMock()
+    pipeline = CategoryDocument.db().pipeline()
+    pipeline.execute.return_value = [[1, ["name", "Shoes", "count", "1"]]]
+
+    build_facet_mixin(CategoryDocument).fetch_facets()
+    mixin = build_facet_mixin(CategoryDocument)
+    mixin.fetch_facets()
+
+    pipeline.execute.assert_called_once()
+    assert mixin.facets() == {"name": [{"name": "Shoes", "count": "1"}]}
+    # Facet replies are cached like the replies of `Document.aggregate()`
+    assert CategoryDocument.aggregate(mixin.get_facet_request("name")) == [
+        {"name": "Shoes", "count": "1"}
+    ]
+    CategoryDocument.db().ft().aggregate.assert_not_called()
+
+
+def test_afetch_facets_cached(document_class):
+    CategoryDocument = document_class(JsonDocument, Category, ["name"])
+    CategoryDocument.adb = mock.MagicMock()
+    pipeline = CategoryDocument.adb().pipeline()
+    pipeline.execute = mock.AsyncMock(
+        return_value=[[1, ["name", "Shoes", "count", "1"]]]
+    )
+
+    asyncio.run(build_facet_mixin(CategoryDocument).afetch_facets())
+    mixin = build_facet_mixin(CategoryDocument)
+    asyncio.run(mixin.afetch_facets())
+
+    pipeline.execute.assert_awaited_once()
+    assert mixin.facet_results == {"name": [{"name": "Shoes", "count": "1"}]}
+
+
+@mock.patch("redis_search_django.registry.bump_generation")
+def test_run_index_operation_bumps_generation(bump):
+    document_class = mock.MagicMock()
+    document_class._meta.index_name = "index"
+
+    DocumentRegistry().run_index_operation(document_class, mock.Mock(), [1])
+
+    bump.assert_called_once_with("index")
+
+
+@mock.patch("redis_search_django.registry.bump_generation")
+def test_run_index_operation_bumps_generation_on_error(bump):
+    document_class = mock.MagicMock()
+    document_class._meta.index_name = "index"
+
+    with pytest.raises(ValueError):
+        DocumentRegistry().run_index_operation(
+            document_class, mock.Mock(side_effect=ValueError), [1]
+        )
+
+    bump.assert_called_once_with("index")
+
+
+@mock.patch("redis_search_django.registry.bump_generation")
+def test_index_dirty_bumps_generation(bump):
+    registry = DocumentRegistry()
+    document_class = mock.MagicMock()
+    document_class._meta.index_name = "index"
+    registry.django_model_map[Category] = {document_class}
+
+    registry.index_dirty({Category: {1, 2}})
+
+    document_class.index_pks.assert_called_once_with({1, 2}, chunk_size=2000)
+    bump.assert_called_once_with("index")
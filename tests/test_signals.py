@@ -2,7 +2,7 @@ from unittest import mock
 
 import pytest
 
-from tests.models import Category
+from tests.models import Category, Person, Product, Tag
 
 
 @pytest.mark.django_db
@@ -41,15 +41,58 @@ def test_remove_related_documents_from_redis_index(document_registry):
 @mock.patch("redis_search_django.signals.document_registry")
 def test_update_redis_index_on_m2m_changed_add(document_registry, product_obj, tag_obj):
     product_obj.tags.add(tag_obj)
-    document_registry.update_document.assert_called_once_with(product_obj, create=True)
-    document_registry.update_related_documents.assert_called_once_with(
-        product_obj, exclude=None
+    document_registry.update_m2m_documents.assert_called_once_with(
+        product_obj, Product.tags.through, Tag, {tag_obj.pk}, False
     )
+    document_registry.update_document.assert_not_called()
+    document_registry.update_related_documents.assert_not_called()
 
 
 @pytest.mark.django_db
 @mock.patch("redis_search_django.signals.document_registry")
 def test_update_redis_index_on_m2m_changed_remove(document_registry, product_with_tag):
     product, tag = product_with_tag
+    product.tags.remove(tag)
+    document_registry.update_m2m_documents.assert_called_once_with(
+        product, Product.tags.through, Tag, {tag.pk}, False
+    )
+
+
+@pytest.mark.django_db
+@mock.patch("redis_search_django.signals.document_registry")
+def test_update_redis_index_on_m2m_changed_reverse_add(
+    document_registry, product_obj, tag_obj
+):
+    tag_obj.product_set.add(product_obj)
+    document_registry.update_m2m_documents.assert_called_once_with(
+        tag_obj, Product.tags.through, Product, {product_obj.pk}, True
+    )
+
+
+@pytest.mark.django_db
+@mock.patch("redis_search_django.signals.document_registry")
+def test_update_redis_index_on_m2m_changed_clear(document_registry, product_with_tag):
+    product, tag = product_with_tag
+    document_registry.get_m2m_related_pks.return_value = {tag.pk}
     product.tags.clear()
-    document_registry.update_related_documents.assert_called_with(product, exclude=None)
+
+    document_registry.get_m2m_related_pks.assert_called_once_with(
+        product, Product.tags.through, False
+    )
+    document_registry.update_m2m_documents.assert_called_once_with(
+        product, Product.tags.through, Tag, {tag.pk}, False
+    )
+    assert product._redis_search_m2m_cleared_pks == {}
+
+
+@pytest.mark.django_db
+@mock.patch("redis_search_django.signals.document_registry")
+def test_update_redis_index_on_m2m_changed_self_referential(document_registry):
+    person = Person.objects.create(name="a")
+    follower = Person.objects.create(name="b")
+
+    person.followers.add(follower)
+
+    document_registry.update_m2m_documents.assert_called_once_with(
+        person, Person.following.through, Person, {follower.pk}, True
+    )